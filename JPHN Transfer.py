@@ -9,16 +9,78 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                QHeaderView, QCheckBox, QTextEdit, QFileDialog,
                                QFrame, QSizePolicy, QProgressDialog, QTabWidget,
                                QGroupBox, QSpinBox, QAbstractItemView, QMenu,
-                               QTextBrowser, QScrollArea, QInputDialog, QGridLayout)
-from PySide6.QtCore import Qt, QDate, Signal, QStringListModel
-from PySide6.QtGui import QFont, QIcon, QColor, QShortcut, QAction, QTextDocument, QPixmap
+                               QTextBrowser, QScrollArea, QInputDialog, QGridLayout,
+                               QStyledItemDelegate, QToolTip)
+from PySide6.QtCore import (Qt, QDate, Signal, QStringListModel, QTimer, QRectF,
+                            QSortFilterProxyModel, QEvent, QObject, QRunnable, QThreadPool)
+from PySide6.QtGui import (QFont, QIcon, QColor, QBrush, QShortcut, QAction, QPixmap,
+                           QPainter, QPainterPath, QLinearGradient, QFontMetrics)
 from PySide6.QtWidgets import QCompleter
 from PySide6.QtGui import QKeySequence
-from PySide6.QtPrintSupport import QPrinter, QPrintDialog, QPrintPreviewDialog
 from PySide6.QtGui import QPageLayout, QPageSize
 import os
+import re
+import glob
+import io
+import itertools
+import hashlib
+import hmac
+import threading
+import time
+from bisect import insort
+from collections import defaultdict
+from copy import deepcopy
+from functools import lru_cache
 
 
+# Stylesheet shared by the startup dialogs (login, welcome, year and list
+# selection). Installed once on the QApplication in main(); each dialog only
+# carries its own small overrides.
+_COMMON_QSS = """
+    QDialog#startupDialog {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #e8f6f3, stop:0.5 #ebf5fb, stop:1 #e8f8f5);
+    }
+    QDialog#startupDialog QLineEdit {
+        border: 2px solid #85c1e9;
+        border-radius: 8px;
+        padding: 8px 15px;
+        background-color: white;
+    }
+    QDialog#startupDialog QLineEdit:focus {
+        border: 2px solid #27ae60;
+    }
+    QDialog#startupDialog QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #1a5276, stop:1 #27ae60);
+        color: white;
+        border: none;
+    }
+    QDialog#startupDialog QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #154360, stop:1 #1e8449);
+    }
+    QDialog#startupDialog QPushButton:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #0e2f44, stop:1 #196f3d);
+    }
+    QDialog#startupDialog QComboBox, QDialog#startupDialog QSpinBox {
+        border: 2px solid #85c1e9;
+        border-radius: 6px;
+        padding: 8px 12px;
+        background-color: white;
+    }
+    QDialog#startupDialog QComboBox:focus, QDialog#startupDialog QSpinBox:focus {
+        border: 2px solid #27ae60;
+    }
+    QDialog#startupDialog QComboBox::drop-down {
+        border: none;
+        padding-right: 10px;
+    }
+"""
+
+
+@lru_cache(maxsize=None)
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
     try:
@@ -29,6 +91,319 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+@lru_cache(maxsize=None)
+def _resource_exists(relative_path):
+    """Check once whether a bundled resource exists"""
+    return os.path.exists(resource_path(relative_path))
+
+
+# Login credentials: user id -> sha256(password + _LOGIN_SALT)
+_LOGIN_SALT = "jphn-transfer"
+_VALID_USERS = {
+    "revathy": "c7caa0867ad13d56a986040adf8a05ad0353837321b9b03d264fbb28ac8d5fb8",
+}
+
+
+def _hash_password(password):
+    """Salted sha256 hex digest used for login credentials"""
+    return hashlib.sha256((password + _LOGIN_SALT).encode("utf-8")).hexdigest()
+
+
+MONTHS = ["January", "February", "March", "April", "May", "June",
+          "July", "August", "September", "October", "November", "December"]
+# Month name -> month number (1-12), for O(1) month lookups
+_MONTH_TO_NUM = {month: num for num, month in enumerate(MONTHS, start=1)}
+
+_YEAR_DB_RE = re.compile(r'^jphn_general_(\d{4})\.db$')
+_AVAILABLE_YEARS_CACHE = {}
+
+@lru_cache(maxsize=None)
+def _a4_page_size():
+    """Shared A4 QPageSize, looked up in Qt's paper database once"""
+    return QPageSize(QPageSize.A4)
+
+
+def _setup_a4_printer(printer, landscape):
+    """Apply the shared A4 page size and orientation to a printer"""
+    printer.setPageSize(_a4_page_size())
+    if landscape:
+        printer.setPageOrientation(QPageLayout.Orientation.Landscape)
+    else:
+        printer.setPageOrientation(QPageLayout.Orientation.Portrait)
+
+
+@lru_cache(maxsize=1)
+def _primary_geom():
+    """Primary screen geometry, cached until the screen setup changes"""
+    return QApplication.primaryScreen().geometry()
+
+
+def _invalidate_primary_geom(*args):
+    """Drop the cached primary screen geometry"""
+    _primary_geom.cache_clear()
+
+
+def _watch_screen(screen):
+    """Invalidate the cached geometry when this screen is resized or rotated"""
+    screen.geometryChanged.connect(_invalidate_primary_geom)
+    _invalidate_primary_geom()
+
+
+_APP_ICON = None
+_HEALTH_LOGO_PIXMAPS = {}
+
+
+_EMOJI_PIXMAPS = {}
+
+
+def _emoji_pixmap(glyph, size):
+    """Return glyph rasterised once with the emoji font at the given point size"""
+    key = (glyph, size)
+    pixmap = _EMOJI_PIXMAPS.get(key)
+    if pixmap is None:
+        font = _font(size, family="Segoe UI Emoji")
+        metrics = QFontMetrics(font)
+        width = metrics.horizontalAdvance(glyph)
+        height = metrics.height()
+        ratio = QApplication.instance().devicePixelRatio()
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.drawText(QRectF(0, 0, width, height), Qt.AlignCenter, glyph)
+        painter.end()
+        _EMOJI_PIXMAPS[key] = pixmap
+    return pixmap
+
+
+def _header_label(title, subtitle, subtitle_color, subtitle_size, spacing):
+    """Single rich-text QLabel holding a dialog's title and subtitle lines"""
+    label = QLabel(
+        f"<div style='font-size:22pt; font-weight:bold; color:#1a5276;'>{title}</div>"
+        f"<div style='font-size:{subtitle_size}pt; color:{subtitle_color}; "
+        f"margin-top:{spacing}px;'>{subtitle}</div>")
+    label.setTextFormat(Qt.RichText)
+    label.setFont(_font(subtitle_size))
+    label.setAlignment(Qt.AlignCenter)
+    return label
+
+
+def _get_app_icon():
+    """Return the shared application icon, loading favicon.ico only once"""
+    global _APP_ICON
+    if _APP_ICON is None and _resource_exists("favicon.ico"):
+        _APP_ICON = QIcon(resource_path("favicon.ico"))
+    return _APP_ICON
+
+
+def _get_health_logo_pixmap(size=100):
+    """Return the scaled Health Logo pixmap, decoding the PNG only once per size"""
+    pixmap = _HEALTH_LOGO_PIXMAPS.get(size)
+    if pixmap is None and _resource_exists("Health Logo.png"):
+        pixmap = QPixmap(resource_path("Health Logo.png")).scaled(
+            size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        _HEALTH_LOGO_PIXMAPS[size] = pixmap
+    return pixmap
+
+
+def open_db(path):
+    """Open a transfer database with the shared connection settings"""
+    # The statement cache keeps every query text the app issues compiled, so
+    # repeated lookups reuse their prepared statement instead of re-parsing
+    conn = sqlite3.connect(path, check_same_thread=False, cached_statements=256)
+    # WAL avoids an fsync per commit; mmap and a 64 MiB page cache keep the
+    # cadre tables resident while the grids are reloaded
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-65536;
+    """)
+    return conn
+
+
+def add_missing_columns(cursor, table, columns):
+    """Add each (name, definition) column that table lacks, read from one PRAGMA table_info"""
+    existing = {row[1] for row in cursor.execute(f'PRAGMA table_info({table})').fetchall()}
+    for name, definition in columns:
+        if name not in existing:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN {name} {definition}')
+
+
+def _chunks(rows, size):
+    """Yield lists of up to size items from any iterable"""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def bulk_insert(conn, sql, rows, batch=5000):
+    """Run sql once per row with executemany, in batches, inside one transaction"""
+    with conn:
+        for chunk in _chunks(rows, batch):
+            conn.executemany(sql, chunk)
+
+
+# Days from district_join_date to today, computed by SQLite with the same
+# result as calculate_duration: the date is split on '-' and must have the
+# shape strptime('%d-%m-%Y') accepts (1-2 digit day and month, 4 digit year)
+# and name a real calendar day, otherwise the duration is 0
+_DURATION_DAYS_SQL = '''
+    COALESCE((
+        SELECT CAST(julianday(date('now', 'localtime')) - julianday(iso) AS INTEGER)
+        FROM (SELECT y || '-' || printf('%02d', m) || '-' || printf('%02d', d) AS iso, d, m, y
+              FROM (SELECT d, substr(rest, 1, instr(rest, '-') - 1) AS m,
+                           substr(rest, instr(rest, '-') + 1) AS y
+                    FROM (SELECT substr(district_join_date, 1, instr(district_join_date, '-') - 1) AS d,
+                                 substr(district_join_date, instr(district_join_date, '-') + 1) AS rest)))
+        WHERE (d GLOB '[0-9]' OR d GLOB '[0-9][0-9]' OR d GLOB ' [1-9]')
+          AND (m GLOB '[0-9]' OR m GLOB '[0-9][0-9]')
+          AND y GLOB '[0-9][0-9][0-9][0-9]' AND y <> '0000'
+          AND date(julianday(iso)) = iso
+    ), 0)
+'''
+
+
+# Callers pick one of a fixed set of statement texts, so every filter change
+# hits the connection's statement cache instead of parsing a freshly joined query
+def _filtered_queries(template, *clauses):
+    """Pre-build template for each on/off combination of clauses, keyed by a tuple of bools"""
+    queries = {}
+    for key in itertools.product((False, True), repeat=len(clauses)):
+        where = " AND ".join(clause for clause, on in zip(clauses, key) if on) or "1=1"
+        queries[key] = template.format(where=where)
+    return queries
+
+
+def _duration_text_sql(days):
+    """SQL expression formatting the days column like format_duration ("2Y 3M 4D")"""
+    return f'''CASE WHEN COALESCE({days}, 0) <= 0 THEN '0D' ELSE rtrim(
+               CASE WHEN {days} / 365 > 0 THEN ({days} / 365) || 'Y ' ELSE '' END
+               || CASE WHEN {days} % 365 / 30 > 0 THEN ({days} % 365 / 30) || 'M ' ELSE '' END
+               || CASE WHEN {days} % 365 % 30 > 0 OR {days} < 30 THEN ({days} % 365 % 30) || 'D' ELSE '' END) END'''
+
+
+# Applied employees with their preferences, filtered by current district and
+# by first preference (Most Preferred District). The duration and weightage
+# display text are computed by SQLite and appended after the raw columns
+_PREFERENCE_LIST_SQL = _filtered_queries(f'''
+    SELECT j.pen, j.name, j.institution, j.district,
+           t.receipt_numbers, t.applied_date, j.duration_days,
+           t.pref1, t.pref2, t.pref3, t.pref4, t.pref5, t.pref6, t.pref7, t.pref8,
+           t.special_priority, j.weightage, j.weightage_details, j.district_join_date,
+           {_duration_text_sql('j.duration_days')},
+           CASE WHEN lower(j.weightage) IN ('yes', 'y', '1', 'true') THEN 'Yes' ELSE 'No' END
+    FROM jphn j
+    INNER JOIN transfer_applied t ON j.pen = t.pen
+    WHERE {{where}}
+    ORDER BY j.district, j.duration_days DESC
+''', "j.district = ?", "t.pref1 = ?")
+
+# Confirmed transfers, filtered by current district and by transfer district
+_TRANSFER_LIST_SQL = _filtered_queries('''
+    SELECT j.pen, j.name, j.institution, j.district,
+           t.transfer_to_district, j.district_join_date,
+           j.duration_days, j.weightage, j.weightage_details
+    FROM jphn j
+    INNER JOIN transfer_final t ON j.pen = t.pen
+    WHERE {where}
+    ORDER BY t.transfer_to_district, j.duration_days DESC
+''', "j.district = ?", "t.transfer_to_district = ?")
+
+# Draft transfers with whether (and with what special priority) each
+# employee applied, filtered by current district and by transfer district
+_DRAFT_LIST_SQL = _filtered_queries('''
+    SELECT j.pen, j.name, j.institution, j.district,
+           t.transfer_to_district, j.district_join_date,
+           j.duration_days, j.weightage, j.weightage_details,
+           (SELECT 1 FROM transfer_applied WHERE pen = j.pen) as has_applied,
+           t.against_info,
+           (SELECT special_priority FROM transfer_applied WHERE pen = j.pen) as special_priority
+    FROM jphn j
+    INNER JOIN transfer_draft t ON j.pen = t.pen
+    WHERE {where}
+    ORDER BY t.transfer_to_district, j.duration_days DESC
+''', "j.district = ?", "t.transfer_to_district = ?")
+
+_ORDER_NUMBER_SELECT_SQL = "SELECT value FROM settings WHERE key = 'order_number'"
+_ORDER_NUMBER_SAVE_SQL = "INSERT OR REPLACE INTO settings (key, value) VALUES ('order_number', ?)"
+
+
+@lru_cache(maxsize=1024)
+def _preference_tooltip(prefs, is_special):
+    """Tooltip listing an applicant's district preferences (pref1..pref8 tuple)"""
+    prefs = [p for p in prefs if p]
+    if prefs:
+        tooltip = "District Preferences:\n" + "\n".join([f"{i+1}. {p}" for i, p in enumerate(prefs)])
+    else:
+        tooltip = "No preferences set"
+    if is_special:
+        tooltip = "🔴 SPECIAL PRIORITY\n\n" + tooltip
+    return tooltip
+
+
+# Item data role holding a row's lower-cased searchable text
+_SEARCH_ROLE = Qt.UserRole + 1
+
+
+_FONTS = {}
+
+
+def _font(size, bold=False, family="Calibri"):
+    """Return a shared QFont for (family, size, bold), created on first use"""
+    key = (family, size, bold)
+    font = _FONTS.get(key)
+    if font is None:
+        font = QFont(family, size, QFont.Bold) if bold else QFont(family, size)
+        _FONTS[key] = font
+    return font
+
+
+_COLORS = {}
+
+
+def _color(name):
+    """Return a shared QColor for name, created on first use"""
+    color = _COLORS.get(name)
+    if color is None:
+        color = _COLORS[name] = QColor(name)
+    return color
+
+
+def _sync_combo_items(combo, wanted):
+    """Make combo hold "" followed by wanted, touching only the rows that differ.
+    
+    Both the combo rows and wanted must follow the same master ordering, so once
+    the unwanted rows are removed the rest is a subsequence of wanted and the
+    missing rows can be inserted in place. The current item stays selected if it
+    is still wanted, otherwise the selection falls back to the empty option.
+    Returns True if any row changed.
+    """
+    if [combo.itemText(i) for i in range(1, combo.count())] == wanted:
+        return False
+    
+    # Block signals while updating
+    combo.blockSignals(True)
+    wanted_set = set(wanted)
+    if combo.currentText().strip() not in wanted_set:
+        combo.setCurrentIndex(0)
+    for i in range(combo.count() - 1, 0, -1):
+        if combo.itemText(i) not in wanted_set:
+            combo.removeItem(i)
+    for pos, item in enumerate(wanted, start=1):
+        if pos >= combo.count() or combo.itemText(pos) != item:
+            combo.insertItem(pos, item)
+    combo.blockSignals(False)
+    return True
+
+
 class NoScrollDateEdit(QDateEdit):
     """Custom QDateEdit that disables mouse wheel scrolling"""
     def wheelEvent(self, event):
@@ -41,6 +416,57 @@ class NoScrollComboBox(QComboBox):
         event.ignore()
 
 
+class LazyComboBox(QComboBox):
+    """QComboBox that fills in its items the first time the user reaches it"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._populate = None
+    
+    def set_populator(self, populate):
+        """Call populate() once, on first focus or popup, instead of right away"""
+        self._populate = populate
+    
+    def _ensure_populated(self):
+        if self._populate is not None:
+            populate, self._populate = self._populate, None
+            populate()
+    
+    def showPopup(self):
+        self._ensure_populated()
+        super().showPopup()
+    
+    def focusInEvent(self, event):
+        self._ensure_populated()
+        super().focusInEvent(event)
+
+
+class _ContainsFilterModel(QSortFilterProxyModel):
+    """Case-insensitive 'contains' filter backed by a pre-lowercased item list"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lower = []
+        self._query = ""
+    
+    def set_items(self, items):
+        """Record the lowercased text of each source row"""
+        self._lower = [item.lower() for item in items]
+        self.invalidateFilter()
+    
+    def set_query(self, text):
+        """Filter rows to those containing text, ignoring case"""
+        query = text.lower()
+        if query != self._query:
+            self._query = query
+            self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._query:
+            return True
+        if source_row >= len(self._lower):
+            return False
+        return self._query in self._lower[source_row]
+
+
 class SearchableComboBox(QComboBox):
     """Custom QComboBox with type-ahead search functionality"""
     def __init__(self, parent=None):
@@ -48,35 +474,72 @@ class SearchableComboBox(QComboBox):
         self.setEditable(True)
         self.setInsertPolicy(QComboBox.NoInsert)
         
-        # Setup completer for type-ahead search
+        # Setup completer for type-ahead search. Matching is done by our own
+        # proxy against pre-lowercased text, so the completer itself shows
+        # the proxy's rows unfiltered.
         self.completer_obj = QCompleter(self)
         self.completer_obj.setCaseSensitivity(Qt.CaseInsensitive)
-        self.completer_obj.setFilterMode(Qt.MatchContains)
-        self.completer_obj.setCompletionMode(QCompleter.PopupCompletion)
+        self._completer_model = QStringListModel(self.completer_obj)
+        self._filter_model = _ContainsFilterModel(self.completer_obj)
+        self._filter_model.setSourceModel(self._completer_model)
+        self.completer_obj.setModel(self._filter_model)
+        self.completer_obj.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
         self.setCompleter(self.completer_obj)
+        self.lineEdit().textEdited.connect(self._on_text_edited)
         
         # Connect completer activation to select the item
         self.completer_obj.activated.connect(self._on_completer_activated)
         
+        # Single-shot timer used to coalesce bursts of item changes into one
+        # completer rebuild per event loop pass
+        self._completer_timer = QTimer(self)
+        self._completer_timer.setSingleShot(True)
+        self._completer_timer.setInterval(0)
+        self._completer_timer.timeout.connect(self._update_completer)
+        
         # Initial update of completer
         self._update_completer()
         
         # Update completer model when items change
-        self.model().rowsInserted.connect(self._update_completer)
-        self.model().rowsRemoved.connect(self._update_completer)
-        self.model().modelReset.connect(self._update_completer)
+        self.model().rowsInserted.connect(self._schedule_completer_update)
+        self.model().rowsRemoved.connect(self._schedule_completer_update)
+        self.model().modelReset.connect(self._schedule_completer_update)
+    
+    def _index_of(self, text):
+        """Case-insensitive item lookup, same matching as findText(MatchFixedString)"""
+        if self._completer_timer.isActive():
+            self._update_completer()
+        return self._lower_index.get(text.lower(), -1)
     
     def _on_completer_activated(self, text):
         """When user selects from completer dropdown, set that item"""
-        index = self.findText(text, Qt.MatchFixedString)
+        index = self._index_of(text)
         if index >= 0:
             self.setCurrentIndex(index)
+    
+    def _on_text_edited(self, text):
+        """Filter the completer popup to items containing the typed text"""
+        self._filter_model.set_query(text.strip())
+        if text.strip():
+            self.completer_obj.complete()
+        else:
+            self.completer_obj.popup().hide()
+    
+    def _schedule_completer_update(self, *args):
+        """Queue a single completer rebuild for the next event loop pass"""
+        self._completer_timer.start()
         
     def _update_completer(self):
         """Update completer model with current items"""
+        self._completer_timer.stop()
         items = [self.itemText(i) for i in range(self.count())]
-        model = QStringListModel(items, self.completer_obj)
-        self.completer_obj.setModel(model)
+        # Lowercased text -> first matching index, for O(1) lookups in
+        # place of QComboBox.findText's linear scan
+        self._lower_index = {}
+        for i, item in enumerate(items):
+            self._lower_index.setdefault(item.lower(), i)
+        self._filter_model.set_items(items)
+        self._completer_model.setStringList(items)
     
     def refresh_completer(self):
         """Force refresh the completer model - call after bulk updates"""
@@ -90,44 +553,165 @@ class SearchableComboBox(QComboBox):
         super().focusOutEvent(event)
         text = self.currentText().strip()
         if text:
-            index = self.findText(text, Qt.MatchFixedString)
+            index = self._index_of(text)
             if index >= 0:
                 self.setCurrentIndex(index)
             else:
-                # Try case-insensitive match
-                for i in range(self.count()):
-                    if self.itemText(i).lower() == text.lower():
-                        self.setCurrentIndex(i)
-                        return
                 # If text doesn't match any item, reset to empty
                 self.setCurrentIndex(0)
 
 
+# Start/end colours of the startup dialog button gradient per state
+_BUTTON_GRADIENTS = {
+    'normal': ("#1a5276", "#27ae60"),
+    'hover': ("#154360", "#1e8449"),
+    'pressed': ("#0e2f44", "#196f3d"),
+}
+_GRADIENT_STRIPS = {}
+
+
+def _gradient_strip(state, width):
+    """Return a 1px high horizontal gradient strip, rendered once per state and width"""
+    key = (state, width)
+    strip = _GRADIENT_STRIPS.get(key)
+    if strip is None:
+        start, stop = _BUTTON_GRADIENTS[state]
+        strip = QPixmap(max(width, 1), 1)
+        gradient = QLinearGradient(0, 0, width, 0)
+        gradient.setColorAt(0, QColor(start))
+        gradient.setColorAt(1, QColor(stop))
+        painter = QPainter(strip)
+        painter.fillRect(strip.rect(), gradient)
+        painter.end()
+        _GRADIENT_STRIPS[key] = strip
+    return strip
+
+
+class GradientButton(QPushButton):
+    """QPushButton that paints the startup gradient from a cached pixmap strip"""
+    def __init__(self, text="", parent=None, radius=8):
+        super().__init__(text, parent)
+        self._radius = radius
+        self.setAttribute(Qt.WA_Hover)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = self.rect()
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(rect), self._radius, self._radius)
+        painter.setClipPath(path)
+        
+        if not self.isEnabled():
+            painter.fillRect(rect, QColor("#bdc3c7"))
+        else:
+            if self.isDown():
+                state = 'pressed'
+            elif self.underMouse():
+                state = 'hover'
+            else:
+                state = 'normal'
+            painter.drawTiledPixmap(rect, _gradient_strip(state, rect.width()))
+        
+        painter.setClipping(False)
+        painter.setPen(QColor("white"))
+        painter.setFont(self.font())
+        painter.drawText(rect, Qt.AlignCenter, self.text())
+        painter.end()
+
+
+class RemoveButtonDelegate(QStyledItemDelegate):
+    """Paints a remove mark in its column and reports clicks on it as removeRequested(row)"""
+    removeRequested = Signal(int)
+    
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        painter.save()
+        painter.drawText(option.rect, Qt.AlignCenter, "❌")
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            self.removeRequested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class RowToolTipDelegate(QStyledItemDelegate):
+    """Shows the row's first-column tooltip over any cell that has none of its own"""
+    
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip and index.data(Qt.ToolTipRole) is None:
+            tooltip = index.siblingAtColumn(0).data(Qt.ToolTipRole)
+            if tooltip:
+                QToolTip.showText(event.globalPos(), tooltip, view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
+
+class _ExportSignals(QObject):
+    """Signals an _ExportTask uses to report back to the GUI thread"""
+    finished = Signal(str, str)          # kind, file path
+    failed = Signal(str, str, object)    # kind, file path, exception
+
+
+class _ExportTask(QRunnable):
+    """Runs an export writer on the thread pool so the dialog stays responsive"""
+    def __init__(self, kind, write, file_path):
+        super().__init__()
+        self.setAutoDelete(False)  # the dialog keeps it until the result arrives
+        self.kind = kind
+        self.write = write
+        self.file_path = file_path
+        self.signals = _ExportSignals()
+    
+    def run(self):
+        try:
+            self.write(self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(self.kind, self.file_path, e)
+        else:
+            self.signals.finished.emit(self.kind, self.file_path)
+
+
 class LoginDialog(QDialog):
     """Login screen with Department of Health Services branding"""
     
+    _STYLESHEET = """
+        QPushButton {
+            border-radius: 8px;
+            padding: 10px 30px;
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setObjectName("startupDialog")
         self.setWindowTitle("Login - Department of Health Services")
-        self.setFont(QFont("Calibri", 11))
+        self.setFont(_font(11))
         self.authenticated = False
         
         # Set window icon
-        icon_path = resource_path("favicon.ico")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        app_icon = _get_app_icon()
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
         
         # Set fixed size and center on screen
         self.setWindowFlags(Qt.Window)
         self.setFixedSize(650, 580)
         
+        # Build the widget tree with repaints suspended, then repaint once
+        self.setUpdatesEnabled(False)
         self.setup_ui()
         self.apply_styles()
+        self.setUpdatesEnabled(True)
         self.center_on_screen()
     
     def center_on_screen(self):
         """Center the dialog on the screen"""
-        screen = QApplication.primaryScreen().geometry()
+        screen = _primary_geom()
         x = (screen.width() - self.width()) // 2
         y = (screen.height() - self.height()) // 2
         self.move(x, y)
@@ -149,14 +733,14 @@ class LoginDialog(QDialog):
         
         # Title: Department of Health Services
         title_label = QLabel("Department of Health Services")
-        title_label.setFont(QFont("Calibri", 22, QFont.Bold))
+        title_label.setFont(_font(22, True))
         title_label.setAlignment(Qt.AlignCenter)
         title_label.setStyleSheet("color: #1a5276;")
         center_layout.addWidget(title_label)
         
         # Kerala
         kerala_label = QLabel("Kerala")
-        kerala_label.setFont(QFont("Calibri", 18, QFont.Bold))
+        kerala_label.setFont(_font(18, True))
         kerala_label.setAlignment(Qt.AlignCenter)
         kerala_label.setStyleSheet("color: #27ae60;")
         center_layout.addWidget(kerala_label)
@@ -168,16 +752,12 @@ class LoginDialog(QDialog):
         logo_label = QLabel()
         logo_label.setAlignment(Qt.AlignCenter)
         # Try to load logo from file, otherwise show placeholder
-        logo_path = resource_path("Health Logo.png")
-        if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path)
-            scaled_pixmap = pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            logo_label.setPixmap(scaled_pixmap)
+        logo_pixmap = _get_health_logo_pixmap(100)
+        if logo_pixmap is not None:
+            logo_label.setPixmap(logo_pixmap)
         else:
             # Placeholder if logo not found
-            logo_label.setText("🏥")
-            logo_label.setFont(QFont("Segoe UI Emoji", 48))
-            logo_label.setStyleSheet("color: #1a5276;")
+            logo_label.setPixmap(_emoji_pixmap("🏥", 48))
         center_layout.addWidget(logo_label)
         
         # Spacer
@@ -185,14 +765,14 @@ class LoginDialog(QDialog):
         
         # Directorate of Health Services
         directorate_label = QLabel("Directorate of Health Services")
-        directorate_label.setFont(QFont("Calibri", 16, QFont.Bold))
+        directorate_label.setFont(_font(16, True))
         directorate_label.setAlignment(Qt.AlignCenter)
         directorate_label.setStyleSheet("color: #1a5276;")
         center_layout.addWidget(directorate_label)
         
         # Transfer and Posting
         transfer_label = QLabel("Transfer and Posting")
-        transfer_label.setFont(QFont("Calibri", 14))
+        transfer_label.setFont(_font(14))
         transfer_label.setAlignment(Qt.AlignCenter)
         transfer_label.setStyleSheet("color: #2c3e50;")
         center_layout.addWidget(transfer_label)
@@ -212,9 +792,9 @@ class LoginDialog(QDialog):
         self.user_id_input.setPlaceholderText("Enter User ID")
         self.user_id_input.setMinimumWidth(250)
         self.user_id_input.setMinimumHeight(35)
-        self.user_id_input.setFont(QFont("Calibri", 11))
+        self.user_id_input.setFont(_font(11))
         user_id_label = QLabel("User ID:")
-        user_id_label.setFont(QFont("Calibri", 12, QFont.Bold))
+        user_id_label.setFont(_font(12, True))
         form_layout.addRow(user_id_label, self.user_id_input)
         
         # Password
@@ -223,18 +803,18 @@ class LoginDialog(QDialog):
         self.password_input.setEchoMode(QLineEdit.Password)
         self.password_input.setMinimumWidth(250)
         self.password_input.setMinimumHeight(35)
-        self.password_input.setFont(QFont("Calibri", 11))
+        self.password_input.setFont(_font(11))
         password_label = QLabel("Password:")
-        password_label.setFont(QFont("Calibri", 12, QFont.Bold))
+        password_label.setFont(_font(12, True))
         form_layout.addRow(password_label, self.password_input)
         
         center_layout.addWidget(form_widget, alignment=Qt.AlignCenter)
         
         # Login button
-        self.login_btn = QPushButton("Login")
+        self.login_btn = GradientButton("Login")
         self.login_btn.setMinimumWidth(200)
         self.login_btn.setMinimumHeight(45)
-        self.login_btn.setFont(QFont("Calibri", 14, QFont.Bold))
+        self.login_btn.setFont(_font(14, True))
         self.login_btn.clicked.connect(self.handle_login)
         self.login_btn.setDefault(True)
         center_layout.addWidget(self.login_btn, alignment=Qt.AlignCenter)
@@ -247,37 +827,7 @@ class LoginDialog(QDialog):
         main_layout.addStretch(1)
     
     def apply_styles(self):
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #e8f6f3, stop:0.5 #ebf5fb, stop:1 #e8f8f5);
-            }
-            QLineEdit {
-                border: 2px solid #85c1e9;
-                border-radius: 8px;
-                padding: 8px 15px;
-                background-color: white;
-            }
-            QLineEdit:focus {
-                border: 2px solid #27ae60;
-            }
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #1a5276, stop:1 #27ae60);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 30px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #154360, stop:1 #1e8449);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #0e2f44, stop:1 #196f3d);
-            }
-        """)
+        self.setStyleSheet(self._STYLESHEET)
     
     def handle_login(self):
         user_id = self.user_id_input.text().strip()
@@ -287,12 +837,9 @@ class LoginDialog(QDialog):
             QMessageBox.warning(self, "Login Error", "Please enter both User ID and Password.")
             return
         
-        # Simple authentication (can be enhanced with database)
-        valid_users = {
-            "revathy": "4117"
-        }
-        
-        if user_id in valid_users and valid_users[user_id] == password:
+        # Compare salted hashes in constant time
+        stored_hash = _VALID_USERS.get(user_id)
+        if stored_hash is not None and hmac.compare_digest(stored_hash, _hash_password(password)):
             self.authenticated = True
             self.accept()
         else:
@@ -307,28 +854,49 @@ class LoginDialog(QDialog):
 class WelcomeDialog(QDialog):
     """Welcome screen to choose between General Transfer and Regular Transfer"""
     
+    _STYLESHEET = """
+        QFrame#optionFrame {
+            background-color: white;
+            border: 2px solid #85c1e9;
+            border-radius: 12px;
+        }
+        QFrame#optionFrame:hover {
+            border: 2px solid #27ae60;
+            background-color: #f0fff4;
+        }
+        QPushButton {
+            border-radius: 6px;
+            padding: 8px 16px;
+            font-weight: bold;
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setObjectName("startupDialog")
         self.setWindowTitle("JPHN Gr I Transfer Management System")
-        self.setFont(QFont("Calibri", 11))
+        self.setFont(_font(11))
         self.selected_type = None
         
         # Set window icon
-        icon_path = resource_path("favicon.ico")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        app_icon = _get_app_icon()
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
         
         # Set fixed size and center on screen
         self.setWindowFlags(Qt.Window)
         self.setFixedSize(650, 500)
         
+        # Build the widget tree with repaints suspended, then repaint once
+        self.setUpdatesEnabled(False)
         self.setup_ui()
         self.apply_styles()
+        self.setUpdatesEnabled(True)
         self.center_on_screen()
     
     def center_on_screen(self):
         """Center the dialog on the screen"""
-        screen = QApplication.primaryScreen().geometry()
+        screen = _primary_geom()
         x = (screen.width() - self.width()) // 2
         y = (screen.height() - self.height()) // 2
         self.move(x, y)
@@ -338,25 +906,17 @@ class WelcomeDialog(QDialog):
         layout.setSpacing(20)
         layout.setContentsMargins(40, 40, 40, 40)
         
-        # Title
-        title_label = QLabel("JPHN Gr I Transfer & Posting")
-        title_label.setFont(QFont("Calibri", 22, QFont.Bold))
-        title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("color: #1a5276;")
-        layout.addWidget(title_label)
-        
-        # Subtitle
-        subtitle_label = QLabel("Kerala Health Services Department")
-        subtitle_label.setFont(QFont("Calibri", 12))
-        subtitle_label.setAlignment(Qt.AlignCenter)
-        subtitle_label.setStyleSheet("color: #27ae60;")
-        layout.addWidget(subtitle_label)
+        # Title and subtitle
+        header_label = _header_label("JPHN Gr I Transfer &amp; Posting",
+                                     "Kerala Health Services Department",
+                                     "#27ae60", 12, 20)
+        layout.addWidget(header_label)
         
         layout.addSpacing(20)
         
         # Instruction
         inst_label = QLabel("Select Transfer Type to Continue:")
-        inst_label.setFont(QFont("Calibri", 12))
+        inst_label.setFont(_font(12))
         inst_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(inst_label)
         
@@ -373,23 +933,23 @@ class WelcomeDialog(QDialog):
         general_layout.setSpacing(15)
         general_layout.setContentsMargins(20, 25, 20, 25)
         
-        general_icon = QLabel("📋")
-        general_icon.setFont(QFont("Segoe UI Emoji", 36))
+        general_icon = QLabel()
+        general_icon.setPixmap(_emoji_pixmap("📋", 36))
         general_icon.setAlignment(Qt.AlignCenter)
         general_layout.addWidget(general_icon)
         
         general_title = QLabel("General Transfer")
-        general_title.setFont(QFont("Calibri", 14, QFont.Bold))
+        general_title.setFont(_font(14, True))
         general_title.setAlignment(Qt.AlignCenter)
         general_layout.addWidget(general_title)
         
         general_desc = QLabel("For general transfer\noperations and postings")
-        general_desc.setFont(QFont("Calibri", 10))
+        general_desc.setFont(_font(10))
         general_desc.setAlignment(Qt.AlignCenter)
         general_desc.setStyleSheet("color: #666;")
         general_layout.addWidget(general_desc)
         
-        general_btn = QPushButton("Open General Transfer")
+        general_btn = GradientButton("Open General Transfer", radius=6)
         general_btn.setMinimumHeight(40)
         general_btn.setCursor(Qt.PointingHandCursor)
         general_btn.clicked.connect(lambda: self.select_type("general"))
@@ -404,23 +964,23 @@ class WelcomeDialog(QDialog):
         regular_layout.setSpacing(15)
         regular_layout.setContentsMargins(20, 25, 20, 25)
         
-        regular_icon = QLabel("📑")
-        regular_icon.setFont(QFont("Segoe UI Emoji", 36))
+        regular_icon = QLabel()
+        regular_icon.setPixmap(_emoji_pixmap("📑", 36))
         regular_icon.setAlignment(Qt.AlignCenter)
         regular_layout.addWidget(regular_icon)
         
         regular_title = QLabel("Regular Transfer")
-        regular_title.setFont(QFont("Calibri", 14, QFont.Bold))
+        regular_title.setFont(_font(14, True))
         regular_title.setAlignment(Qt.AlignCenter)
         regular_layout.addWidget(regular_title)
         
         regular_desc = QLabel("For regular/routine\ntransfer management")
-        regular_desc.setFont(QFont("Calibri", 10))
+        regular_desc.setFont(_font(10))
         regular_desc.setAlignment(Qt.AlignCenter)
         regular_desc.setStyleSheet("color: #666;")
         regular_layout.addWidget(regular_desc)
         
-        regular_btn = QPushButton("Open Regular Transfer")
+        regular_btn = GradientButton("Open Regular Transfer", radius=6)
         regular_btn.setMinimumHeight(40)
         regular_btn.setCursor(Qt.PointingHandCursor)
         regular_btn.clicked.connect(lambda: self.select_type("regular"))
@@ -434,44 +994,13 @@ class WelcomeDialog(QDialog):
         
         # Footer
         footer_label = QLabel("Each transfer type uses a separate database")
-        footer_label.setFont(QFont("Calibri", 9))
+        footer_label.setFont(_font(9))
         footer_label.setAlignment(Qt.AlignCenter)
         footer_label.setStyleSheet("color: #999;")
         layout.addWidget(footer_label)
     
     def apply_styles(self):
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #e8f6f3, stop:0.5 #ebf5fb, stop:1 #e8f8f5);
-            }
-            QFrame#optionFrame {
-                background-color: white;
-                border: 2px solid #85c1e9;
-                border-radius: 12px;
-            }
-            QFrame#optionFrame:hover {
-                border: 2px solid #27ae60;
-                background-color: #f0fff4;
-            }
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #1a5276, stop:1 #27ae60);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #154360, stop:1 #1e8449);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #0e2f44, stop:1 #196f3d);
-            }
-        """)
+        self.setStyleSheet(self._STYLESHEET)
     
     def select_type(self, transfer_type):
         self.selected_type = transfer_type
@@ -484,28 +1013,59 @@ class WelcomeDialog(QDialog):
 class YearSelectionDialog(QDialog):
     """Dialog to select year for General Transfer"""
     
+    _STYLESHEET = """
+        QFrame#yearsFrame, QFrame#newYearFrame {
+            background-color: white;
+            border: 2px solid #85c1e9;
+            border-radius: 12px;
+        }
+        QPushButton#openYearBtn {
+            border-radius: 8px;
+            font-weight: bold;
+        }
+        QPushButton#openYearBtn:disabled {
+            background-color: #bdc3c7;
+        }
+        QPushButton#addYearBtn {
+            border-radius: 6px;
+            font-weight: bold;
+        }
+        QPushButton#backBtn {
+            background: #1a5276;
+            border-radius: 6px;
+            font-weight: bold;
+        }
+        QPushButton#backBtn:hover, QPushButton#backBtn:pressed {
+            background: #154360;
+        }
+    """
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setObjectName("startupDialog")
         self.setWindowTitle("Select Year - General Transfer")
-        self.setFont(QFont("Calibri", 11))
+        self.setFont(_font(11))
         self.selected_year = None
         
         # Set window icon
-        icon_path = resource_path("favicon.ico")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        app_icon = _get_app_icon()
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
         
         # Set fixed size and center on screen
         self.setWindowFlags(Qt.Window)
         self.setFixedSize(800, 500)
         
+        # Build the widget tree with repaints suspended, then repaint once
+        self.setUpdatesEnabled(False)
         self.setup_ui()
         self.apply_styles()
+        self.setUpdatesEnabled(True)
         self.center_on_screen()
     
     def center_on_screen(self):
         """Center the dialog on the screen"""
-        screen = QApplication.primaryScreen().geometry()
+        screen = _primary_geom()
         x = (screen.width() - self.width()) // 2
         y = (screen.height() - self.height()) // 2
         self.move(x, y)
@@ -515,24 +1075,17 @@ class YearSelectionDialog(QDialog):
         layout.setSpacing(15)
         layout.setContentsMargins(50, 30, 50, 30)
         
-        # Title
-        title_label = QLabel("General Transfer - Year Selection")
-        title_label.setFont(QFont("Calibri", 22, QFont.Bold))
-        title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("color: #1a5276;")
-        layout.addWidget(title_label)
-        
-        # Subtitle
-        subtitle_label = QLabel("Select an existing year or create a new one")
-        subtitle_label.setFont(QFont("Calibri", 11))
-        subtitle_label.setAlignment(Qt.AlignCenter)
-        subtitle_label.setStyleSheet("color: #5d6d7e;")
-        layout.addWidget(subtitle_label)
+        # Title and subtitle
+        header_label = _header_label("General Transfer - Year Selection",
+                                     "Select an existing year or create a new one",
+                                     "#5d6d7e", 11, 15)
+        layout.addWidget(header_label)
         
         layout.addSpacing(20)
         
-        # Get available years from existing database files
-        self.available_years = self.get_available_years()
+        # Available years are scanned after the dialog is first shown
+        self.available_years = []
+        self._years_loaded = False
         
         # Previous Years section
         years_frame = QFrame()
@@ -542,7 +1095,7 @@ class YearSelectionDialog(QDialog):
         years_layout.setContentsMargins(30, 20, 30, 20)
         
         years_title = QLabel("📂 Open Previous Year:")
-        years_title.setFont(QFont("Calibri", 13, QFont.Bold))
+        years_title.setFont(_font(13, True))
         years_title.setStyleSheet("color: #1a5276;")
         years_layout.addWidget(years_title)
         
@@ -553,27 +1106,20 @@ class YearSelectionDialog(QDialog):
         # Dropdown for previous years
         self.previous_year_combo = QComboBox()
         self.previous_year_combo.setMinimumSize(350, 42)
-        self.previous_year_combo.setFont(QFont("Calibri", 11))
-        
-        if self.available_years:
-            self.previous_year_combo.addItem("-- Select a Year --")
-            # Sort years descending
-            for year in sorted(self.available_years, reverse=True):
-                self.previous_year_combo.addItem(f"📅 {year}", year)
-        else:
-            self.previous_year_combo.addItem("No previous years found")
-            self.previous_year_combo.setEnabled(False)
+        self.previous_year_combo.setFont(_font(11))
+        self.previous_year_combo.addItem("Loading years...")
+        self.previous_year_combo.setEnabled(False)
         
         dropdown_row.addWidget(self.previous_year_combo, 1)
         
         # Open button
-        self.open_year_btn = QPushButton("  Open Selected  ")
+        self.open_year_btn = GradientButton("  Open Selected  ")
         self.open_year_btn.setMinimumSize(160, 42)
-        self.open_year_btn.setFont(QFont("Calibri", 11, QFont.Bold))
+        self.open_year_btn.setFont(_font(11, True))
         self.open_year_btn.setCursor(Qt.PointingHandCursor)
         self.open_year_btn.setObjectName("openYearBtn")
         self.open_year_btn.clicked.connect(self.open_selected_year)
-        self.open_year_btn.setEnabled(len(self.available_years) > 0)
+        self.open_year_btn.setEnabled(False)
         dropdown_row.addWidget(self.open_year_btn)
         
         years_layout.addLayout(dropdown_row)
@@ -590,7 +1136,7 @@ class YearSelectionDialog(QDialog):
         new_year_layout.setContentsMargins(30, 20, 30, 20)
         
         new_year_label = QLabel("➕ Create New Year:")
-        new_year_label.setFont(QFont("Calibri", 13, QFont.Bold))
+        new_year_label.setFont(_font(13, True))
         new_year_label.setStyleSheet("color: #1a5276;")
         new_year_layout.addWidget(new_year_label)
         
@@ -599,21 +1145,21 @@ class YearSelectionDialog(QDialog):
         form_row.setSpacing(15)
         
         year_label = QLabel("Year:")
-        year_label.setFont(QFont("Calibri", 11))
+        year_label.setFont(_font(11))
         form_row.addWidget(year_label)
         
         self.new_year_spin = QSpinBox()
         self.new_year_spin.setRange(2020, 2100)
         self.new_year_spin.setValue(datetime.now().year)
         self.new_year_spin.setMinimumSize(120, 42)
-        self.new_year_spin.setFont(QFont("Calibri", 11))
+        self.new_year_spin.setFont(_font(11))
         form_row.addWidget(self.new_year_spin)
         
         form_row.addSpacing(20)
         
-        add_year_btn = QPushButton("  Create & Open  ")
+        add_year_btn = GradientButton("  Create & Open  ", radius=6)
         add_year_btn.setMinimumSize(150, 42)
-        add_year_btn.setFont(QFont("Calibri", 11, QFont.Bold))
+        add_year_btn.setFont(_font(11, True))
         add_year_btn.setCursor(Qt.PointingHandCursor)
         add_year_btn.setObjectName("addYearBtn")
         add_year_btn.clicked.connect(self.add_new_year)
@@ -630,7 +1176,7 @@ class YearSelectionDialog(QDialog):
         back_btn = QPushButton("← Back to Selection")
         back_btn.setMinimumHeight(45)
         back_btn.setMaximumWidth(220)
-        back_btn.setFont(QFont("Calibri", 11, QFont.Bold))
+        back_btn.setFont(_font(11, True))
         back_btn.setCursor(Qt.PointingHandCursor)
         back_btn.setObjectName("backBtn")
         back_btn.clicked.connect(self.reject)
@@ -640,93 +1186,60 @@ class YearSelectionDialog(QDialog):
         
         # Footer
         footer_label = QLabel("Each year has its own separate database with no connection to other years")
-        footer_label.setFont(QFont("Calibri", 9))
+        footer_label.setFont(_font(9))
         footer_label.setAlignment(Qt.AlignCenter)
         footer_label.setStyleSheet("color: #999;")
         layout.addWidget(footer_label)
     
+    def showEvent(self, event):
+        """Populate the previous-years dropdown once the dialog is on screen"""
+        super().showEvent(event)
+        if not self._years_loaded:
+            self._years_loaded = True
+            QTimer.singleShot(0, self.populate_available_years)
+    
+    def populate_available_years(self):
+        """Scan for year databases and fill the previous-years dropdown"""
+        self.available_years = self.get_available_years()
+        
+        self.previous_year_combo.clear()
+        if self.available_years:
+            self.previous_year_combo.addItem("-- Select a Year --")
+            # Sort years descending; add the labels in one call, then the data
+            years = sorted(self.available_years, reverse=True)
+            self.previous_year_combo.addItems(['📅 ' + str(year) for year in years])
+            for i, year in enumerate(years, start=1):  # 0 is the placeholder
+                self.previous_year_combo.setItemData(i, year)
+            self.previous_year_combo.setEnabled(True)
+        else:
+            self.previous_year_combo.addItem("No previous years found")
+            self.previous_year_combo.setEnabled(False)
+        
+        self.open_year_btn.setEnabled(len(self.available_years) > 0)
+    
     def get_available_years(self):
         """Scan for existing general transfer database files"""
-        import os
+        # Reuse the previous scan while the working directory is unchanged
+        dir_mtime = os.stat('.').st_mtime_ns
+        cached = _AVAILABLE_YEARS_CACHE.get(dir_mtime)
+        if cached is not None:
+            return list(cached)
+        
         years = []
         # Look for files like jphn_general_2024.db, jphn_general_2025.db
-        for filename in os.listdir('.'):
-            if filename.startswith('jphn_general_') and filename.endswith('.db'):
-                try:
-                    year_str = filename.replace('jphn_general_', '').replace('.db', '')
-                    year = int(year_str)
-                    if 2000 <= year <= 2100:
-                        years.append(year)
-                except ValueError:
-                    continue
+        for filename in glob.glob('jphn_general_*.db'):
+            match = _YEAR_DB_RE.match(filename)
+            if match:
+                year = int(match.group(1))
+                if 2000 <= year <= 2100:
+                    years.append(year)
+        
+        _AVAILABLE_YEARS_CACHE.clear()
+        _AVAILABLE_YEARS_CACHE[dir_mtime] = tuple(years)
         return years
     
     def apply_styles(self):
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #e8f6f3, stop:0.5 #ebf5fb, stop:1 #e8f8f5);
-            }
-            QFrame#yearsFrame, QFrame#newYearFrame {
-                background-color: white;
-                border: 2px solid #85c1e9;
-                border-radius: 12px;
-            }
-            QPushButton#openYearBtn {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #1a5276, stop:1 #27ae60);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-weight: bold;
-            }
-            QPushButton#openYearBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #154360, stop:1 #1e8449);
-            }
-            QPushButton#openYearBtn:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #0e2f44, stop:1 #196f3d);
-            }
-            QPushButton#openYearBtn:disabled {
-                background-color: #bdc3c7;
-            }
-            QPushButton#addYearBtn {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #1a5276, stop:1 #27ae60);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton#addYearBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #154360, stop:1 #1e8449);
-            }
-            QPushButton#backBtn {
-                background-color: #1a5276;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton#backBtn:hover {
-                background-color: #154360;
-            }
-            QComboBox, QSpinBox {
-                border: 2px solid #85c1e9;
-                border-radius: 6px;
-                padding: 8px 12px;
-                background-color: white;
-            }
-            QComboBox:focus, QSpinBox:focus {
-                border: 2px solid #27ae60;
-            }
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-        """)
+        self.setStyleSheet(self._STYLESHEET)
     
     def open_selected_year(self):
         """Open the selected year from dropdown"""
@@ -746,7 +1259,7 @@ class YearSelectionDialog(QDialog):
     
     def add_new_year(self):
         year = self.new_year_spin.value()
-        if year in self.available_years:
+        if year in self.get_available_years():
             # Year already exists, just open it
             reply = QMessageBox.question(self, "Year Exists", 
                 f"Year {year} already exists. Do you want to open it?",
@@ -770,32 +1283,70 @@ class YearSelectionDialog(QDialog):
 class RegularTransferSelectionDialog(QDialog):
     """Dialog to select month/year for Regular Transfer"""
     
-    MONTHS = ["January", "February", "March", "April", "May", "June",
-              "July", "August", "September", "October", "November", "December"]
+    _STYLESHEET = """
+        QFrame#listsFrame, QFrame#newListFrame {
+            background-color: white;
+            border: 2px solid #85c1e9;
+            border-radius: 12px;
+        }
+        QPushButton#openListBtn {
+            border-radius: 8px;
+            font-weight: bold;
+        }
+        QPushButton#openListBtn:disabled {
+            background-color: #bdc3c7;
+        }
+        QPushButton#addListBtn {
+            border-radius: 6px;
+            font-weight: bold;
+        }
+        QPushButton#backBtn {
+            background: #1a5276;
+            border-radius: 6px;
+            font-weight: bold;
+        }
+        QPushButton#backBtn:hover, QPushButton#backBtn:pressed {
+            background: #154360;
+        }
+    """
+    
+    MONTHS = MONTHS
+    
+    # Database file names look like jphn_regular_January_2025.db
+    _LIST_PREFIX = 'jphn_regular_'
+    _LIST_SUFFIX = '.db'
+    
+    # Last directory scan as (monotonic timestamp, lists), reused for a short while
+    _LISTS_CACHE_TTL = 2.0
+    _lists_cache = None
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setObjectName("startupDialog")
         self.setWindowTitle("Select Transfer List - Regular Transfer")
-        self.setFont(QFont("Calibri", 11))
+        self.setFont(_font(11))
         self.selected_month = None
         self.selected_year = None
         
         # Set window icon
-        icon_path = resource_path("favicon.ico")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        app_icon = _get_app_icon()
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
         
         # Set fixed size and center on screen
         self.setWindowFlags(Qt.Window)
         self.setFixedSize(800, 550)
         
+        # Build the widget tree with repaints suspended, then repaint once
+        self.setUpdatesEnabled(False)
         self.setup_ui()
         self.apply_styles()
+        self.setUpdatesEnabled(True)
         self.center_on_screen()
     
     def center_on_screen(self):
         """Center the dialog on the screen"""
-        screen = QApplication.primaryScreen().geometry()
+        screen = _primary_geom()
         x = (screen.width() - self.width()) // 2
         y = (screen.height() - self.height()) // 2
         self.move(x, y)
@@ -807,14 +1358,14 @@ class RegularTransferSelectionDialog(QDialog):
         
         # Title
         title_label = QLabel("Regular Transfer - Select Transfer List")
-        title_label.setFont(QFont("Calibri", 22, QFont.Bold))
+        title_label.setFont(_font(22, True))
         title_label.setAlignment(Qt.AlignCenter)
         title_label.setStyleSheet("color: #1a5276;")
         layout.addWidget(title_label)
         
         # Subtitle
         subtitle_label = QLabel("Select an existing transfer list or create a new one")
-        subtitle_label.setFont(QFont("Calibri", 11))
+        subtitle_label.setFont(_font(11))
         subtitle_label.setAlignment(Qt.AlignCenter)
         subtitle_label.setStyleSheet("color: #5d6d7e;")
         layout.addWidget(subtitle_label)
@@ -832,7 +1383,7 @@ class RegularTransferSelectionDialog(QDialog):
         lists_layout.setContentsMargins(30, 20, 30, 20)
         
         lists_title = QLabel("📂 Open Previous Transfer List:")
-        lists_title.setFont(QFont("Calibri", 13, QFont.Bold))
+        lists_title.setFont(_font(13, True))
         lists_title.setStyleSheet("color: #1a5276;")
         lists_layout.addWidget(lists_title)
         
@@ -841,18 +1392,14 @@ class RegularTransferSelectionDialog(QDialog):
         dropdown_row.setSpacing(15)
         
         # Dropdown for previous lists
-        self.previous_list_combo = QComboBox()
+        self.previous_list_combo = LazyComboBox()
         self.previous_list_combo.setMinimumSize(350, 42)
-        self.previous_list_combo.setFont(QFont("Calibri", 11))
+        self.previous_list_combo.setFont(_font(11))
         
         if self.available_lists:
             self.previous_list_combo.addItem("-- Select a Transfer List --")
-            # Sort by year (desc) then month (desc)
-            sorted_lists = sorted(self.available_lists, 
-                                  key=lambda x: (x[1], self.MONTHS.index(x[0])), 
-                                  reverse=True)
-            for month, year in sorted_lists:
-                self.previous_list_combo.addItem(f"📅 {month} {year}", (month, year))
+            # The lists themselves are added when the dropdown is first used
+            self.previous_list_combo.set_populator(self._populate_previous_lists)
         else:
             self.previous_list_combo.addItem("No previous transfer lists found")
             self.previous_list_combo.setEnabled(False)
@@ -860,9 +1407,9 @@ class RegularTransferSelectionDialog(QDialog):
         dropdown_row.addWidget(self.previous_list_combo, 1)
         
         # Open button
-        self.open_list_btn = QPushButton("  Open Selected  ")
+        self.open_list_btn = GradientButton("  Open Selected  ")
         self.open_list_btn.setMinimumSize(160, 42)
-        self.open_list_btn.setFont(QFont("Calibri", 11, QFont.Bold))
+        self.open_list_btn.setFont(_font(11, True))
         self.open_list_btn.setCursor(Qt.PointingHandCursor)
         self.open_list_btn.setObjectName("openListBtn")
         self.open_list_btn.clicked.connect(self.open_selected_list)
@@ -883,7 +1430,7 @@ class RegularTransferSelectionDialog(QDialog):
         new_list_layout.setContentsMargins(30, 20, 30, 20)
         
         new_list_label = QLabel("➕ Create New Transfer List:")
-        new_list_label.setFont(QFont("Calibri", 13, QFont.Bold))
+        new_list_label.setFont(_font(13, True))
         new_list_label.setStyleSheet("color: #1a5276;")
         new_list_layout.addWidget(new_list_label)
         
@@ -893,35 +1440,35 @@ class RegularTransferSelectionDialog(QDialog):
         
         # Month combo
         month_label = QLabel("Month:")
-        month_label.setFont(QFont("Calibri", 11))
+        month_label.setFont(_font(11))
         form_row.addWidget(month_label)
         
         self.new_month_combo = QComboBox()
         self.new_month_combo.addItems(self.MONTHS)
         self.new_month_combo.setCurrentIndex(datetime.now().month - 1)
         self.new_month_combo.setMinimumSize(140, 42)
-        self.new_month_combo.setFont(QFont("Calibri", 11))
+        self.new_month_combo.setFont(_font(11))
         form_row.addWidget(self.new_month_combo)
         
         form_row.addSpacing(20)
         
         # Year spin
         year_label = QLabel("Year:")
-        year_label.setFont(QFont("Calibri", 11))
+        year_label.setFont(_font(11))
         form_row.addWidget(year_label)
         
         self.new_year_spin = QSpinBox()
         self.new_year_spin.setRange(2020, 2100)
         self.new_year_spin.setValue(datetime.now().year)
         self.new_year_spin.setMinimumSize(100, 42)
-        self.new_year_spin.setFont(QFont("Calibri", 11))
+        self.new_year_spin.setFont(_font(11))
         form_row.addWidget(self.new_year_spin)
         
         form_row.addSpacing(20)
         
-        add_list_btn = QPushButton("  Create & Open  ")
+        add_list_btn = GradientButton("  Create & Open  ", radius=6)
         add_list_btn.setMinimumSize(150, 42)
-        add_list_btn.setFont(QFont("Calibri", 11, QFont.Bold))
+        add_list_btn.setFont(_font(11, True))
         add_list_btn.setCursor(Qt.PointingHandCursor)
         add_list_btn.setObjectName("addListBtn")
         add_list_btn.clicked.connect(self.add_new_list)
@@ -938,7 +1485,7 @@ class RegularTransferSelectionDialog(QDialog):
         back_btn = QPushButton("← Back to Selection")
         back_btn.setMinimumHeight(45)
         back_btn.setMaximumWidth(220)
-        back_btn.setFont(QFont("Calibri", 11, QFont.Bold))
+        back_btn.setFont(_font(11, True))
         back_btn.setCursor(Qt.PointingHandCursor)
         back_btn.setObjectName("backBtn")
         back_btn.clicked.connect(self.reject)
@@ -948,98 +1495,67 @@ class RegularTransferSelectionDialog(QDialog):
         
         # Footer
         footer_label = QLabel("Each transfer list has its own separate database")
-        footer_label.setFont(QFont("Calibri", 9))
+        footer_label.setFont(_font(9))
         footer_label.setAlignment(Qt.AlignCenter)
         footer_label.setStyleSheet("color: #999;")
         layout.addWidget(footer_label)
     
+    def _populate_previous_lists(self):
+        """Add the existing transfer lists to the previous-list dropdown"""
+        # Sort by year (desc) then month (desc)
+        sorted_lists = sorted(self.available_lists, 
+                              key=lambda x: (x[1], _MONTH_TO_NUM[x[0]]), 
+                              reverse=True)
+        # Insert all labels in one call, then attach the (month, year) data
+        labels = ['📅 ' + month + ' ' + str(year) for month, year in sorted_lists]
+        self.previous_list_combo.setUpdatesEnabled(False)
+        self.previous_list_combo.addItems(labels)
+        for i, data in enumerate(sorted_lists, start=1):  # 0 is the placeholder
+            self.previous_list_combo.setItemData(i, data)
+        self.previous_list_combo.setUpdatesEnabled(True)
+    
+    @classmethod
+    def clear_cache(cls):
+        """Forget the cached transfer list scan"""
+        cls._lists_cache = None
+    
     def get_available_lists(self):
         """Scan for existing regular transfer database files"""
-        import os
+        cache = RegularTransferSelectionDialog._lists_cache
+        if cache is not None and time.monotonic() - cache[0] < self._LISTS_CACHE_TTL:
+            return list(cache[1])
+        
         lists = []
         # Look for files like jphn_regular_January_2025.db
-        for filename in os.listdir('.'):
-            if filename.startswith('jphn_regular_') and filename.endswith('.db'):
+        prefix_len = len(self._LIST_PREFIX)
+        suffix_len = len(self._LIST_SUFFIX)
+        with os.scandir('.') as entries:
+            for entry in entries:
+                filename = entry.name
+                if not (filename.startswith(self._LIST_PREFIX) and filename.endswith(self._LIST_SUFFIX)):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                # Slice off the known prefix/suffix, then split month and year
+                parts = filename[prefix_len:-suffix_len]
+                underscore_idx = parts.rfind('_')
+                if underscore_idx <= 0:
+                    continue
+                month = parts[:underscore_idx]
+                if month not in _MONTH_TO_NUM:
+                    continue
                 try:
-                    # Extract month and year from filename
-                    parts = filename.replace('jphn_regular_', '').replace('.db', '')
-                    # Split by underscore to get month and year
-                    underscore_idx = parts.rfind('_')
-                    if underscore_idx > 0:
-                        month = parts[:underscore_idx]
-                        year = int(parts[underscore_idx + 1:])
-                        if month in self.MONTHS and 2000 <= year <= 2100:
-                            lists.append((month, year))
-                except (ValueError, IndexError):
+                    year = int(parts[underscore_idx + 1:])
+                except ValueError:
                     continue
+                if 2000 <= year <= 2100:
+                    lists.append((month, year))
+        
+        RegularTransferSelectionDialog._lists_cache = (time.monotonic(), tuple(lists))
         return lists
     
     def apply_styles(self):
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #e8f6f3, stop:0.5 #ebf5fb, stop:1 #e8f8f5);
-            }
-            QFrame#listsFrame, QFrame#newListFrame {
-                background-color: white;
-                border: 2px solid #85c1e9;
-                border-radius: 12px;
-            }
-            QPushButton#openListBtn {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #1a5276, stop:1 #27ae60);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-weight: bold;
-            }
-            QPushButton#openListBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #154360, stop:1 #1e8449);
-            }
-            QPushButton#openListBtn:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #0e2f44, stop:1 #196f3d);
-            }
-            QPushButton#openListBtn:disabled {
-                background-color: #bdc3c7;
-            }
-            QPushButton#addListBtn {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #1a5276, stop:1 #27ae60);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton#addListBtn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #154360, stop:1 #1e8449);
-            }
-            QPushButton#backBtn {
-                background-color: #1a5276;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton#backBtn:hover {
-                background-color: #154360;
-            }
-            QComboBox, QSpinBox {
-                border: 2px solid #85c1e9;
-                border-radius: 6px;
-                padding: 8px 12px;
-                background-color: white;
-            }
-            QComboBox:focus, QSpinBox:focus {
-                border: 2px solid #27ae60;
-            }
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-        """)
+        self.setStyleSheet(self._STYLESHEET)
     
     def open_selected_list(self):
         """Open the selected transfer list from dropdown"""
@@ -1077,6 +1593,8 @@ class RegularTransferSelectionDialog(QDialog):
                 f"This will create a new database for {month} {year}.\nContinue?",
                 QMessageBox.Yes | QMessageBox.No)
             if reply == QMessageBox.Yes:
+                # The new database must show up the next time the dialog opens
+                self.clear_cache()
                 self.selected_month = month
                 self.selected_year = year
                 self.accept()
@@ -1095,14 +1613,14 @@ class TransferDistrictDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Add to Transfer List")
         self.setMinimumWidth(400)
-        self.setFont(QFont("Calibri", 10))
+        self.setFont(_font(10))
         
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
         
         # Employee info label
         info_label = QLabel(f"Employee: {employee_name}")
-        info_label.setFont(QFont("Calibri", 11, QFont.Bold))
+        info_label.setFont(_font(11, True))
         layout.addWidget(info_label)
         
         # District selection
@@ -1149,7 +1667,7 @@ class ApplicationDetailsDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Transfer Application Details")
         self.setWindowState(Qt.WindowMaximized)  # Full screen
-        self.setFont(QFont("Calibri", 10))
+        self.setFont(_font(10))
         
         self.districts = districts or []
         self.current_district = current_district
@@ -1158,6 +1676,8 @@ class ApplicationDetailsDialog(QDialog):
             self.all_districts = [d for d in self.districts if d != current_district]
         else:
             self.all_districts = self.districts
+        # Position of each district, to keep combo items in district order
+        self._district_pos = {d: i for i, d in enumerate(self.all_districts)}
         
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
@@ -1168,7 +1688,7 @@ class ApplicationDetailsDialog(QDialog):
             title = QLabel(f"Application Details for: {employee_names[0]}")
         else:
             title = QLabel(f"Application Details for {employee_count} Employee(s)")
-        title.setFont(QFont("Calibri", 16, QFont.Bold))
+        title.setFont(_font(16, True))
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
@@ -1192,6 +1712,9 @@ class ApplicationDetailsDialog(QDialog):
         self.receipt_list.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.receipt_list.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.receipt_list.setMinimumHeight(100) # Ensure it's visible
+        self._remove_delegate = RemoveButtonDelegate(self)
+        self._remove_delegate.removeRequested.connect(self._on_remove_receipt_requested)
+        self.receipt_list.setItemDelegateForColumn(1, self._remove_delegate)
         receipt_layout.addWidget(self.receipt_list)
         
         # Add receipt row
@@ -1278,7 +1801,7 @@ class ApplicationDetailsDialog(QDialog):
         right_layout = QVBoxLayout(right_frame)
         
         pref_group = QGroupBox("District Preferences (Select up to 8 preferences in order of priority)")
-        pref_group.setFont(QFont("Calibri", 11, QFont.Bold))
+        pref_group.setFont(_font(11, True))
         pref_layout = QVBoxLayout(pref_group)
         
         if current_district:
@@ -1293,6 +1816,12 @@ class ApplicationDetailsDialog(QDialog):
         self.pref_combos = []
         self._updating_combos = False
         
+        # Coalesce bursts of selection changes (e.g. while typing) into one update
+        self._district_refresh_timer = QTimer(self)
+        self._district_refresh_timer.setSingleShot(True)
+        self._district_refresh_timer.setInterval(50)
+        self._district_refresh_timer.timeout.connect(self.update_available_districts)
+        
         for i in range(8):
             combo = SearchableComboBox()
             combo.setMinimumHeight(30)
@@ -1300,7 +1829,7 @@ class ApplicationDetailsDialog(QDialog):
             combo.addItem("")
             combo.addItems(self.all_districts)
             combo.setCurrentIndex(0)
-            combo.currentIndexChanged.connect(self.update_available_districts)
+            combo.currentIndexChanged.connect(self._schedule_district_update)
             self.pref_combos.append(combo)
             pref_form.addRow(f"Preference {i + 1}:", combo)
         
@@ -1335,11 +1864,16 @@ class ApplicationDetailsDialog(QDialog):
         
         layout.addLayout(button_layout)
         
-        # Initialize with one empty receipt row
-        self.receipts = []
+        # Receipt number -> its table item, in the order they were added
+        self.receipts = {}
+    
+    def _schedule_district_update(self, *args):
+        """Restart the short countdown to update_available_districts"""
+        self._district_refresh_timer.start()
     
     def update_available_districts(self):
         """Update each combo box to show only unselected districts"""
+        self._district_refresh_timer.stop()
         if self._updating_combos:
             return
         
@@ -1352,30 +1886,21 @@ class ApplicationDetailsDialog(QDialog):
             if text:
                 selected_districts.add(text)
         
+        # Districts not selected in any combo, computed once for all combos
+        base_allowed = [d for d in self.all_districts if d not in selected_districts]
+        
         # Update each combo box
         for combo in self.pref_combos:
             current_text = combo.currentText().strip()
             
-            # Block signals while updating
-            combo.blockSignals(True)
-            combo.clear()
-            combo.addItem("")  # Empty option
-            
-            # Add districts that are either not selected or are the current selection
-            for district in self.all_districts:
-                if district not in selected_districts or district == current_text:
-                    combo.addItem(district)
-            
-            # Restore selection
-            if current_text:
-                idx = combo.findText(current_text)
-                if idx >= 0:
-                    combo.setCurrentIndex(idx)
-            
-            # Refresh completer after items update
-            combo.refresh_completer()
-            
-            combo.blockSignals(False)
+            # Unselected districts plus this combo's own selection, in order
+            wanted = base_allowed
+            if current_text in self._district_pos:
+                wanted = base_allowed[:]
+                insort(wanted, current_text, key=self._district_pos.__getitem__)
+            if _sync_combo_items(combo, wanted):
+                # Refresh completer after items update
+                combo.refresh_completer()
         
         self._updating_combos = False
     
@@ -1389,15 +1914,16 @@ class ApplicationDetailsDialog(QDialog):
     
     def validate_and_accept(self):
         """Validate that no district is selected more than once before accepting"""
-        selected = []
-        for i, combo in enumerate(self.pref_combos):
+        seen = set()
+        for combo in self.pref_combos:
             text = combo.currentText().strip()
-            if text:
-                if text in selected:
-                    QMessageBox.warning(self, "Duplicate Selection", 
-                                       f"'{text}' is already selected as a preference. Each district can only be selected once.")
-                    return
-                selected.append(text)
+            if not text:
+                continue
+            if text in seen:
+                QMessageBox.warning(self, "Duplicate Selection", 
+                                   f"'{text}' is already selected as a preference. Each district can only be selected once.")
+                return
+            seen.add(text)
         self.accept()
     
     def add_receipt(self):
@@ -1408,38 +1934,36 @@ class ApplicationDetailsDialog(QDialog):
                 QMessageBox.warning(self, "Duplicate", "This receipt number is already added!")
                 return
             
-            self.receipts.append(receipt_num)
             row = self.receipt_list.rowCount()
             self.receipt_list.insertRow(row)
             
             # Receipt number
             item = QTableWidgetItem(receipt_num)
+            # The cell stays editable, so keep the receipt's key apart from its text
+            item.setData(Qt.UserRole, receipt_num)
             self.receipt_list.setItem(row, 0, item)
+            self.receipts[receipt_num] = item
             
-            # Remove button
-            remove_btn = QPushButton("❌")
-            remove_btn.setMaximumWidth(40)
-            remove_btn.clicked.connect(lambda checked, r=receipt_num: self.remove_receipt(r))
-            self.receipt_list.setCellWidget(row, 1, remove_btn)
+            # Remove cell, painted and handled by the column delegate
+            remove_item = QTableWidgetItem()
+            remove_item.setFlags(Qt.ItemIsEnabled)
+            self.receipt_list.setItem(row, 1, remove_item)
             
             self.receipt_input.clear()
             self.receipt_input.setFocus()
     
+    def _on_remove_receipt_requested(self, row):
+        """Remove the receipt on the row whose remove cell was clicked"""
+        item = self.receipt_list.item(row, 0)
+        if item is not None:
+            self.remove_receipt(item.data(Qt.UserRole))
+    
     def remove_receipt(self, receipt_num):
         """Remove a receipt from the list"""
-        if receipt_num in self.receipts:
-            self.receipts.remove(receipt_num)
-            # Rebuild the table
-            self.receipt_list.setRowCount(0)
-            for r in self.receipts:
-                row = self.receipt_list.rowCount()
-                self.receipt_list.insertRow(row)
-                item = QTableWidgetItem(r)
-                self.receipt_list.setItem(row, 0, item)
-                remove_btn = QPushButton("❌")
-                remove_btn.setMaximumWidth(40)
-                remove_btn.clicked.connect(lambda checked, rn=r: self.remove_receipt(rn))
-                self.receipt_list.setCellWidget(row, 1, remove_btn)
+        item = self.receipts.pop(receipt_num, None)
+        if item is not None:
+            # Drop just that row from the table
+            self.receipt_list.removeRow(item.row())
     
     def toggle_weightage_details(self, state):
         """Enable/disable weightage details based on checkbox"""
@@ -1464,7 +1988,7 @@ class ApplicationDetailsDialog(QDialog):
         weightage_priority = self.weightage_priority_combo.currentIndex() + 1 if self.weightage_check.isChecked() else 5
         
         return {
-            'receipt_numbers': ", ".join(self.receipts) if self.receipts else "",
+            'receipt_numbers': ", ".join(self.receipts),
             'application_date': self.app_date_edit.date().toString("dd-MM-yyyy"),
             'has_weightage': self.weightage_check.isChecked(),
             'weightage_priority': weightage_priority,
@@ -1475,6 +1999,492 @@ class ApplicationDetailsDialog(QDialog):
         }
 
 
+# Export libraries, imported on first use (or ahead of time by
+# _preload_export_modules) and kept here for every later export
+_openpyxl = None
+_docx = None
+_weasyprint_html = None  # weasyprint.HTML, or False when it is not available
+
+
+def _get_openpyxl():
+    """openpyxl, imported on first use"""
+    global _openpyxl
+    if _openpyxl is None:
+        import openpyxl
+        _openpyxl = openpyxl
+    return _openpyxl
+
+
+def _get_docx():
+    """python-docx with the submodules the Word export uses, imported on first use"""
+    global _docx
+    if _docx is None:
+        import docx
+        import docx.shared
+        import docx.enum.text
+        import docx.enum.table
+        import docx.enum.style
+        import docx.oxml
+        import docx.oxml.ns
+        _docx = docx
+    return _docx
+
+
+@lru_cache(maxsize=1)
+def _docx_oxml_protos():
+    """Qualified tag names and prebuilt OXML elements for the Word export, copied per use"""
+    from docx.oxml.ns import qn
+    from docx.oxml import OxmlElement
+    tab = OxmlElement('w:tab')
+    tab.set(qn('w:val'), 'left')
+    tbl_ind = OxmlElement('w:tblInd')
+    tbl_ind.set(qn('w:w'), '20')  # 20 twips = ~1pt
+    tbl_ind.set(qn('w:type'), 'dxa')
+    return {
+        'w:tabs': qn('w:tabs'),
+        'w:pos': qn('w:pos'),
+        'tabs': OxmlElement('w:tabs'),
+        'tab': tab,
+        'tblPr': OxmlElement('w:tblPr'),
+        'tblInd': tbl_ind,
+        'w:t': qn('w:t'),
+        'xml:space': qn('xml:space'),
+    }
+
+
+@lru_cache(maxsize=None)
+def _docx_pt(points):
+    """python-docx length for a point size, created once per size and shared"""
+    from docx.shared import Pt
+    return Pt(points)
+
+
+def _add_paragraph_style(doc, name, size_pt, font_name=None, bold=False, underline=False):
+    """Add a paragraph style based on Normal carrying the run formatting of its paragraphs"""
+    from docx.enum.style import WD_STYLE_TYPE
+    style = doc.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+    style.base_style = doc.styles['Normal']
+    if font_name:
+        style.font.name = font_name
+    style.font.size = _docx_pt(size_pt)
+    if bold:
+        style.font.bold = True
+    if underline:
+        style.font.underline = True
+    return style
+
+
+def _fill_table_rows(tbl, rows):
+    """Fill a <w:tbl> whose last row is a formatted template: the template <w:tr> is
+    copied per data row and only its <w:t> texts are replaced, which avoids the
+    python-docx row/cell/run proxies that re-walk the table XML on every access"""
+    oxml = _docx_oxml_protos()
+    t_tag, space = oxml['w:t'], oxml['xml:space']
+    template = tbl.tr_lst[-1]
+    tbl.remove(template)
+    for values in rows:
+        tr = deepcopy(template)
+        for t, value in zip(list(tr.iter(t_tag)), values):
+            if not value:
+                t.getparent().remove(t)
+                continue
+            if '\n' in value or '\t' in value or '\r' in value:
+                # Let the run's text setter turn line breaks and tabs into
+                # <w:br/> and <w:tab/>, exactly as cell.text does
+                t.getparent().text = value
+                continue
+            t.text = value
+            if value != value.strip():
+                t.set(space, 'preserve')
+        tbl.append(tr)
+
+
+def _get_weasyprint_html():
+    """weasyprint's HTML class when it is installed, else None; looked up once"""
+    global _weasyprint_html
+    if _weasyprint_html is None:
+        try:
+            from weasyprint import HTML
+        except (ImportError, OSError):  # OSError: Pango/Cairo libraries missing
+            HTML = False
+        _weasyprint_html = HTML
+    return _weasyprint_html or None
+
+
+def _preload_export_modules():
+    """Import the export libraries in the background; missing ones are reported on export"""
+    for loader in (_get_openpyxl, _get_docx):
+        try:
+            loader()
+        except ImportError:
+            pass
+
+
+@lru_cache(maxsize=1)
+def _excel_styles():
+    """openpyxl style objects for the Excel export, built on first use and shared"""
+    from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+    thin = Side(style='thin')
+    return {
+        'header_font': Font(bold=True, size=14),
+        'subheader_font': Font(bold=True, size=12),
+        'cadre_font': Font(bold=True, size=10),
+        'district_font': Font(bold=True, size=11),
+        'table_header_font': Font(bold=True, size=10),
+        'table_header_fill': PatternFill(start_color="D9D9D9", end_color="D9D9D9", fill_type="solid"),
+        'thin_border': Border(left=thin, right=thin, top=thin, bottom=thin),
+        'center_align': Alignment(horizontal='center', vertical='center'),
+        'left_align': Alignment(horizontal='left', vertical='center', wrap_text=True),
+        'plain_left_align': Alignment(horizontal='left'),
+    }
+
+
+def _write_bytes(path, data):
+    """Write an export that was fully serialized in memory with a single unbuffered write"""
+    with open(path, 'wb', buffering=0) as f:
+        view = memoryview(data)
+        while view:
+            written = f.write(view)
+            view = view[written:]
+
+
+def _saved_bytes(save):
+    """Serialize a workbook/document through its save() into an in-memory buffer"""
+    buffer = io.BytesIO()
+    save(buffer)
+    return buffer.getbuffer()
+
+
+# Messages for background exports: success prefix, missing library, failure prefix
+_EXPORT_MESSAGES = {
+    'excel': ("Excel file exported to",
+              "openpyxl library is required for Excel export.\n\n"
+              "Install it using:\npip install openpyxl",
+              "Failed to export Excel"),
+    'word': ("Word document exported to",
+             "python-docx library is required for Word export.\n\n"
+             "Install it using:\npip install python-docx",
+             "Failed to export Word document"),
+}
+
+
+# Fixed Malayalam text of the regular transfer order (Word export)
+_ML_TITLE = ('തിരുവനന്തപുരം, ആരോഗ്യവകുപ്പ് ഡയറക്ടറുടെ കാര്യാലയത്തിലെ\n'
+             'അഡീഷണൽ ഡയറക്ടർ (എ & റ്റി) – യുടെ നടപടിക്രമം')
+_ML_SUBJECT_LABEL = 'വിഷയം :'
+_ML_SUBJECT = 'ആ.വ. – ആ.വ.ഡ - ജൂനിയർ പബ്ലിക് ഹെൽത്ത് നഴ്‌സ് ഗ്രേഡ് 1 തസ്തികയിലെ ജീവനക്കാർക്ക് സ്ഥലംമാറ്റം അനുവദിച്ച് ഉത്തരവ് പുറപ്പെടുവിക്കുന്നു.'
+_ML_REFERENCE_LABEL = 'പരാമർശം :'
+_ML_REFERENCE = 'വിവിധ ജില്ലാ മെഡിക്കൽ ഓഫീസ് (ആരോഗ്യം) - ൽ നിന്നും ലഭ്യമായ ജൂനിയർ പബ്ലിക്ക് ഹെൽത്ത് നഴ്സ് ഗ്രേഡ് I ജീവനക്കാരുടെ അപേക്ഷകൾ.'
+_ML_BODY = 'വിവിധ ജില്ലാ മെഡിക്കൽ ഓഫീസ് (ആരോഗ്യം) - ൽ നിന്നും മേൽ പരാമർശ പ്രകാരം ലഭ്യമായ ജൂനിയർ പബ്ലിക്ക് ഹെൽത്ത് നഴ്സ് ഗ്രേഡ് I – ജീവനക്കാരുടെ സ്ഥലംമാറ്റത്തിനുള്ള അപേക്ഷകൾ പരിഗണിച്ച്, ചുവടെ ചേർക്കുന്ന ജീവനക്കാർക്ക് അവരുടെ പേരിന് നേരെ രേഖപ്പെടുത്തിയിട്ടുള്ള ജില്ലകളിലേക്ക് സ്ഥലം മാറ്റം നൽകി ഉത്തരവാകുന്നു.'
+_ML_INSTRUCTION_RELIEVE = 'ബന്ധപ്പെട്ട ജില്ലാ മെഡിക്കൽ ഓഫീസർമാർ ജീവനക്കാർക്ക് നിയമന ഉത്തരവ് നൽകേണ്ടതും നിയമന ഉത്തരവ് ലഭിച്ച ശേഷം സ്ഥാപന മേധാവികൾ ജീവനക്കാരെ വിടുതൽ ചെയ്യേണ്ടതും, ടി വിവരം യഥാസമയേ ഈ കാര്യാലയത്തിൽ റിപ്പോർട്ട് ചെയ്യേണ്ടതുമാണ്.'
+_ML_INSTRUCTION_WEBSITE = 'ആരോഗ്യവകുപ്പ് ഡയറക്ടറുടെ ഔദ്യോഗിക വെബ്സൈറ്റിൽ പ്രസിദ്ധീകരിച്ചിട്ടുള്ള ഈ ഉത്തരവിന്റെ പകർപ്പ് ഔദ്യോഗിക രേഖയായി ഉപയോഗിക്കാവുന്നതാണ്.'
+_ML_RECIPIENT_LABEL = 'സ്വീകർത്താവ്'
+_ML_RECIPIENTS = 'ബന്ധപ്പെട്ട ജില്ലാ മെഡിക്കൽ ഓഫീസർ (ആരോഗ്യം) മാർ'
+_ML_COPY_LABEL = 'പകർപ്പ്:'
+_ML_COPY_WEBSITE = '1. ആരോഗ്യവകുപ്പ് ഡയറക്ടറുടെ ഔദ്യോഗിക വെബ്സൈറ്റ്'
+_ML_COPY_FILE = '2. ഫയൽ/കരുതൽ ഫയൽ'
+
+
+# Rendered transfer list HTML keyed on everything that goes into it, so
+# reopening the preview for the same list reuses the previous render
+_HTML_CACHE = {}
+_HTML_CACHE_SIZE = 32
+_HTML_ROW_FIELDS = ('pen', 'name', 'designation', 'institution', 'from_district',
+                    'to_district', 'weightage', 'weightage_details')
+
+
+# Static parts of the transfer list HTML. Only the order number, page
+# count and table rows change between renders, so these are built once.
+_REGULAR_HTML_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <style>
+        @page {
+            size: A4 portrait;
+            margin: 1in;
+        }
+        @font-face {
+            font-family: 'MANDARAM';
+            src: url('mandaram.ttf');
+        }
+        body {
+            font-family: 'MANDARAM', 'Noto Sans Malayalam', 'Manjari', Arial, sans-serif;
+            font-size: 14pt;
+            margin: 30px;
+            line-height: 1.15;
+        }
+        .header {
+            text-align: center;
+            margin-bottom: 12pt;
+        }
+        .header-text {
+            font-size: 17pt;
+            font-weight: bold;
+            text-decoration: underline;
+            line-height: 1.15;
+        }
+        .order-info {
+            text-align: center;
+            margin-top: 12pt;
+            margin-bottom: 12pt;
+            font-size: 16pt;
+            font-weight: bold;
+            text-decoration: underline;
+        }
+        .subject-table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-top: 12pt;
+            margin-bottom: 0;
+        }
+        .subject-table td {
+            padding: 6pt 8pt;
+            vertical-align: top;
+            font-size: 14pt;
+            border: none;
+        }
+        .subject-table td:first-child {
+            width: 85px;
+            white-space: nowrap;
+        }
+        .subject-table td:last-child {
+            text-align: justify;
+        }
+        .body-text {
+            text-align: justify;
+            margin-top: 12pt;
+            margin-bottom: 12pt;
+            text-indent: 36pt;
+            font-size: 14pt;
+            line-height: 1.15;
+        }
+        table.data-table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 12pt auto;
+        }
+        table.data-table th, table.data-table td {
+            border: 1px solid black;
+            padding: 6pt 8pt;
+            font-size: 14pt;
+        }
+        table.data-table th {
+            text-align: center;
+            font-weight: normal;
+        }
+        table.data-table td {
+            text-align: justify;
+        }
+        .signature {
+            margin-top: 24pt;
+            margin-left: 55%;
+        }
+        .signature p {
+            margin: 0;
+            font-weight: bold;
+            font-size: 14pt;
+        }
+        .recipients {
+            margin-top: 12pt;
+        }
+        .recipients p {
+            margin-top: 12pt;
+            margin-bottom: 6pt;
+            font-size: 14pt;
+        }
+        .indent {
+            margin-left: 36pt;
+        }
+        .bold {
+            font-weight: bold;
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <span class="header-text">തിരുവനന്തപുരം, ആരോഗ്യവകുപ്പ് ഡയറക്ടറുടെ കാര്യാലയത്തിലെ<br>അഡീഷണൽ ഡയറക്ടർ (എ & റ്റി) – യുടെ നടപടിക്രമം</span>
+    </div>
+    
+    <table class="subject-table">
+        <tr>
+            <td style="text-align: right;">വിഷയം :</td>
+            <td>ആ.വ. – ആ.വ.ഡ - ജൂനിയർ പബ്ലിക് ഹെൽത്ത് നഴ്‌സ് ഗ്രേഡ് 1 തസ്തികയിലെ ജീവനക്കാർക്ക് സ്ഥലംമാറ്റം അനുവദിച്ച് ഉത്തരവ് പുറപ്പെടുവിക്കുന്നു.</td>
+        </tr>
+        <tr>
+            <td style="text-align: right;">പരാമർശം :</td>
+            <td>വിവിധ ജില്ലാ മെഡിക്കൽ ഓഫീസ് (ആരോഗ്യം) - ൽ നിന്നും ലഭ്യമായ ജൂനിയർ പബ്ലിക്ക് ഹെൽത്ത് നഴ്സ് ഗ്രേഡ് I ജീവനക്കാരുടെ അപേക്ഷകൾ.</td>
+        </tr>
+    </table>
+    
+"""
+
+_REGULAR_HTML_TABLE_HEAD = """
+    
+    <p class="body-text">
+        വിവിധ ജില്ലാ മെഡിക്കൽ ഓഫീസ് (ആരോഗ്യം) - ൽ നിന്നും മേൽ പരാമർശ പ്രകാരം ലഭ്യമായ ജൂനിയർ പബ്ലിക്ക് ഹെൽത്ത് നഴ്സ് ഗ്രേഡ് I – ജീവനക്കാരുടെ സ്ഥലംമാറ്റത്തിനുള്ള അപേക്ഷകൾ പരിഗണിച്ച്, ചുവടെ ചേർക്കുന്ന ജീവനക്കാർക്ക് അവരുടെ പേരിന് നേരെ രേഖപ്പെടുത്തിയിട്ടുള്ള ജില്ലകളിലേക്ക് സ്ഥലം മാറ്റം നൽകി ഉത്തരവാകുന്നു.
+    </p>
+    
+    <table class="data-table">
+        <tr>
+            <th style="width: 6%;">Sl. No.</th>
+            <th style="width: 10%;">PEN</th>
+            <th style="width: 22%;">Name</th>
+            <th style="width: 24%;">Present Institution</th>
+            <th style="width: 19%;">Present District</th>
+            <th style="width: 19%;">Allotted District</th>
+        </tr>
+"""
+
+_REGULAR_HTML_FOOTER = """
+    </table>
+    
+    <p class="body-text">
+        ബന്ധപ്പെട്ട ജില്ലാ മെഡിക്കൽ ഓഫീസർമാർ ജീവനക്കാർക്ക് നിയമന ഉത്തരവ് നൽകേണ്ടതും നിയമന ഉത്തരവ് ലഭിച്ച ശേഷം സ്ഥാപന മേധാവികൾ ജീവനക്കാരെ വിടുതൽ ചെയ്യേണ്ടതും, ടി വിവരം യഥാസമയേ ഈ കാര്യാലയത്തിൽ റിപ്പോർട്ട് ചെയ്യേണ്ടതുമാണ്.
+    </p>
+    
+    <p class="body-text">
+        ആരോഗ്യവകുപ്പ് ഡയറക്ടറുടെ ഔദ്യോഗിക വെബ്സൈറ്റിൽ പ്രസിദ്ധീകരിച്ചിട്ടുള്ള ഈ ഉത്തരവിന്റെ പകർപ്പ് ഔദ്യോഗിക രേഖയായി ഉപയോഗിക്കാവുന്നതാണ്.
+    </p>
+    
+    <div class="signature">
+        <p>#ApprovedByName#</p>
+        <p>#ApprovedByDesignation#</p>
+    </div>
+    
+    <div class="recipients">
+        <p>സ്വീകർത്താവ്</p>
+        <p class="indent bold">ബന്ധപ്പെട്ട ജില്ലാ മെഡിക്കൽ ഓഫീസർ (ആരോഗ്യം) മാർ</p>
+        
+        <p>പകർപ്പ്:</p>
+        <p class="indent">1. ആരോഗ്യവകുപ്പ് ഡയറക്ടറുടെ ഔദ്യോഗിക വെബ്സൈറ്റ്</p>
+        <p class="indent">2. ഫയൽ/കരുതൽ ഫയൽ</p>
+    </div>
+</body>
+</html>
+"""
+
+_REGULAR_ROW_TMPL = """
+        <tr>
+            <td style="text-align: center;">{sl}</td>
+            <td>{pen}</td>
+            <td>{name}</td>
+            <td>{institution}</td>
+            <td>{from_district_u}</td>
+            <td>{to_district_u}</td>
+        </tr>
+"""
+
+_GENERAL_HTML_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        @page {
+            size: A4 landscape;
+            margin: 0.5in;
+        }
+        body {
+            font-family: "Times New Roman", Times, serif;
+            font-size: 12pt;
+            margin: 20px;
+        }
+        .header {
+            text-align: center;
+            margin-bottom: 20px;
+        }
+        .header h2 {
+            margin: 5px 0;
+            font-size: 14pt;
+            font-weight: bold;
+        }
+        .header h3 {
+            margin: 5px 0;
+            font-size: 12pt;
+            font-weight: bold;
+        }
+        .header h4 {
+            margin: 5px 0;
+            font-size: 12pt;
+            font-weight: bold;
+            text-decoration: underline;
+        }
+        .post-cadre {
+            margin: 15px 0;
+            font-weight: bold;
+            font-size: 10pt;
+        }
+        .district-header {
+            margin: 15px 0 10px 0;
+            font-weight: bold;
+            font-size: 11pt;
+        }
+        table.data-table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-bottom: 15px;
+        }
+        table.data-table th, table.data-table td {
+            border: 1px solid black;
+            padding: 5px 6px;
+            font-size: 10pt;
+        }
+        table.data-table th {
+            text-align: center;
+            font-weight: bold;
+            background-color: #f0f0f0;
+        }
+        table.data-table td {
+            text-align: left;
+        }
+        .page-info {
+            text-align: right;
+            font-size: 10pt;
+            margin-bottom: 10px;
+        }
+    </style>
+</head>
+<body>
+"""
+
+_GENERAL_HTML_INTRO = """
+    
+    <div class="header">
+        <h2>Government of Kerala</h2>
+        <h3>Department: Health Services</h3>
+        <h4>Norms Based General Transfer for Junior Public Health Nurse Gr. I</h4>
+    </div>
+    
+    <div class="post-cadre">Post/Cadre Name: Junior Public Health Nurse</div>
+"""
+
+_GENERAL_ROW_TMPL = """
+        <tr>
+            <td style="text-align: center;">{sl}</td>
+            <td>{pen}</td>
+            <td>{name}</td>
+            <td>{designation}</td>
+            <td>{institution}</td>
+            <td>{from_district}</td>
+            <td>{to_district}</td>
+            <td>{protection}</td>
+        </tr>
+"""
+
+_GENERAL_HTML_FOOTER = """
+    <br><br>
+    <div style="margin-top: 30px;">
+        <div style="text-align: right; margin-right: 50px;">
+            <p>_________________________</p>
+            <p><strong>Authorized Signatory</strong></p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
 class TransferListPreviewDialog(QDialog):
     """Dialog for previewing and printing the transfer list in official format"""
     
@@ -1482,13 +2492,44 @@ class TransferListPreviewDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Transfer List Preview - Government of Kerala")
         self.setMinimumSize(900, 700)
-        self.setFont(QFont("Calibri", 10))
+        self.setFont(_font(10))
         
-        self.transfer_data = transfer_data or []
+        transfer_data = transfer_data or []
         self.districts = districts or []
         self.transfer_type = transfer_type
         self.order_number = order_number
         
+        # Warm up openpyxl/python-docx off the GUI thread so the first export doesn't stall
+        threading.Thread(target=_preload_export_modules, daemon=True).start()
+        
+        # Upper-case each distinct district name once; the Malayalam exports and
+        # the general district headings show them in capitals. The rows are
+        # shallow copies so the caller's dicts are left as they were
+        district_names = {row['from_district'] for row in transfer_data}
+        district_names.update(row['to_district'] for row in transfer_data)
+        self._upper_districts = {district: (district or "").upper() for district in district_names}
+        self.transfer_data = [
+            dict(row,
+                 from_district_u=self._upper_districts[row['from_district']],
+                 to_district_u=self._upper_districts[row['to_district']])
+            for row in transfer_data
+        ]
+        
+        # Exports currently running on the thread pool, by kind, and the
+        # state of an Export All batch (kinds still running, files written)
+        self._export_tasks = {}
+        self._batch_pending = set()
+        self._batch_files = []
+        self._batch_errors = []
+        
+        # Rows grouped by from_district, shared by the general transfer exports
+        self._district_groups = self._group_by_from_district()
+        # Districts that have rows, in the fixed district order the exports follow
+        self._district_order = [district for district in self.districts if district in self._district_groups]
+        
+        # Rough page count for the general list header (about 15 rows per page)
+        self._total_pages = max(1, (len(self.transfer_data) // 15) + 1)
+        
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
         
@@ -1519,6 +2560,10 @@ class TransferListPreviewDialog(QDialog):
         self.export_word_btn.clicked.connect(self.export_to_word)
         toolbar_layout.addWidget(self.export_word_btn)
         
+        self.export_all_btn = QPushButton("📦 Export All")
+        self.export_all_btn.clicked.connect(self.export_all)
+        toolbar_layout.addWidget(self.export_all_btn)
+        
         toolbar_layout.addStretch()
         
         self.close_btn = QPushButton("Close")
@@ -1532,314 +2577,77 @@ class TransferListPreviewDialog(QDialog):
         
         layout.addLayout(toolbar_layout)
         
+        # Buttons of the exports that run on the thread pool, by kind
+        self._export_buttons = {'excel': self.export_excel_btn, 'word': self.export_word_btn}
+        
         # Preview area
         self.preview_browser = QTextBrowser()
         self.preview_browser.setOpenExternalLinks(False)
-        self.preview_browser.setFont(QFont("Times New Roman", 11))
+        self.preview_browser.setFont(_font(11, family="Times New Roman"))
         layout.addWidget(self.preview_browser)
         
         # Generate the HTML content
         self.html_content = self.generate_html()
         self.preview_browser.setHtml(self.html_content)
+        self._preview_html = self.html_content
+        
+        # Copy of the preview document for printing and PDF export, made on first use
+        self._print_doc = None
+        self._print_doc_html = None
+    
+    def _group_by_from_district(self):
+        """Group the transfer rows by from_district, keeping their order"""
+        groups = defaultdict(list)
+        for row in self.transfer_data:
+            groups[row['from_district']].append(row)
+        return dict(groups)
     
     def generate_html(self):
-        """Generate HTML content for the transfer list"""
-        if self.transfer_type == "regular":
-            return self._generate_regular_transfer_html()
-        else:
-            return self._generate_general_transfer_html()
+        """Generate HTML content for the transfer list, reusing an identical earlier render"""
+        key = (self.transfer_type, self.order_number, tuple(self.districts),
+               tuple(tuple(row.get(field) for field in _HTML_ROW_FIELDS) for row in self.transfer_data))
+        html = _HTML_CACHE.get(key)
+        if html is None:
+            if self.transfer_type == "regular":
+                html = self._generate_regular_transfer_html()
+            else:
+                html = self._generate_general_transfer_html()
+            if len(_HTML_CACHE) >= _HTML_CACHE_SIZE:
+                _HTML_CACHE.pop(next(iter(_HTML_CACHE)))  # drop the oldest render
+            _HTML_CACHE[key] = html
+        return html
     
     def _generate_regular_transfer_html(self):
         """Generate HTML for Regular Transfer in Malayalam format - matching Word template exactly"""
-        total_records = len(self.transfer_data)
-        
-        html = f'''
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                @page {{
-                    size: A4 portrait;
-                    margin: 1in;
-                }}
-                @font-face {{
-                    font-family: 'MANDARAM';
-                    src: url('mandaram.ttf');
-                }}
-                body {{
-                    font-family: 'MANDARAM', 'Noto Sans Malayalam', 'Manjari', Arial, sans-serif;
-                    font-size: 14pt;
-                    margin: 30px;
-                    line-height: 1.15;
-                }}
-                .header {{
-                    text-align: center;
-                    margin-bottom: 12pt;
-                }}
-                .header-text {{
-                    font-size: 17pt;
-                    font-weight: bold;
-                    text-decoration: underline;
-                    line-height: 1.15;
-                }}
-                .order-info {{
-                    text-align: center;
-                    margin-top: 12pt;
-                    margin-bottom: 12pt;
-                    font-size: 16pt;
-                    font-weight: bold;
-                    text-decoration: underline;
-                }}
-                .subject-table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin-top: 12pt;
-                    margin-bottom: 0;
-                }}
-                .subject-table td {{
-                    padding: 6pt 8pt;
-                    vertical-align: top;
-                    font-size: 14pt;
-                    border: none;
-                }}
-                .subject-table td:first-child {{
-                    width: 85px;
-                    white-space: nowrap;
-                }}
-                .subject-table td:last-child {{
-                    text-align: justify;
-                }}
-                .body-text {{
-                    text-align: justify;
-                    margin-top: 12pt;
-                    margin-bottom: 12pt;
-                    text-indent: 36pt;
-                    font-size: 14pt;
-                    line-height: 1.15;
-                }}
-                table.data-table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin: 12pt auto;
-                }}
-                table.data-table th, table.data-table td {{
-                    border: 1px solid black;
-                    padding: 6pt 8pt;
-                    font-size: 14pt;
-                }}
-                table.data-table th {{
-                    text-align: center;
-                    font-weight: normal;
-                }}
-                table.data-table td {{
-                    text-align: justify;
-                }}
-                .signature {{
-                    margin-top: 24pt;
-                    margin-left: 55%;
-                }}
-                .signature p {{
-                    margin: 0;
-                    font-weight: bold;
-                    font-size: 14pt;
-                }}
-                .recipients {{
-                    margin-top: 12pt;
-                }}
-                .recipients p {{
-                    margin-top: 12pt;
-                    margin-bottom: 6pt;
-                    font-size: 14pt;
-                }}
-                .indent {{
-                    margin-left: 36pt;
-                }}
-                .bold {{
-                    font-weight: bold;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <span class="header-text">തിരുവനന്തപുരം, ആരോഗ്യവകുപ്പ് ഡയറക്ടറുടെ കാര്യാലയത്തിലെ<br>അഡീഷണൽ ഡയറക്ടർ (എ & റ്റി) – യുടെ നടപടിക്രമം</span>
-            </div>
-            
-            <table class="subject-table">
-                <tr>
-                    <td style="text-align: right;">വിഷയം :</td>
-                    <td>ആ.വ. – ആ.വ.ഡ - ജൂനിയർ പബ്ലിക് ഹെൽത്ത് നഴ്‌സ് ഗ്രേഡ് 1 തസ്തികയിലെ ജീവനക്കാർക്ക് സ്ഥലംമാറ്റം അനുവദിച്ച് ഉത്തരവ് പുറപ്പെടുവിക്കുന്നു.</td>
-                </tr>
-                <tr>
-                    <td style="text-align: right;">പരാമർശം :</td>
-                    <td>വിവിധ ജില്ലാ മെഡിക്കൽ ഓഫീസ് (ആരോഗ്യം) - ൽ നിന്നും ലഭ്യമായ ജൂനിയർ പബ്ലിക്ക് ഹെൽത്ത് നഴ്സ് ഗ്രേഡ് I ജീവനക്കാരുടെ അപേക്ഷകൾ.</td>
-                </tr>
-            </table>
-            
+        order_info = f'''
             <div class="order-info">
                 ഉത്തരവ് നം. {self.order_number}, തീയതി: #ApprovedDate#
             </div>
-            
-            <p class="body-text">
-                വിവിധ ജില്ലാ മെഡിക്കൽ ഓഫീസ് (ആരോഗ്യം) - ൽ നിന്നും മേൽ പരാമർശ പ്രകാരം ലഭ്യമായ ജൂനിയർ പബ്ലിക്ക് ഹെൽത്ത് നഴ്സ് ഗ്രേഡ് I – ജീവനക്കാരുടെ സ്ഥലംമാറ്റത്തിനുള്ള അപേക്ഷകൾ പരിഗണിച്ച്, ചുവടെ ചേർക്കുന്ന ജീവനക്കാർക്ക് അവരുടെ പേരിന് നേരെ രേഖപ്പെടുത്തിയിട്ടുള്ള ജില്ലകളിലേക്ക് സ്ഥലം മാറ്റം നൽകി ഉത്തരവാകുന്നു.
-            </p>
-            
-            <table class="data-table">
-                <tr>
-                    <th style="width: 6%;">Sl. No.</th>
-                    <th style="width: 10%;">PEN</th>
-                    <th style="width: 22%;">Name</th>
-                    <th style="width: 24%;">Present Institution</th>
-                    <th style="width: 19%;">Present District</th>
-                    <th style="width: 19%;">Allotted District</th>
-                </tr>
         '''
+        parts = [_REGULAR_HTML_HEAD, order_info, _REGULAR_HTML_TABLE_HEAD]
         
-        for idx, row in enumerate(self.transfer_data):
-            html += f'''
-                <tr>
-                    <td style="text-align: center;">{idx + 1}</td>
-                    <td>{row['pen']}</td>
-                    <td>{row['name']}</td>
-                    <td>{row['institution']}</td>
-                    <td>{row['from_district'].upper()}</td>
-                    <td>{row['to_district'].upper()}</td>
-                </tr>
-            '''
+        rows_meta = [dict(row, sl=sl) for sl, row in enumerate(self.transfer_data, start=1)]
+        parts.extend(map(_REGULAR_ROW_TMPL.format_map, rows_meta))
         
-        html += '''
-            </table>
-            
-            <p class="body-text">
-                ബന്ധപ്പെട്ട ജില്ലാ മെഡിക്കൽ ഓഫീസർമാർ ജീവനക്കാർക്ക് നിയമന ഉത്തരവ് നൽകേണ്ടതും നിയമന ഉത്തരവ് ലഭിച്ച ശേഷം സ്ഥാപന മേധാവികൾ ജീവനക്കാരെ വിടുതൽ ചെയ്യേണ്ടതും, ടി വിവരം യഥാസമയേ ഈ കാര്യാലയത്തിൽ റിപ്പോർട്ട് ചെയ്യേണ്ടതുമാണ്.
-            </p>
-            
-            <p class="body-text">
-                ആരോഗ്യവകുപ്പ് ഡയറക്ടറുടെ ഔദ്യോഗിക വെബ്സൈറ്റിൽ പ്രസിദ്ധീകരിച്ചിട്ടുള്ള ഈ ഉത്തരവിന്റെ പകർപ്പ് ഔദ്യോഗിക രേഖയായി ഉപയോഗിക്കാവുന്നതാണ്.
-            </p>
-            
-            <div class="signature">
-                <p>#ApprovedByName#</p>
-                <p>#ApprovedByDesignation#</p>
-            </div>
-            
-            <div class="recipients">
-                <p>സ്വീകർത്താവ്</p>
-                <p class="indent bold">ബന്ധപ്പെട്ട ജില്ലാ മെഡിക്കൽ ഓഫീസർ (ആരോഗ്യം) മാർ</p>
-                
-                <p>പകർപ്പ്:</p>
-                <p class="indent">1. ആരോഗ്യവകുപ്പ് ഡയറക്ടറുടെ ഔദ്യോഗിക വെബ്സൈറ്റ്</p>
-                <p class="indent">2. ഫയൽ/കരുതൽ ഫയൽ</p>
-            </div>
-        </body>
-        </html>
-        '''
+        parts.append(_REGULAR_HTML_FOOTER)
         
-        return html
+        return "".join(parts)
     
     def _generate_general_transfer_html(self):
         """Generate HTML for General Transfer in English format - matching Word template"""
-        # Group data by From District
-        district_groups = {}
-        for row in self.transfer_data:
-            from_district = row['from_district']
-            if from_district not in district_groups:
-                district_groups[from_district] = []
-            district_groups[from_district].append(row)
-        
-        # Calculate total pages (roughly)
-        total_records = len(self.transfer_data)
-        
-        html = f'''
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                @page {{
-                    size: A4 landscape;
-                    margin: 0.5in;
-                }}
-                body {{
-                    font-family: "Times New Roman", Times, serif;
-                    font-size: 12pt;
-                    margin: 20px;
-                }}
-                .header {{
-                    text-align: center;
-                    margin-bottom: 20px;
-                }}
-                .header h2 {{
-                    margin: 5px 0;
-                    font-size: 14pt;
-                    font-weight: bold;
-                }}
-                .header h3 {{
-                    margin: 5px 0;
-                    font-size: 12pt;
-                    font-weight: bold;
-                }}
-                .header h4 {{
-                    margin: 5px 0;
-                    font-size: 12pt;
-                    font-weight: bold;
-                    text-decoration: underline;
-                }}
-                .post-cadre {{
-                    margin: 15px 0;
-                    font-weight: bold;
-                    font-size: 10pt;
-                }}
-                .district-header {{
-                    margin: 15px 0 10px 0;
-                    font-weight: bold;
-                    font-size: 11pt;
-                }}
-                table.data-table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin-bottom: 15px;
-                }}
-                table.data-table th, table.data-table td {{
-                    border: 1px solid black;
-                    padding: 5px 6px;
-                    font-size: 10pt;
-                }}
-                table.data-table th {{
-                    text-align: center;
-                    font-weight: bold;
-                    background-color: #f0f0f0;
-                }}
-                table.data-table td {{
-                    text-align: left;
-                }}
-                .page-info {{
-                    text-align: right;
-                    font-size: 10pt;
-                    margin-bottom: 10px;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="page-info">Page 1 of {max(1, (total_records // 15) + 1)}</div>
-            
-            <div class="header">
-                <h2>Government of Kerala</h2>
-                <h3>Department: Health Services</h3>
-                <h4>Norms Based General Transfer for Junior Public Health Nurse Gr. I</h4>
-            </div>
-            
-            <div class="post-cadre">Post/Cadre Name: Junior Public Health Nurse</div>
+        district_groups = self._district_groups
+        
+        page_info = f'''
+            <div class="page-info">Page 1 of {self._total_pages}</div>
         '''
+        parts = [_GENERAL_HTML_HEAD, page_info, _GENERAL_HTML_INTRO]
         
         sl_no = 1
-        for district in self.districts:
-            if district not in district_groups:
-                continue
-            
+        for district in self._district_order:
             records = district_groups[district]
             
-            html += f'''
-            <div class="district-header">District: {district.upper()}</div>
+            parts.append(f'''
+            <div class="district-header">District: {self._upper_districts[district]}</div>
             <table class="data-table">
                 <tr>
                     <th style="width: 5%;">Sl. No.</th>
@@ -1851,57 +2659,46 @@ class TransferListPreviewDialog(QDialog):
                     <th style="width: 11%;">To District</th>
                     <th style="width: 13%;">Protection If Any</th>
                 </tr>
-            '''
-            
-            for row in records:
-                protection = ""
-                if row.get('weightage') == 'Yes' and row.get('weightage_details'):
-                    protection = row['weightage_details']
-                
-                html += f'''
-                <tr>
-                    <td style="text-align: center;">{sl_no}</td>
-                    <td>{row['pen']}</td>
-                    <td>{row['name']}</td>
-                    <td>{row['designation']}</td>
-                    <td>{row['institution']}</td>
-                    <td>{row['from_district']}</td>
-                    <td>{row['to_district']}</td>
-                    <td>{protection}</td>
-                </tr>
-                '''
-                sl_no += 1
+            ''')
             
-            html += '</table>'
-        
-        html += '''
-            <br><br>
-            <div style="margin-top: 30px;">
-                <div style="text-align: right; margin-right: 50px;">
-                    <p>_________________________</p>
-                    <p><strong>Authorized Signatory</strong></p>
-                </div>
-            </div>
-        </body>
-        </html>
-        '''
-        
-        return html
+            rows_meta = [dict(row, sl=sl,
+                              protection=(row['weightage_details']
+                                          if row.get('weightage') == 'Yes' and row.get('weightage_details')
+                                          else ""))
+                         for sl, row in enumerate(records, start=sl_no)]
+            parts.extend(map(_GENERAL_ROW_TMPL.format_map, rows_meta))
+            sl_no += len(records)
+            
+            parts.append('</table>')
+        
+        parts.append(_GENERAL_HTML_FOOTER)
+        
+        return "".join(parts)
+    
+    def _get_print_document(self):
+        """QTextDocument for print/PDF output, cloned from the already parsed preview"""
+        if self._print_doc is None or self._print_doc_html is not self.html_content:
+            if self._preview_html is not self.html_content:
+                self.preview_browser.setHtml(self.html_content)
+                self._preview_html = self.html_content
+            # Cloning copies the parsed blocks and formats without reparsing the HTML.
+            # Print with the application font, not the preview widget's font.
+            self._print_doc = self.preview_browser.document().clone(self)
+            self._print_doc.setDefaultFont(QApplication.font())
+            self._print_doc_html = self.html_content
+        return self._print_doc
     
     def print_document(self):
         """Print the transfer list"""
+        # Print support loads the platform print drivers, so import on demand
+        from PySide6.QtPrintSupport import QPrinter, QPrintDialog
+        
         printer = QPrinter(QPrinter.HighResolution)
-        printer.setPageSize(QPageSize(QPageSize.A4))
-        if self.transfer_type == "regular":
-            printer.setPageOrientation(QPageLayout.Orientation.Portrait)
-        else:
-            printer.setPageOrientation(QPageLayout.Orientation.Landscape)
+        _setup_a4_printer(printer, landscape=self.transfer_type != "regular")
         
         dialog = QPrintDialog(printer, self)
         if dialog.exec() == QDialog.Accepted:
-            document = QTextDocument()
-            document.setHtml(self.html_content)
-            document.print_(printer)
+            self._get_print_document().print_(printer)
     
     def export_to_pdf(self):
         """Export to PDF file"""
@@ -1912,21 +2709,37 @@ class TransferListPreviewDialog(QDialog):
         )
         
         if file_path:
+            try:
+                self._write_pdf(file_path)
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to export PDF:\n{str(e)}")
+                return
+            QMessageBox.information(self, "Success", f"PDF exported to:\n{file_path}")
+    
+    def _write_pdf(self, file_path):
+        """Write the PDF with weasyprint, or with QPrinter when it is not available"""
+        if not self._write_pdf_weasyprint(file_path):
+            from PySide6.QtPrintSupport import QPrinter
+            
             printer = QPrinter(QPrinter.HighResolution)
             printer.setOutputFormat(QPrinter.PdfFormat)
             printer.setOutputFileName(file_path)
-            printer.setPageSize(QPageSize(QPageSize.A4))
-            if self.transfer_type == "regular":
-                printer.setPageOrientation(QPageLayout.Orientation.Portrait)
-            else:
-                printer.setPageOrientation(QPageLayout.Orientation.Landscape)
-            
-            document = QTextDocument()
-            document.setHtml(self.html_content)
-            document.setHtml(self.html_content)
-            document.print_(printer)
+            _setup_a4_printer(printer, landscape=self.transfer_type != "regular")
             
-            QMessageBox.information(self, "Success", f"PDF exported to:\n{file_path}")
+            self._get_print_document().print_(printer)
+    
+    def _write_pdf_weasyprint(self, file_path):
+        """Render the PDF with weasyprint when available; False means use the QPrinter path"""
+        html_renderer = _get_weasyprint_html()
+        if html_renderer is None:
+            return False
+        try:
+            # base_url lets the stylesheet find mandaram.ttf next to the app
+            pdf = html_renderer(string=self.html_content, base_url=resource_path('')).write_pdf()
+        except (ImportError, OSError):  # weasyprint's native libraries could not be loaded
+            return False
+        _write_bytes(file_path, pdf)
+        return True
     
     def export_to_html(self):
         """Export to HTML file"""
@@ -1937,8 +2750,7 @@ class TransferListPreviewDialog(QDialog):
         )
         
         if file_path:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(self.html_content)
+            _write_bytes(file_path, self.html_content.encode('utf-8'))
             QMessageBox.information(self, "Success", f"HTML exported to:\n{file_path}")
     
     def export_to_excel(self):
@@ -1950,126 +2762,182 @@ class TransferListPreviewDialog(QDialog):
         )
         
         if file_path:
-            try:
-                import openpyxl
-                from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
-                
-                wb = openpyxl.Workbook()
-                ws = wb.active
-                ws.title = "Transfer List"
-                
-                # Set column widths
-                ws.column_dimensions['A'].width = 8   # Sl. No.
-                ws.column_dimensions['B'].width = 12  # PEN
-                ws.column_dimensions['C'].width = 25  # Name
-                ws.column_dimensions['D'].width = 20  # Designation
-                ws.column_dimensions['E'].width = 35  # Office
-                ws.column_dimensions['F'].width = 18  # From District
-                ws.column_dimensions['G'].width = 18  # To District
-                ws.column_dimensions['H'].width = 20  # Protection
-                
-                # Styles
-                header_font = Font(bold=True, size=14)
-                subheader_font = Font(bold=True, size=12)
-                district_font = Font(bold=True, size=11)
-                table_header_font = Font(bold=True, size=10)
-                table_header_fill = PatternFill(start_color="D9D9D9", end_color="D9D9D9", fill_type="solid")
-                thin_border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-                center_align = Alignment(horizontal='center', vertical='center')
-                left_align = Alignment(horizontal='left', vertical='center', wrap_text=True)
-                
-                # Header
-                ws.merge_cells('A1:H1')
-                ws['A1'] = 'Government of Kerala'
-                ws['A1'].font = header_font
-                ws['A1'].alignment = center_align
-                
-                ws.merge_cells('A2:H2')
-                ws['A2'] = 'Department: Health Services'
-                ws['A2'].font = subheader_font
-                ws['A2'].alignment = center_align
-                
-                ws.merge_cells('A3:H3')
-                ws['A3'] = 'Norms Based General Transfer for Junior Public Health Nurse Gr. I'
-                ws['A3'].font = subheader_font
-                ws['A3'].alignment = center_align
-                
-                ws.merge_cells('A4:H4')
-                ws['A4'] = 'Post/Cadre Name: Junior Public Health Nurse'
-                ws['A4'].font = Font(bold=True, size=10)
-                ws['A4'].alignment = Alignment(horizontal='left')
-                
-                row_num = 6
-                sl_no = 1
-                
-                # Group data by district
-                district_groups = {}
-                for row in self.transfer_data:
-                    from_district = row['from_district']
-                    if from_district not in district_groups:
-                        district_groups[from_district] = []
-                    district_groups[from_district].append(row)
-                
-                headers = ['Sl. No.', 'PEN', 'Name', 'Designation', 'Office Transferred from', 
-                          'From District', 'To District', 'Protection If Any']
-                
-                for district in self.districts:
-                    if district not in district_groups:
-                        continue
-                    
-                    records = district_groups[district]
-                    
-                    # District header
-                    ws.merge_cells(f'A{row_num}:H{row_num}')
-                    ws[f'A{row_num}'] = f'District: {district.upper()}'
-                    ws[f'A{row_num}'].font = district_font
-                    row_num += 1
-                    
-                    # Table headers
-                    for col_num, header in enumerate(headers, 1):
-                        cell = ws.cell(row=row_num, column=col_num, value=header)
-                        cell.font = table_header_font
-                        cell.fill = table_header_fill
-                        cell.border = thin_border
-                        cell.alignment = center_align
-                    row_num += 1
-                    
-                    # Data rows
-                    for record in records:
-                        protection = ""
-                        if record.get('weightage') == 'Yes' and record.get('weightage_details'):
-                            protection = record['weightage_details']
-                        
-                        data = [sl_no, record['pen'], record['name'], record['designation'],
-                               record['institution'], record['from_district'], record['to_district'], protection]
-                        
-                        for col_num, value in enumerate(data, 1):
-                            cell = ws.cell(row=row_num, column=col_num, value=value)
-                            cell.border = thin_border
-                            if col_num == 1:
-                                cell.alignment = center_align
-                            else:
-                                cell.alignment = left_align
-                        
-                        sl_no += 1
-                        row_num += 1
-                    
-                    row_num += 1  # Empty row between districts
-                
-                wb.save(file_path)
-                QMessageBox.information(self, "Success", f"Excel file exported to:\n{file_path}")
+            self._start_export('excel', self._write_excel, file_path)
+    
+    def _write_excel(self, file_path):
+        """Build and save the Excel workbook; runs on a worker thread
+        
+        The workbook is write-only, so each row is streamed out as it is
+        appended instead of every cell being kept in memory until the save.
+        """
+        openpyxl = _get_openpyxl()
+        from openpyxl.cell import WriteOnlyCell
+        styles = _excel_styles()
+        
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Transfer List")
+        
+        # Set column widths (before any row is written)
+        ws.column_dimensions['A'].width = 8   # Sl. No.
+        ws.column_dimensions['B'].width = 12  # PEN
+        ws.column_dimensions['C'].width = 25  # Name
+        ws.column_dimensions['D'].width = 20  # Designation
+        ws.column_dimensions['E'].width = 35  # Office
+        ws.column_dimensions['F'].width = 18  # From District
+        ws.column_dimensions['G'].width = 18  # To District
+        ws.column_dimensions['H'].width = 20  # Protection
+        
+        # Styles
+        header_font = styles['header_font']
+        subheader_font = styles['subheader_font']
+        district_font = styles['district_font']
+        table_header_font = styles['table_header_font']
+        table_header_fill = styles['table_header_fill']
+        thin_border = styles['thin_border']
+        center_align = styles['center_align']
+        left_align = styles['left_align']
+        
+        def styled(value, font=None, fill=None, border=None, alignment=None):
+            cell = WriteOnlyCell(ws, value=value)
+            if font is not None:
+                cell.font = font
+            if fill is not None:
+                cell.fill = fill
+            if border is not None:
+                cell.border = border
+            if alignment is not None:
+                cell.alignment = alignment
+            return cell
+        
+        row_num = 1
+        
+        def merged_row(value, font, alignment=None):
+            # One styled cell spanning A:H
+            nonlocal row_num
+            ws.merged_cells.add(f'A{row_num}:H{row_num}')
+            ws.append([styled(value, font=font, alignment=alignment)])
+            row_num += 1
+        
+        # Header
+        merged_row('Government of Kerala', header_font, center_align)
+        merged_row('Department: Health Services', subheader_font, center_align)
+        merged_row('Norms Based General Transfer for Junior Public Health Nurse Gr. I', subheader_font, center_align)
+        merged_row('Post/Cadre Name: Junior Public Health Nurse', styles['cadre_font'], styles['plain_left_align'])
+        ws.append([])
+        row_num += 1
+        
+        sl_no = 1
+        
+        district_groups = self._district_groups
+        
+        headers = ['Sl. No.', 'PEN', 'Name', 'Designation', 'Office Transferred from', 
+                  'From District', 'To District', 'Protection If Any']
+        header_cells = [(header, table_header_font, table_header_fill, thin_border, center_align)
+                        for header in headers]
+        
+        for district in self._district_order:
+            records = district_groups[district]
+            
+            # District header
+            merged_row(f'District: {self._upper_districts[district]}', district_font)
+            
+            # Table headers
+            ws.append([styled(*args) for args in header_cells])
+            
+            # Data rows
+            for record in records:
+                protection = ""
+                if record.get('weightage') == 'Yes' and record.get('weightage_details'):
+                    protection = record['weightage_details']
                 
-            except ImportError:
-                QMessageBox.warning(self, "Missing Library", 
-                    "openpyxl library is required for Excel export.\n\n"
-                    "Install it using:\npip install openpyxl")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to export Excel:\n{str(e)}")
+                ws.append([styled(sl_no, border=thin_border, alignment=center_align)]
+                          + [styled(value, border=thin_border, alignment=left_align)
+                             for value in (record['pen'], record['name'], record['designation'],
+                                           record['institution'], record['from_district'],
+                                           record['to_district'], protection)])
+                sl_no += 1
+            
+            ws.append([])  # Empty row between districts
+            row_num += len(records) + 2
+        
+        _write_bytes(file_path, _saved_bytes(wb.save))
+    
+    def _start_export(self, kind, write, file_path):
+        """Run an export writer on the global thread pool"""
+        self._export_buttons[kind].setEnabled(False)
+        task = _ExportTask(kind, write, file_path)
+        task.signals.finished.connect(self._on_export_finished)
+        task.signals.failed.connect(self._on_export_failed)
+        self._export_tasks[kind] = task
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_export_finished(self, kind, file_path):
+        """Re-enable the export button and confirm the saved file"""
+        self._export_tasks.pop(kind, None)
+        self._export_buttons[kind].setEnabled(True)
+        if kind in self._batch_pending:
+            self._batch_pending.discard(kind)
+            self._batch_files.append(file_path)
+            self._finish_batch()
+            return
+        QMessageBox.information(self, "Success", f"{_EXPORT_MESSAGES[kind][0]}:\n{file_path}")
+    
+    def _on_export_failed(self, kind, file_path, error):
+        """Re-enable the export button and report why the export failed"""
+        self._export_tasks.pop(kind, None)
+        self._export_buttons[kind].setEnabled(True)
+        _, missing_library, failure = _EXPORT_MESSAGES[kind]
+        if kind in self._batch_pending:
+            self._batch_pending.discard(kind)
+            self._batch_errors.append(missing_library if isinstance(error, ImportError)
+                                      else f"{failure}: {str(error)}")
+            self._finish_batch()
+            return
+        if isinstance(error, ImportError):
+            QMessageBox.warning(self, "Missing Library", missing_library)
+        else:
+            QMessageBox.critical(self, "Error", f"{failure}:\n{str(error)}")
+    
+    def export_all(self):
+        """Export HTML, PDF, Excel and Word copies of the list into one folder"""
+        if self._export_tasks:
+            QMessageBox.information(self, "Export in Progress",
+                                    "Please wait for the current export to finish.")
+            return
+        
+        folder = QFileDialog.getExistingDirectory(self, "Export All Formats")
+        if not folder:
+            return
+        
+        base = os.path.join(folder, f"transfer_list_{datetime.now().strftime('%Y%m%d')}")
+        self._batch_files = []
+        self._batch_errors = []
+        self._batch_pending = {'excel', 'word'}
+        self.export_all_btn.setEnabled(False)
+        
+        # Excel and Word are built on the thread pool while HTML and PDF,
+        # which need the Qt document, are written here
+        self._start_export('excel', self._write_excel, base + '.xlsx')
+        self._start_export('word', self._write_word, base + '.docx')
+        try:
+            _write_bytes(base + '.html', self.html_content.encode('utf-8'))
+            self._batch_files.append(base + '.html')
+            self._write_pdf(base + '.pdf')
+            self._batch_files.append(base + '.pdf')
+        except Exception as e:
+            self._batch_errors.append(f"Failed to export: {str(e)}")
+        self._finish_batch()
+    
+    def _finish_batch(self):
+        """Report an Export All batch once all of its background exports are done"""
+        if self._batch_pending or self.export_all_btn.isEnabled():
+            return
+        self.export_all_btn.setEnabled(True)
+        message = "Exported:\n" + "\n".join(self._batch_files) if self._batch_files else "Nothing was exported."
+        if self._batch_errors:
+            QMessageBox.warning(self, "Export All", message + "\n\n" + "\n\n".join(self._batch_errors))
+        else:
+            QMessageBox.information(self, "Success", message)
     
     def export_to_word(self):
         """Export to Word document"""
@@ -2080,90 +2948,100 @@ class TransferListPreviewDialog(QDialog):
         )
         
         if file_path:
-            try:
-                from docx import Document
-                from docx.shared import Inches, Pt, Cm
-                from docx.enum.text import WD_ALIGN_PARAGRAPH
-                from docx.enum.table import WD_TABLE_ALIGNMENT
-                from docx.oxml.ns import qn
-                from docx.oxml import OxmlElement
-                
-                doc = Document()
-                
-                # Set page margins
-                section = doc.sections[0]
-                section.left_margin = Cm(2)
-                section.right_margin = Cm(2)
-                section.top_margin = Cm(2)
-                section.bottom_margin = Cm(2)
-                
-                if self.transfer_type == "regular":
-                    # Regular Transfer - Malayalam format
-                    self._export_regular_transfer_word(doc)
-                else:
-                    # General Transfer - English format with landscape
-                    section.page_width, section.page_height = section.page_height, section.page_width
-                    section.left_margin = Cm(1.5)
-                    section.right_margin = Cm(1.5)
-                    section.top_margin = Cm(1.5)
-                    section.bottom_margin = Cm(1.5)
-                    self._export_general_transfer_word(doc)
-                
-                doc.save(file_path)
-                QMessageBox.information(self, "Success", f"Word document exported to:\n{file_path}")
-                
-            except ImportError:
-                QMessageBox.warning(self, "Missing Library", 
-                    "python-docx library is required for Word export.\n\n"
-                    "Install it using:\npip install python-docx")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to export Word document:\n{str(e)}")
+            self._start_export('word', self._write_word, file_path)
+    
+    def _write_word(self, file_path):
+        """Build and save the Word document; runs on a worker thread"""
+        docx = _get_docx()
+        from docx.shared import Cm
+        
+        doc = docx.Document()
+        
+        # Set page margins
+        section = doc.sections[0]
+        section.left_margin = Cm(2)
+        section.right_margin = Cm(2)
+        section.top_margin = Cm(2)
+        section.bottom_margin = Cm(2)
+        
+        if self.transfer_type == "regular":
+            # Regular Transfer - Malayalam format
+            self._export_regular_transfer_word(doc)
+        else:
+            # General Transfer - English format with landscape
+            section.page_width, section.page_height = section.page_height, section.page_width
+            section.left_margin = Cm(1.5)
+            section.right_margin = Cm(1.5)
+            section.top_margin = Cm(1.5)
+            section.bottom_margin = Cm(1.5)
+            self._export_general_transfer_word(doc)
+        
+        _write_bytes(file_path, _saved_bytes(doc.save))
     
     def _export_regular_transfer_word(self, doc):
         """Export Regular Transfer in Malayalam format - matching template exactly"""
-        from docx.shared import Pt, Cm, Inches, Twips
+        from docx.shared import Cm
         from docx.enum.text import WD_ALIGN_PARAGRAPH
         from docx.enum.table import WD_TABLE_ALIGNMENT
-        from docx.oxml.ns import qn
-        from docx.oxml import OxmlElement
         
         # Set font name for Malayalam (MANDARAM as in template)
         font_name = 'MANDARAM'
+        oxml = _docx_oxml_protos()
+        
+        # Malayalam paragraph styles, so paragraphs take their font from the
+        # style instead of formatting every run
+        _add_paragraph_style(doc, 'MalayalamTitle', 17, font_name, bold=True, underline=True)
+        _add_paragraph_style(doc, 'MalayalamOrder', 16, font_name, bold=True, underline=True)
+        _add_paragraph_style(doc, 'MalayalamBody14', 14, font_name)
         
         # Helper function to set paragraph spacing
         def set_paragraph_spacing(para, space_before_pt=12, space_after_pt=12, line_spacing=1.15):
-            para.paragraph_format.space_before = Pt(space_before_pt)
-            para.paragraph_format.space_after = Pt(space_after_pt)
+            para.paragraph_format.space_before = _docx_pt(space_before_pt)
+            para.paragraph_format.space_after = _docx_pt(space_after_pt)
             para.paragraph_format.line_spacing = line_spacing
         
         # Helper function to add tab stop
         def add_tab_stop(para, position_cm):
-            from docx.oxml.ns import qn
-            from docx.oxml import OxmlElement
             pPr = para._p.get_or_add_pPr()
-            tabs = pPr.find(qn('w:tabs'))
+            tabs = pPr.find(oxml['w:tabs'])
             if tabs is None:
-                tabs = OxmlElement('w:tabs')
+                tabs = deepcopy(oxml['tabs'])
                 pPr.append(tabs)
-            tab = OxmlElement('w:tab')
-            tab.set(qn('w:val'), 'left')
-            tab.set(qn('w:pos'), str(int(position_cm * 567)))  # Convert cm to twips (1cm = 567 twips)
+            tab = deepcopy(oxml['tab'])
+            tab.set(oxml['w:pos'], str(int(position_cm * 567)))  # Convert cm to twips (1cm = 567 twips)
             tabs.append(tab)
         
+        # Helper function to add a single-run 14pt paragraph. The first paragraph with a
+        # given layout is formatted through python-docx; later ones copy its <w:p> and
+        # only swap the text
+        paragraph_protos = {}
+        def add_text_paragraph(text, space_before_pt, space_after_pt, alignment=None,
+                               first_line_indent_pt=None, left_indent_pt=None, bold=False):
+            key = (space_before_pt, space_after_pt, alignment, first_line_indent_pt, left_indent_pt, bold)
+            proto = paragraph_protos.get(key)
+            if proto is not None:
+                p = deepcopy(proto)
+                next(p.iter(oxml['w:t'])).text = text
+                doc.element.body._insert_p(p)
+                return
+            para = doc.add_paragraph()
+            if alignment is not None:
+                para.alignment = alignment
+            if first_line_indent_pt is not None:
+                para.paragraph_format.first_line_indent = _docx_pt(first_line_indent_pt)
+            if left_indent_pt is not None:
+                para.paragraph_format.left_indent = _docx_pt(left_indent_pt)
+            set_paragraph_spacing(para, space_before_pt=space_before_pt, space_after_pt=space_after_pt)
+            run = para.add_run(text)
+            if bold:
+                run.bold = True
+            run.font.size = _docx_pt(14)
+            run.font.name = font_name
+            paragraph_protos[key] = para._p
+        
         # Title - Malayalam (17pt Bold Underline Center, both lines in same paragraph with line break)
-        title = doc.add_paragraph()
+        title = doc.add_paragraph(_ML_TITLE, style='MalayalamTitle')
         title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        title_run1 = title.add_run('തിരുവനന്തപുരം, ആരോഗ്യവകുപ്പ് ഡയറക്ടറുടെ കാര്യാലയത്തിലെ')
-        title_run1.bold = True
-        title_run1.underline = True
-        title_run1.font.size = Pt(17)
-        title_run1.font.name = font_name
-        title.add_run('\n')
-        title_run2 = title.add_run('അഡീഷണൽ ഡയറക്ടർ (എ & റ്റി) – യുടെ നടപടിക്രമം')
-        title_run2.bold = True
-        title_run2.underline = True
-        title_run2.font.size = Pt(17)
-        title_run2.font.name = font_name
         set_paragraph_spacing(title, space_before_pt=0, space_after_pt=12)
         
         # Subject/Reference table (No borders, 2 columns)
@@ -2174,201 +3052,99 @@ class TransferListPreviewDialog(QDialog):
         subject_table.style = 'Normal Table'
         
         # Set column widths - first column narrow, second column wide
-        from docx.shared import Cm
         for row in subject_table.rows:
             row.cells[0].width = Cm(2.5)
             row.cells[1].width = Cm(14)
         
         # Set table indent (move entire table 1pt to the right)
-        from docx.oxml.ns import qn
-        from docx.oxml import OxmlElement
         tbl = subject_table._tbl
-        tblPr = tbl.tblPr if tbl.tblPr is not None else OxmlElement('w:tblPr')
-        tblInd = OxmlElement('w:tblInd')
-        tblInd.set(qn('w:w'), '20')  # 20 twips = ~1pt
-        tblInd.set(qn('w:type'), 'dxa')
-        tblPr.append(tblInd)
+        tblPr = tbl.tblPr if tbl.tblPr is not None else deepcopy(oxml['tblPr'])
+        tblPr.append(deepcopy(oxml['tblInd']))
         if tbl.tblPr is None:
             tbl.insert(0, tblPr)
         
-        # Subject row
-        cell00 = subject_table.cell(0, 0)
-        cell00.text = 'വിഷയം :'
-        cell00.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        set_paragraph_spacing(cell00.paragraphs[0], space_before_pt=12, space_after_pt=0)
-        for run in cell00.paragraphs[0].runs:
-            run.font.name = font_name
-            run.font.size = Pt(14)
-        
-        cell01 = subject_table.cell(0, 1)
-        cell01.text = 'ആ.വ. – ആ.വ.ഡ - ജൂനിയർ പബ്ലിക് ഹെൽത്ത് നഴ്‌സ് ഗ്രേഡ് 1 തസ്തികയിലെ ജീവനക്കാർക്ക് സ്ഥലംമാറ്റം അനുവദിച്ച് ഉത്തരവ് പുറപ്പെടുവിക്കുന്നു.'
-        cell01.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        set_paragraph_spacing(cell01.paragraphs[0], space_before_pt=12, space_after_pt=0)
-        for run in cell01.paragraphs[0].runs:
-            run.font.name = font_name
-            run.font.size = Pt(14)
-        
-        # Reference row
-        cell10 = subject_table.cell(1, 0)
-        cell10.text = 'പരാമർശം :'
-        cell10.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        set_paragraph_spacing(cell10.paragraphs[0], space_before_pt=12, space_after_pt=0)
-        for run in cell10.paragraphs[0].runs:
-            run.font.name = font_name
-            run.font.size = Pt(14)
-        
-        cell11 = subject_table.cell(1, 1)
-        cell11.text = 'വിവിധ ജില്ലാ മെഡിക്കൽ ഓഫീസ് (ആരോഗ്യം) - ൽ നിന്നും ലഭ്യമായ ജൂനിയർ പബ്ലിക്ക് ഹെൽത്ത് നഴ്സ് ഗ്രേഡ് I ജീവനക്കാരുടെ അപേക്ഷകൾ.'
-        cell11.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        set_paragraph_spacing(cell11.paragraphs[0], space_before_pt=12, space_after_pt=0)
-        for run in cell11.paragraphs[0].runs:
-            run.font.name = font_name
-            run.font.size = Pt(14)
+        # Subject and reference rows: label right aligned, text justified. Text goes
+        # into a run on the cell's existing paragraph instead of through cell.text,
+        # which would clear the cell and rebuild its paragraph
+        subject_rows = ((_ML_SUBJECT_LABEL, _ML_SUBJECT), (_ML_REFERENCE_LABEL, _ML_REFERENCE))
+        for row, texts in zip(subject_table.rows, subject_rows):
+            for cell, text, alignment in zip(row.cells, texts,
+                                             (WD_ALIGN_PARAGRAPH.RIGHT, WD_ALIGN_PARAGRAPH.JUSTIFY)):
+                para = cell.paragraphs[0]
+                para.add_run(text)
+                para.alignment = alignment
+                set_paragraph_spacing(para, space_before_pt=12, space_after_pt=0)
+                para.style = 'MalayalamBody14'
         
         # Order number and date (16pt Bold Underline Center)
-        order_para = doc.add_paragraph()
+        order_para = doc.add_paragraph(f'ഉത്തരവ് നം. {self.order_number}, തീയതി: #ApprovedDate#',
+                                       style='MalayalamOrder')
         order_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         set_paragraph_spacing(order_para, space_before_pt=12, space_after_pt=12)
-        order_run = order_para.add_run(f'ഉത്തരവ് നം. {self.order_number}, തീയതി: #ApprovedDate#')
-        order_run.bold = True
-        order_run.underline = True
-        order_run.font.size = Pt(16)
-        order_run.font.name = font_name
         
         # Body text (14pt, JUSTIFY, with indent)
-        body1 = doc.add_paragraph()
-        body1.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        body1.paragraph_format.first_line_indent = Pt(36)
-        set_paragraph_spacing(body1, space_before_pt=12, space_after_pt=12)
-        body1_run = body1.add_run('വിവിധ ജില്ലാ മെഡിക്കൽ ഓഫീസ് (ആരോഗ്യം) - ൽ നിന്നും മേൽ പരാമർശ പ്രകാരം ലഭ്യമായ ജൂനിയർ പബ്ലിക്ക് ഹെൽത്ത് നഴ്സ് ഗ്രേഡ് I – ജീവനക്കാരുടെ സ്ഥലംമാറ്റത്തിനുള്ള അപേക്ഷകൾ പരിഗണിച്ച്, ചുവടെ ചേർക്കുന്ന ജീവനക്കാർക്ക് അവരുടെ പേരിന് നേരെ രേഖപ്പെടുത്തിയിട്ടുള്ള ജില്ലകളിലേക്ക് സ്ഥലം മാറ്റം നൽകി ഉത്തരവാകുന്നു.')
-        body1_run.font.size = Pt(14)
-        body1_run.font.name = font_name
+        add_text_paragraph(_ML_BODY, 12, 12, alignment=WD_ALIGN_PARAGRAPH.JUSTIFY, first_line_indent_pt=36)
         
         # Data table - 6 columns as per template (14pt, headers CENTER, data JUSTIFY)
         headers = ['Sl. No.', 'PEN', 'Name', 'Present Institution', 'Present District', 'Allotted District']
         
-        total_records = len(self.transfer_data)
-        
-        table = doc.add_table(rows=1 + total_records, cols=6)
+        # Header row plus one formatted template row that is copied per record
+        table = doc.add_table(rows=2, cols=6)
         table.style = 'Table Grid'
         table.alignment = WD_TABLE_ALIGNMENT.CENTER
+        header_cells, template_cells = (row.cells for row in table.rows)
         
         # Header row (14pt, CENTER aligned)
-        header_row = table.rows[0]
-        for i, header in enumerate(headers):
-            cell = header_row.cells[i]
-            cell.text = header
-            cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-            for run in cell.paragraphs[0].runs:
-                run.font.name = font_name
-                run.font.size = Pt(14)
+        for cell, header in zip(header_cells, headers):
+            para = cell.paragraphs[0]
+            para.add_run(header)
+            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            para.style = 'MalayalamBody14'
         
         # Data rows (14pt, Sl. No. CENTER, others JUSTIFY aligned)
-        for row_idx, record in enumerate(self.transfer_data):
-            data = [
-                str(row_idx + 1),
-                record['pen'],
-                record['name'],
-                record['institution'],
-                record['from_district'].upper(),
-                record['to_district'].upper()
-            ]
-            
-            row = table.rows[row_idx + 1]
-            for col_idx, value in enumerate(data):
-                cell = row.cells[col_idx]
-                cell.text = str(value)
-                # Center align the Sl. No. column (first column)
-                if col_idx == 0:
-                    cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-                else:
-                    cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-                for run in cell.paragraphs[0].runs:
-                    run.font.name = font_name
-                    run.font.size = Pt(14)
-        
-        # Instructions paragraph 1 (14pt, JUSTIFY)
-        instr1 = doc.add_paragraph()
-        instr1.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        instr1.paragraph_format.first_line_indent = Pt(36)
-        set_paragraph_spacing(instr1, space_before_pt=12, space_after_pt=12)
-        instr1_run = instr1.add_run('ബന്ധപ്പെട്ട ജില്ലാ മെഡിക്കൽ ഓഫീസർമാർ ജീവനക്കാർക്ക് നിയമന ഉത്തരവ് നൽകേണ്ടതും നിയമന ഉത്തരവ് ലഭിച്ച ശേഷം സ്ഥാപന മേധാവികൾ ജീവനക്കാരെ വിടുതൽ ചെയ്യേണ്ടതും, ടി വിവരം യഥാസമയേ ഈ കാര്യാലയത്തിൽ റിപ്പോർട്ട് ചെയ്യേണ്ടതുമാണ്.')
-        instr1_run.font.size = Pt(14)
-        instr1_run.font.name = font_name
-        
-        # Instructions paragraph 2 (14pt, JUSTIFY)
-        instr2 = doc.add_paragraph()
-        instr2.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        instr2.paragraph_format.first_line_indent = Pt(36)
-        set_paragraph_spacing(instr2, space_before_pt=12, space_after_pt=12)
-        instr2_run = instr2.add_run('ആരോഗ്യവകുപ്പ് ഡയറക്ടറുടെ ഔദ്യോഗിക വെബ്സൈറ്റിൽ പ്രസിദ്ധീകരിച്ചിട്ടുള്ള ഈ ഉത്തരവിന്റെ പകർപ്പ് ഔദ്യോഗിക രേഖയായി ഉപയോഗിക്കാവുന്നതാണ്.')
-        instr2_run.font.size = Pt(14)
-        instr2_run.font.name = font_name
+        for col_idx, cell in enumerate(template_cells):
+            para = cell.paragraphs[0]
+            para.add_run('-')  # placeholder run, replaced per record
+            if col_idx == 0:
+                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            else:
+                para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+            para.style = 'MalayalamBody14'
+        
+        _fill_table_rows(table._tbl, (
+            (str(row_idx + 1), str(record['pen']), str(record['name']), str(record['institution']),
+             record['from_district_u'], record['to_district_u'])
+            for row_idx, record in enumerate(self.transfer_data)
+        ))
+        
+        # Instructions paragraphs (14pt, JUSTIFY)
+        add_text_paragraph(_ML_INSTRUCTION_RELIEVE, 12, 12, alignment=WD_ALIGN_PARAGRAPH.JUSTIFY, first_line_indent_pt=36)
+        add_text_paragraph(_ML_INSTRUCTION_WEBSITE, 12, 12, alignment=WD_ALIGN_PARAGRAPH.JUSTIFY, first_line_indent_pt=36)
         
         # Empty paragraphs before signature
         doc.add_paragraph()
         doc.add_paragraph()
         
         # Signature area (14pt Bold, with indent - JUSTIFY aligned as per template)
-        sig_name = doc.add_paragraph()
-        sig_name.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        sig_name.paragraph_format.first_line_indent = Pt(252)  # Large indent to push right
-        set_paragraph_spacing(sig_name, space_before_pt=12, space_after_pt=0)
-        sig_name_run = sig_name.add_run('#ApprovedByName#')
-        sig_name_run.bold = True
-        sig_name_run.font.size = Pt(14)
-        sig_name_run.font.name = font_name
-        
-        sig_desig = doc.add_paragraph()
-        sig_desig.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        sig_desig.paragraph_format.first_line_indent = Pt(252)
-        set_paragraph_spacing(sig_desig, space_before_pt=0, space_after_pt=12)
-        sig_desig_run = sig_desig.add_run('#ApprovedByDesignation#')
-        sig_desig_run.bold = True
-        sig_desig_run.font.size = Pt(14)
-        sig_desig_run.font.name = font_name
+        add_text_paragraph('#ApprovedByName#', 12, 0, alignment=WD_ALIGN_PARAGRAPH.JUSTIFY,
+                           first_line_indent_pt=252, bold=True)  # Large indent to push right
+        add_text_paragraph('#ApprovedByDesignation#', 0, 12, alignment=WD_ALIGN_PARAGRAPH.JUSTIFY,
+                           first_line_indent_pt=252, bold=True)
         
         # Recipients (14pt, NOT bold as per template)
-        recv = doc.add_paragraph()
-        recv.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        set_paragraph_spacing(recv, space_before_pt=12, space_after_pt=6)
-        recv_run = recv.add_run('സ്വീകർത്താവ്')
-        recv_run.font.size = Pt(14)
-        recv_run.font.name = font_name
-        
-        recv_list = doc.add_paragraph()
-        recv_list.paragraph_format.first_line_indent = Pt(36)
-        set_paragraph_spacing(recv_list, space_before_pt=12, space_after_pt=12)
-        recv_list_run = recv_list.add_run('ബന്ധപ്പെട്ട ജില്ലാ മെഡിക്കൽ ഓഫീസർ (ആരോഗ്യം) മാർ')
-        recv_list_run.bold = True
-        recv_list_run.font.size = Pt(14)
-        recv_list_run.font.name = font_name
+        add_text_paragraph(_ML_RECIPIENT_LABEL, 12, 6, alignment=WD_ALIGN_PARAGRAPH.JUSTIFY)
+        add_text_paragraph(_ML_RECIPIENTS, 12, 12, first_line_indent_pt=36, bold=True)
         
         # Copy to (14pt)
-        copy = doc.add_paragraph()
-        set_paragraph_spacing(copy, space_before_pt=12, space_after_pt=6)
-        copy_run = copy.add_run('പകർപ്പ്:')
-        copy_run.font.size = Pt(14)
-        copy_run.font.name = font_name
+        add_text_paragraph(_ML_COPY_LABEL, 12, 6)
         
         # Numbered list items
-        copy1 = doc.add_paragraph()
-        copy1.paragraph_format.left_indent = Pt(36)
-        set_paragraph_spacing(copy1, space_before_pt=6, space_after_pt=6)
-        copy1_run = copy1.add_run('1. ആരോഗ്യവകുപ്പ് ഡയറക്ടറുടെ ഔദ്യോഗിക വെബ്സൈറ്റ്')
-        copy1_run.font.size = Pt(14)
-        copy1_run.font.name = font_name
-        
-        copy2 = doc.add_paragraph()
-        copy2.paragraph_format.left_indent = Pt(36)
-        set_paragraph_spacing(copy2, space_before_pt=6, space_after_pt=12)
-        copy2_run = copy2.add_run('2. ഫയൽ/കരുതൽ ഫയൽ')
-        copy2_run.font.size = Pt(14)
-        copy2_run.font.name = font_name
+        add_text_paragraph(_ML_COPY_WEBSITE, 6, 6, left_indent_pt=36)
+        add_text_paragraph(_ML_COPY_FILE, 6, 12, left_indent_pt=36)
 
     def _export_general_transfer_word(self, doc):
         """Export General Transfer in English format"""
-        from docx.shared import Inches, Pt
+        from docx.shared import Inches
         from docx.enum.text import WD_ALIGN_PARAGRAPH
         from docx.enum.table import WD_TABLE_ALIGNMENT
         
@@ -2376,88 +3152,92 @@ class TransferListPreviewDialog(QDialog):
         header1 = doc.add_paragraph('Government of Kerala')
         header1.alignment = WD_ALIGN_PARAGRAPH.CENTER
         header1.runs[0].bold = True
-        header1.runs[0].font.size = Pt(14)
+        header1.runs[0].font.size = _docx_pt(14)
         
         header2 = doc.add_paragraph('Department: Health Services')
         header2.alignment = WD_ALIGN_PARAGRAPH.CENTER
         header2.runs[0].bold = True
-        header2.runs[0].font.size = Pt(12)
+        header2.runs[0].font.size = _docx_pt(12)
         
         header3 = doc.add_paragraph('Norms Based General Transfer for Junior Public Health Nurse Gr. I')
         header3.alignment = WD_ALIGN_PARAGRAPH.CENTER
         header3.runs[0].bold = True
-        header3.runs[0].font.size = Pt(12)
+        header3.runs[0].font.size = _docx_pt(12)
         header3.runs[0].underline = True
         
         cadre = doc.add_paragraph('Post/Cadre Name: Junior Public Health Nurse')
         cadre.runs[0].bold = True
-        cadre.runs[0].font.size = Pt(10)
+        cadre.runs[0].font.size = _docx_pt(10)
         
         doc.add_paragraph()
         
-        # Group data by district
-        district_groups = {}
-        for row in self.transfer_data:
-            from_district = row['from_district']
-            if from_district not in district_groups:
-                district_groups[from_district] = []
-            district_groups[from_district].append(row)
+        district_groups = self._district_groups
+        
+        # Table cell styles: 9pt runs come from the style instead of per-run formatting
+        _add_paragraph_style(doc, 'TableHeader9', 9, bold=True)
+        _add_paragraph_style(doc, 'TableCell9', 9)
         
         sl_no = 1
         headers = ['Sl. No.', 'PEN', 'Name', 'Designation', 'Office Transferred from', 
                   'From District', 'To District', 'Protection If Any']
         
-        # Column widths in inches
-        col_widths = [0.5, 0.8, 1.8, 1.2, 2.5, 1.2, 1.2, 1.3]
+        # Column widths (given in inches)
+        col_widths = [Inches(width) for width in (0.5, 0.8, 1.8, 1.2, 2.5, 1.2, 1.2, 1.3)]
         
-        for district in self.districts:
-            if district not in district_groups:
-                continue
-            
+        # Unfilled copy of the first district table, cloned for the other districts
+        table_proto = None
+        
+        for district in self._district_order:
             records = district_groups[district]
             
             # District header
-            district_para = doc.add_paragraph(f'District: {district.upper()}')
+            district_para = doc.add_paragraph(f'District: {self._upper_districts[district]}')
             district_para.runs[0].bold = True
-            district_para.runs[0].font.size = Pt(11)
-            
-            # Create table
-            table = doc.add_table(rows=1 + len(records), cols=8)
-            table.style = 'Table Grid'
-            table.alignment = WD_TABLE_ALIGNMENT.CENTER
-            
-            # Set column widths
-            for i, width in enumerate(col_widths):
-                for cell in table.columns[i].cells:
-                    cell.width = Inches(width)
-            
-            # Header row
-            header_row = table.rows[0]
-            for i, header in enumerate(headers):
-                cell = header_row.cells[i]
-                cell.text = header
-                cell.paragraphs[0].runs[0].bold = True
-                cell.paragraphs[0].runs[0].font.size = Pt(9)
-                cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+            district_para.runs[0].font.size = _docx_pt(11)
+            
+            if table_proto is None:
+                # Create table: header row plus one formatted template row that is copied per record
+                table = doc.add_table(rows=2, cols=8)
+                table.style = 'Table Grid'
+                table.alignment = WD_TABLE_ALIGNMENT.CENTER
+                header_cells, template_cells = (row.cells for row in table.rows)
+                
+                # Set column widths
+                for header_cell, template_cell, width in zip(header_cells, template_cells, col_widths):
+                    header_cell.width = template_cell.width = width
+                
+                # Header row
+                for cell, header in zip(header_cells, headers):
+                    para = cell.paragraphs[0]
+                    para.add_run(header)
+                    para.style = 'TableHeader9'
+                    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                
+                # Data rows
+                for col_idx, cell in enumerate(template_cells):
+                    para = cell.paragraphs[0]
+                    para.add_run('-')  # placeholder run, replaced per record
+                    para.style = 'TableCell9'
+                    if col_idx == 0:
+                        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                
+                tbl = table._tbl
+                table_proto = deepcopy(tbl)
+            else:
+                tbl = deepcopy(table_proto)
+                doc.element.body._insert_tbl(tbl)
             
-            # Data rows
-            for row_idx, record in enumerate(records):
+            rows = []
+            for record in records:
                 protection = ""
                 if record.get('weightage') == 'Yes' and record.get('weightage_details'):
                     protection = record['weightage_details']
                 
-                data = [str(sl_no), record['pen'], record['name'], record['designation'],
-                       record['institution'], record['from_district'], record['to_district'], protection]
-                
-                row = table.rows[row_idx + 1]
-                for col_idx, value in enumerate(data):
-                    cell = row.cells[col_idx]
-                    cell.text = str(value)
-                    cell.paragraphs[0].runs[0].font.size = Pt(9)
-                    if col_idx == 0:
-                        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-                
+                rows.append((str(sl_no), str(record['pen']), str(record['name']), str(record['designation']),
+                             str(record['institution']), str(record['from_district']),
+                             str(record['to_district']), str(protection)))
                 sl_no += 1
+            _fill_table_rows(tbl, rows)
             
             doc.add_paragraph()  # Space between districts
         
@@ -2466,10 +3246,10 @@ class TransferListPreviewDialog(QDialog):
         sig_para = doc.add_paragraph()
         sig_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
         sig_run = sig_para.add_run('_________________________\n')
-        sig_run.font.size = Pt(10)
+        sig_run.font.size = _docx_pt(10)
         sig_run2 = sig_para.add_run('Authorized Signatory')
         sig_run2.bold = True
-        sig_run2.font.size = Pt(10)
+        sig_run2.font.size = _docx_pt(10)
 
 
 class PreferenceDialog(QDialog):
@@ -2479,7 +3259,7 @@ class PreferenceDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Set District Preferences")
         self.setMinimumWidth(500)
-        self.setFont(QFont("Calibri", 10))
+        self.setFont(_font(10))
         
         if current_prefs is None:
             current_prefs = [""] * 8
@@ -2492,6 +3272,7 @@ class PreferenceDialog(QDialog):
             self.all_districts = [d for d in districts if d != current_district]
         else:
             self.all_districts = districts
+        self._district_pos = {d: i for i, d in enumerate(self.all_districts)}
         
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
@@ -2502,16 +3283,16 @@ class PreferenceDialog(QDialog):
         info_layout = QVBoxLayout(info_frame)
         
         name_label = QLabel(f"Employee: {employee_name}")
-        name_label.setFont(QFont("mandaram.ttf", 11, QFont.Bold))
+        name_label.setFont(_font(11, True, family="mandaram.ttf"))
         info_layout.addWidget(name_label)
         
         pen_label = QLabel(f"PEN: {pen}")
-        pen_label.setFont(QFont("Calibri", 10))
+        pen_label.setFont(_font(10))
         info_layout.addWidget(pen_label)
         
         if current_district:
             district_label = QLabel(f"Current District: {current_district} (excluded from preferences)")
-            district_label.setFont(QFont("Calibri", 10))
+            district_label.setFont(_font(10))
             district_label.setStyleSheet("color: #dc3545;")
             info_layout.addWidget(district_label)
         
@@ -2519,7 +3300,7 @@ class PreferenceDialog(QDialog):
         
         # Instructions
         inst_label = QLabel("Select up to 8 district preferences in order of priority (each district can only be selected once):")
-        inst_label.setFont(QFont("Calibri", 10))
+        inst_label.setFont(_font(10))
         inst_label.setStyleSheet("color: #666;")
         inst_label.setWordWrap(True)
         layout.addWidget(inst_label)
@@ -2531,24 +3312,23 @@ class PreferenceDialog(QDialog):
         self.pref_combos = []
         self._updating_combos = False  # Flag to prevent recursive updates
         
+        # Coalesce bursts of selection changes (e.g. while typing) into one update
+        self._district_refresh_timer = QTimer(self)
+        self._district_refresh_timer.setSingleShot(True)
+        self._district_refresh_timer.setInterval(50)
+        self._district_refresh_timer.timeout.connect(self.update_available_districts)
+        
         for i in range(8):
             combo = SearchableComboBox()
             combo.setMinimumHeight(30)
             combo.addItem("")  # Empty option
-            combo.addItems(districts)
+            combo.addItems(self.all_districts)
             
-            # Set current value if exists
-            if current_prefs[i]:
-                idx = combo.findText(current_prefs[i])
-                if idx >= 0:
-                    combo.setCurrentIndex(idx)
-                else:
-                    combo.setCurrentIndex(0)
-            else:
-                combo.setCurrentIndex(0)  # Empty
+            # Set current value if exists, else the empty option (row 0)
+            combo.setCurrentIndex(self._district_pos.get(current_prefs[i], -1) + 1)
             
             # Connect to update available districts when selection changes
-            combo.currentIndexChanged.connect(self.update_available_districts)
+            combo.currentIndexChanged.connect(self._schedule_district_update)
             
             self.pref_combos.append(combo)
             form_layout.addRow(f"Preference {i + 1}:", combo)
@@ -2580,8 +3360,13 @@ class PreferenceDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    def _schedule_district_update(self, *args):
+        """Restart the short countdown to update_available_districts"""
+        self._district_refresh_timer.start()
+    
     def update_available_districts(self):
         """Update each combo box to show only unselected districts"""
+        self._district_refresh_timer.stop()
         if self._updating_combos:
             return
         
@@ -2594,45 +3379,36 @@ class PreferenceDialog(QDialog):
             if text:
                 selected_districts.add(text)
         
-        # Update each combo box
+        # Districts not selected in any combo, computed once for all combos
+        base_allowed = [d for d in self.all_districts if d not in selected_districts]
+        
+        # Update each combo box, adding and removing only the districts that changed
         for combo in self.pref_combos:
             current_text = combo.currentText().strip()
             
-            # Block signals while updating
-            combo.blockSignals(True)
-            combo.clear()
-            combo.addItem("")  # Empty option
-            
-            # Add districts that are either not selected or are the current selection
-            for district in self.all_districts:
-                if district not in selected_districts or district == current_text:
-                    combo.addItem(district)
-            
-            # Restore selection
-            if current_text:
-                idx = combo.findText(current_text)
-                if idx >= 0:
-                    combo.setCurrentIndex(idx)
-            
-            # Refresh completer after items update
-            combo.refresh_completer()
-            
-            combo.blockSignals(False)
+            # Unselected districts plus this combo's own selection, in order
+            wanted = base_allowed
+            if current_text in self._district_pos:
+                wanted = base_allowed[:]
+                insort(wanted, current_text, key=self._district_pos.__getitem__)
+            if _sync_combo_items(combo, wanted):
+                # Refresh completer after items update
+                combo.refresh_completer()
         
         self._updating_combos = False
     
     def validate_and_accept(self):
         """Validate that no district is selected more than once before accepting"""
-        selected = []
-        for i, combo in enumerate(self.pref_combos):
+        seen = set()
+        for combo in self.pref_combos:
             text = combo.currentText().strip()
-            if text:
-                if text in selected:
-                    from PySide6.QtWidgets import QMessageBox
-                    QMessageBox.warning(self, "Duplicate Selection", 
-                                       f"'{text}' is already selected as a preference. Each district can only be selected once.")
-                    return
-                selected.append(text)
+            if not text:
+                continue
+            if text in seen:
+                QMessageBox.warning(self, "Duplicate Selection", 
+                                   f"'{text}' is already selected as a preference. Each district can only be selected once.")
+                return
+            seen.add(text)
         self.accept()
     
     def clear_all(self):
@@ -2655,6 +3431,11 @@ class PreferenceDialog(QDialog):
 class JPHNDialog(QDialog):
     """Dialog for adding/editing JPHN records"""
     
+    # (record index, widget attribute) pairs filled by load_record
+    _TEXT_FIELDS = ((0, 'pen_edit'), (1, 'name_edit'), (2, 'designation_edit'), (3, 'institution_edit'))
+    _DATE_FIELDS = ((5, 'entry_date'), (6, 'retirement_date'), (7, 'district_join_date'),
+                    (9, 'institution_join_date'))
+    
     def __init__(self, parent=None, record=None):
         super().__init__(parent)
         self.record = record
@@ -2670,7 +3451,7 @@ class JPHNDialog(QDialog):
         
         # Name
         self.name_edit = QLineEdit()
-        self.name_edit.setFont(QFont("mandaram.ttf", 10))
+        self.name_edit.setFont(_font(10, family="mandaram.ttf"))
         layout.addRow("Name:", self.name_edit)
         
         # PEN
@@ -2684,7 +3465,7 @@ class JPHNDialog(QDialog):
         
         # Present Institution
         self.institution_edit = QLineEdit()
-        self.institution_edit.setFont(QFont("mandaram.ttf", 10))
+        self.institution_edit.setFont(_font(10, family="mandaram.ttf"))
         layout.addRow("Present Institution:", self.institution_edit)
         
         # District
@@ -2695,32 +3476,34 @@ class JPHNDialog(QDialog):
         self.district_combo.addItems(districts)
         layout.addRow("District:", self.district_combo)
         
+        today = QDate.currentDate()
+        
         # Date of Entry
         self.entry_date = NoScrollDateEdit()
         self.entry_date.setCalendarPopup(True)
         self.entry_date.setDisplayFormat("dd-MM-yyyy")
-        self.entry_date.setDate(QDate.currentDate())
+        self.entry_date.setDate(today)
         layout.addRow("Date of Entry:", self.entry_date)
         
         # Date of Retirement
         self.retirement_date = NoScrollDateEdit()
         self.retirement_date.setCalendarPopup(True)
         self.retirement_date.setDisplayFormat("dd-MM-yyyy")
-        self.retirement_date.setDate(QDate.currentDate().addYears(30))
+        self.retirement_date.setDate(today.addYears(30))
         layout.addRow("Date of Retirement:", self.retirement_date)
         
         # Date of Joining in Present District
         self.district_join_date = NoScrollDateEdit()
         self.district_join_date.setCalendarPopup(True)
         self.district_join_date.setDisplayFormat("dd-MM-yyyy")
-        self.district_join_date.setDate(QDate.currentDate())
+        self.district_join_date.setDate(today)
         layout.addRow("Date of Joining in Present District:", self.district_join_date)
         
         # Date of Joining in Present Institution
         self.institution_join_date = NoScrollDateEdit()
         self.institution_join_date.setCalendarPopup(True)
         self.institution_join_date.setDisplayFormat("dd-MM-yyyy")
-        self.institution_join_date.setDate(QDate.currentDate())
+        self.institution_join_date.setDate(today)
         layout.addRow("Date of Joining in Present Institution:", self.institution_join_date)
         
         # Contact Number
@@ -2735,7 +3518,7 @@ class JPHNDialog(QDialog):
         # Weightage Details
         self.weightage_details = QTextEdit()
         self.weightage_details.setMaximumHeight(80)
-        self.weightage_details.setFont(QFont("mandaram.ttf", 10))
+        self.weightage_details.setFont(_font(10, family="mandaram.ttf"))
         self.weightage_details.setEnabled(False)
         layout.addRow("Weightage Details:", self.weightage_details)
         
@@ -2767,30 +3550,19 @@ class JPHNDialog(QDialog):
         """Load existing record into form"""
         # New order: pen, name, designation, institution, district, entry_date, 
         # retirement_date, district_join_date, duration_days, institution_join_date, weightage, weightage_details, contact
-        self.pen_edit.setText(str(record[0]) if record[0] else "")
-        self.name_edit.setText(str(record[1]) if record[1] else "")
-        self.designation_edit.setText(str(record[2]) if record[2] else "")
-        self.institution_edit.setText(str(record[3]) if record[3] else "")
+        for idx, attr in self._TEXT_FIELDS:
+            getattr(self, attr).setText(str(record[idx]) if record[idx] else "")
         if record[4]:
             self.district_combo.setCurrentText(str(record[4]))
         
         # Handle dates with proper null checking
-        if record[5]:
-            date = QDate.fromString(str(record[5]), "dd-MM-yyyy")
-            if date.isValid():
-                self.entry_date.setDate(date)
-        if record[6]:
-            date = QDate.fromString(str(record[6]), "dd-MM-yyyy")
-            if date.isValid():
-                self.retirement_date.setDate(date)
-        if record[7]:
-            date = QDate.fromString(str(record[7]), "dd-MM-yyyy")
-            if date.isValid():
-                self.district_join_date.setDate(date)
-        if record[9]:
-            date = QDate.fromString(str(record[9]), "dd-MM-yyyy")
+        for idx, attr in self._DATE_FIELDS:
+            value = record[idx]
+            if not value:
+                continue
+            date = QDate.fromString(str(value), "dd-MM-yyyy")
             if date.isValid():
-                self.institution_join_date.setDate(date)
+                getattr(self, attr).setDate(date)
         
         # Contact (index 12 when using explicit column order in SELECT)
         if len(record) > 12 and record[12]:
@@ -2826,6 +3598,85 @@ class JPHNDialog(QDialog):
 
 
 class JPHNManagementSystem(QMainWindow):
+    _STYLESHEET = """
+        QMainWindow {
+            background-color: #f5f5f5;
+        }
+        QLabel {
+            color: #2c3e50;
+        }
+        QPushButton {
+            background-color: #3498db;
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-weight: bold;
+            min-width: 100px;
+        }
+        QPushButton:hover {
+            background-color: #2980b9;
+        }
+        QPushButton:pressed {
+            background-color: #21618c;
+        }
+        QLineEdit, QComboBox, QDateEdit, QSpinBox {
+            padding: 6px;
+            border: 2px solid #bdc3c7;
+            border-radius: 4px;
+            background-color: white;
+        }
+        QLineEdit:focus, QComboBox:focus, QDateEdit:focus, QSpinBox:focus {
+            border: 2px solid #3498db;
+        }
+        QTableWidget {
+            background-color: white;
+            border: 1px solid #bdc3c7;
+            border-radius: 4px;
+            gridline-color: #ecf0f1;
+        }
+        QTableWidget::item {
+            padding: 5px;
+        }
+        QTableWidget::item:selected {
+            background-color: #3498db;
+            color: white;
+        }
+        QHeaderView::section {
+            background-color: #34495e;
+            color: white;
+            padding: 8px;
+            border: none;
+            font-weight: bold;
+        }
+        QTextEdit {
+            border: 2px solid #bdc3c7;
+            border-radius: 4px;
+            background-color: white;
+        }
+        QTabWidget::pane {
+            border: 1px solid #bdc3c7;
+            border-radius: 4px;
+            background-color: white;
+        }
+        QTabBar::tab {
+            background-color: #ecf0f1;
+            color: #2c3e50;
+            padding: 10px 20px;
+            margin-right: 2px;
+            border-top-left-radius: 4px;
+            border-top-right-radius: 4px;
+            font-weight: bold;
+        }
+        QTabBar::tab:selected {
+            background-color: #3498db;
+            color: white;
+        }
+        QTabBar::tab:hover:!selected {
+            background-color: #bdc3c7;
+        }
+    """
+    
     def __init__(self, transfer_type="general", year=None, month=None):
         super().__init__()
         
@@ -2845,9 +3696,9 @@ class JPHNManagementSystem(QMainWindow):
         self.setMinimumSize(1400, 700)
         
         # Set window icon
-        icon_path = resource_path("favicon.ico")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        app_icon = _get_app_icon()
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
         
         # District list
         self.districts = ["Thiruvananthapuram", "Kollam", "Pathanamthitta", "Alappuzha", 
@@ -2872,8 +3723,16 @@ class JPHNManagementSystem(QMainWindow):
             "Kasaragod": ["Kannur"]
         }
         
+        # Commits only mark the WAL dirty; it is folded back into the main
+        # database file by a passive checkpoint at most once a minute
+        self._dirty = False
+        self._checkpoint_timer = QTimer(self)
+        self._checkpoint_timer.setInterval(60000)
+        self._checkpoint_timer.timeout.connect(self._maybe_checkpoint)
+        
         # Initialize database
         self.init_database()
+        self._checkpoint_timer.start()
         
         # Setup UI
         self.setup_ui()
@@ -2886,9 +3745,13 @@ class JPHNManagementSystem(QMainWindow):
     
     def init_database(self):
         """Initialize SQLite database"""
-        self.conn = sqlite3.connect(self.db_name)
+        self.conn = open_db(self.db_name)
         self.cursor = self.conn.cursor()
         
+        # Create and upgrade the schema in one transaction rather than
+        # committing after every DDL statement
+        self._begin()
+        
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS jphn (
                 pen TEXT PRIMARY KEY,
@@ -2917,17 +3780,12 @@ class JPHNManagementSystem(QMainWindow):
             )
         ''')
         
-        # Add against_info column if it doesn't exist (for existing databases)
-        try:
-            self.cursor.execute('ALTER TABLE transfer_draft ADD COLUMN against_info TEXT')
-        except:
-            pass  # Column already exists
-        
-        # Add contact column if it doesn't exist (for existing databases)
-        try:
-            self.cursor.execute('ALTER TABLE jphn ADD COLUMN contact TEXT')
-        except:
-            pass  # Column already exists
+        # Add columns introduced after the first release (for existing databases)
+        add_missing_columns(self.cursor, 'transfer_draft', [('against_info', 'TEXT')])
+        add_missing_columns(self.cursor, 'jphn', [
+            ('contact', 'TEXT'),
+            ('weightage_priority', 'INTEGER DEFAULT 5'),
+        ])
         
         # Create transfer final (confirmed) table
         self.cursor.execute('''
@@ -2965,48 +3823,20 @@ class JPHNManagementSystem(QMainWindow):
             )
         ''')
         
-        # Add preference columns if they don't exist (for existing databases)
-        try:
-            self.cursor.execute('ALTER TABLE transfer_applied ADD COLUMN pref1 TEXT')
-            self.cursor.execute('ALTER TABLE transfer_applied ADD COLUMN pref2 TEXT')
-            self.cursor.execute('ALTER TABLE transfer_applied ADD COLUMN pref3 TEXT')
-            self.cursor.execute('ALTER TABLE transfer_applied ADD COLUMN pref4 TEXT')
-            self.cursor.execute('ALTER TABLE transfer_applied ADD COLUMN pref5 TEXT')
-            self.cursor.execute('ALTER TABLE transfer_applied ADD COLUMN pref6 TEXT')
-            self.cursor.execute('ALTER TABLE transfer_applied ADD COLUMN pref7 TEXT')
-            self.cursor.execute('ALTER TABLE transfer_applied ADD COLUMN pref8 TEXT')
-        except:
-            pass  # Columns already exist
-        
-        # Add receipt_numbers column if it doesn't exist
-        try:
-            self.cursor.execute('ALTER TABLE transfer_applied ADD COLUMN receipt_numbers TEXT')
-        except:
-            pass  # Column already exists
-        
-        # Add special_priority column if it doesn't exist
-        try:
-            self.cursor.execute('ALTER TABLE transfer_applied ADD COLUMN special_priority TEXT DEFAULT "No"')
-        except:
-            pass  # Column already exists
-        
-        # Add special_priority_reason column if it doesn't exist
-        try:
-            self.cursor.execute('ALTER TABLE transfer_applied ADD COLUMN special_priority_reason TEXT')
-        except:
-            pass  # Column already exists
-        
-        # Add weightage_priority column if it doesn't exist
-        try:
-            self.cursor.execute('ALTER TABLE jphn ADD COLUMN weightage_priority INTEGER DEFAULT 5')
-        except:
-            pass  # Column already exists
-        
-        # Add contact column if it doesn't exist
-        try:
-            self.cursor.execute('ALTER TABLE jphn ADD COLUMN contact TEXT')
-        except:
-            pass  # Column already exists
+        # Add preference, receipt and special priority columns (for existing databases)
+        add_missing_columns(self.cursor, 'transfer_applied',
+                            [(f'pref{i}', 'TEXT') for i in range(1, 9)] + [
+                                ('receipt_numbers', 'TEXT'),
+                                ('special_priority', 'TEXT DEFAULT "No"'),
+                                ('special_priority_reason', 'TEXT'),
+                            ])
+        
+        # Most lookups and listings select employees by district, and the
+        # applied lists order each district by duration; the composite index
+        # serves both, so it replaces the plain district index
+        self.cursor.execute('DROP INDEX IF EXISTS idx_jphn_district')
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_jphn_district_duration ON jphn(district, duration_days DESC)')
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_transfer_applied_pref1 ON transfer_applied(pref1)')
         
         # Create settings table to store order number and other settings
         self.cursor.execute('''
@@ -3016,18 +3846,20 @@ class JPHNManagementSystem(QMainWindow):
             )
         ''')
         
-        # Initialize vacancy table with all districts if empty
-        self.cursor.execute('SELECT COUNT(*) FROM vacancy')
-        if self.cursor.fetchone()[0] == 0:
-            for district in self.districts:
-                self.cursor.execute('INSERT INTO vacancy (district, total_strength, vacancy_reported) VALUES (?, 0, 0)', (district,))
+        # Seed a vacancy row for every district; district is the primary key,
+        # so rows that already exist are left untouched
+        self.cursor.executemany('INSERT OR IGNORE INTO vacancy (district, total_strength, vacancy_reported) VALUES (?, 0, 0)',
+                                [(district,) for district in self.districts])
         
-        self.conn.commit()
+        # Refresh the planner statistics so the indexes above are chosen
+        self.cursor.execute('ANALYZE')
+        
+        self._commit()
     
     def get_saved_order_number(self):
         """Get the saved order number from settings"""
         try:
-            self.cursor.execute("SELECT value FROM settings WHERE key = 'order_number'")
+            self.cursor.execute(_ORDER_NUMBER_SELECT_SQL)
             result = self.cursor.fetchone()
             if result:
                 return result[0]
@@ -3038,10 +3870,8 @@ class JPHNManagementSystem(QMainWindow):
     def save_order_number(self, order_number):
         """Save the order number to settings"""
         try:
-            self.cursor.execute('''
-                INSERT OR REPLACE INTO settings (key, value) VALUES ('order_number', ?)
-            ''', (order_number,))
-            self.conn.commit()
+            self.cursor.execute(_ORDER_NUMBER_SAVE_SQL, (order_number,))
+            self._commit()
         except Exception as e:
             print(f"Error saving order number: {e}")
     
@@ -3134,7 +3964,8 @@ class JPHNManagementSystem(QMainWindow):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by Name, PEN, Institution...")
         self.search_input.setFont(QFont("Calibri", 10))
-        self.search_input.textChanged.connect(self.filter_data)
+        # Filter once typing pauses rather than rescanning the table per keystroke
+        self.search_input.textChanged.connect(self._debounce(self.filter_data))
         search_layout.addWidget(QLabel("Search:"))
         search_layout.addWidget(self.search_input)
         
@@ -3264,7 +4095,7 @@ class JPHNManagementSystem(QMainWindow):
         self.applied_search_input = QLineEdit()
         self.applied_search_input.setPlaceholderText("Search by Name, PEN, Institution...")
         self.applied_search_input.setFont(QFont("Calibri", 10))
-        self.applied_search_input.textChanged.connect(self.filter_applied_table)
+        self.applied_search_input.textChanged.connect(self._debounce(self.filter_applied_table))
         filter_layout.addWidget(self.applied_search_input)
         
         filter_layout.addStretch()
@@ -3375,7 +4206,7 @@ class JPHNManagementSystem(QMainWindow):
         self.pref_search_input = QLineEdit()
         self.pref_search_input.setPlaceholderText("Search by Name, PEN, Institution...")
         self.pref_search_input.setFont(QFont("Calibri", 10))
-        self.pref_search_input.textChanged.connect(self.filter_preference_table)
+        self.pref_search_input.textChanged.connect(self._debounce(self.filter_preference_table))
         filter_layout.addWidget(self.pref_search_input)
         
         filter_layout.addStretch()
@@ -3399,6 +4230,10 @@ class JPHNManagementSystem(QMainWindow):
         self.pref_table.setSelectionMode(QTableWidget.ExtendedSelection)
         self.pref_table.setFont(QFont("Calibri", 10))
         self.pref_table.setMouseTracking(True)  # Enable mouse tracking for tooltips
+        # The preferences tooltip is stored once per row on the Name cell and
+        # shown over every cell of the row that has no tooltip of its own
+        self._pref_tooltip_delegate = RowToolTipDelegate(self.pref_table)
+        self.pref_table.setItemDelegate(self._pref_tooltip_delegate)
         
         # Enable double-click to edit
         self.pref_table.doubleClicked.connect(self.edit_applied_employee)
@@ -3407,6 +4242,36 @@ class JPHNManagementSystem(QMainWindow):
         header_font = QFont("Calibri", 10, QFont.Bold)
         self.pref_table.horizontalHeader().setFont(header_font)
         
+        # One pre-formatted cell per column carrying its fixed font, alignment
+        # and background; load_preference_list clones these and only fills in
+        # the values and the per-row highlights
+        self._pref_item_protos = [QTableWidgetItem() for _ in range(10)]
+        for col in (0, 2):  # Name, Institution
+            self._pref_item_protos[col].setFont(_font(10, family="mandaram.ttf"))
+        for col in (4, 5, 7, 9):  # DOJ in District, Duration, Weightage, App. Date
+            self._pref_item_protos[col].setTextAlignment(Qt.AlignCenter)
+        self._pref_item_protos[4].setBackground(_color("#e2e3e5"))  # Light gray
+        self._pref_item_protos[8].setBackground(_color("#fff3cd"))  # Light yellow
+        self._pref_item_protos[9].setBackground(_color("#cce5ff"))  # Light blue
+        
+        # Per-row highlights as (role, value) pairs keyed by (column, state);
+        # setting every role, including None, also clears a reused cell
+        light_green = QBrush(_color("#d4edda"))
+        bold = _font(10, bold=True)
+        self._pref_styles = {
+            # Duration: up to 3 years, more than 3 years, more than 5 years
+            (5, 0): ((Qt.BackgroundRole, None),),
+            (5, 1): ((Qt.BackgroundRole, QBrush(_color("#fff3cd"))),),
+            (5, 2): ((Qt.BackgroundRole, QBrush(_color("#ffcccc"))),),
+            # Preferred District: red bold on light red for special priority
+            (6, False): ((Qt.ForegroundRole, None), (Qt.FontRole, None), (Qt.BackgroundRole, light_green)),
+            (6, True): ((Qt.ForegroundRole, QBrush(_color("#c0392b"))), (Qt.FontRole, bold),
+                        (Qt.BackgroundRole, QBrush(_color("#fadbd8")))),
+            # Weightage: bold on light green when Yes
+            (7, False): ((Qt.BackgroundRole, None), (Qt.FontRole, None)),
+            (7, True): ((Qt.BackgroundRole, light_green), (Qt.FontRole, bold)),
+        }
+        
         pref_layout.addWidget(self.pref_table)
         
         # Buttons Section
@@ -3463,149 +4328,122 @@ class JPHNManagementSystem(QMainWindow):
     
     def load_preference_list(self):
         """Load applied employees list"""
-        self.pref_table.setUpdatesEnabled(False)
-        self.pref_table.setSortingEnabled(False)
-        self.pref_table.setRowCount(0)
+        table = self.pref_table
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.clearSelection()
         
         current_district = self.pref_district_filter.currentText()
         to_district = self.pref_to_district_filter.currentText()
         
-        # Build query with both current and to district filters
-        where_clauses = []
-        params = []
-        
-        if current_district != "All Districts":
-            where_clauses.append("j.district = ?")
-            params.append(current_district)
-        
-        if to_district != "All Districts":
-            # Filter by first preference only (Most Preferred District)
-            where_clauses.append("t.pref1 = ?")
-            params.append(to_district)
-        
-        where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
-        
-        query = f'''
-            SELECT j.pen, j.name, j.institution, j.district,
-                   t.receipt_numbers, t.applied_date, j.duration_days,
-                   t.pref1, t.pref2, t.pref3, t.pref4, t.pref5, t.pref6, t.pref7, t.pref8,
-                   t.special_priority, j.weightage, j.weightage_details, j.district_join_date
-            FROM jphn j
-            INNER JOIN transfer_applied t ON j.pen = t.pen
-            WHERE {where_sql}
-            ORDER BY j.district, j.duration_days DESC
-        '''
-        self.cursor.execute(query, params)
+        # Pick the pre-built query for the active current and to district filters
+        filters = (current_district != "All Districts", to_district != "All Districts")
+        params = [value for value, on in zip((current_district, to_district), filters) if on]
+        self.cursor.execute(_PREFERENCE_LIST_SQL[filters], params)
+        
+        # Cells left from the previous load are reused and only have their
+        # values and highlights rewritten; new cells are cloned from the
+        # column prototypes
+        protos = self._pref_item_protos
+        styles = self._pref_styles
+        
+        def cell(row, col):
+            item = table.item(row, col)
+            if item is None:
+                item = protos[col].clone()
+                table.setItem(row, col, item)
+            return item
+        
+        # Stream the rows in batches rather than materialising them all first;
+        # the table only grows when a batch needs more rows than it has
+        row_count = 0
+        for batch in _chunks(self.cursor, 200):
+            if table.rowCount() < row_count + len(batch):
+                table.setRowCount(row_count + len(batch))
+            for row_idx, record in enumerate(batch, start=row_count):
+                pen = record[0]
+                special_priority = record[15] if len(record) > 15 and record[15] else None
+                is_special = special_priority and str(special_priority).lower() == 'yes'
+                
+                # Preferences tooltip, built once and shared by every row with
+                # the same preference list
+                tooltip = _preference_tooltip(record[7:15], bool(is_special))
+                
+                # Name
+                name_item = cell(row_idx, 0)
+                name_item.setText(str(record[1]) if record[1] else "")
+                name_item.setToolTip(tooltip)
+                name_item.setData(Qt.UserRole, pen)  # Store PEN for editing
+                # Lower-cased Name, PEN, Institution and District for the search box
+                name_item.setData(_SEARCH_ROLE, "".join(f"{value} " if value else " " for value in (record[1], pen, record[2], record[3])).lower())
+                
+                # PEN
+                pen_item = cell(row_idx, 1)
+                pen_item.setText(str(pen) if pen else "")
+                
+                # Institution
+                inst_item = cell(row_idx, 2)
+                inst_item.setText(str(record[2]) if record[2] else "")
+                
+                # Current District
+                district_item = cell(row_idx, 3)
+                district_item.setText(str(record[3]) if record[3] else "")
+                
+                # DOJ in District (Date of Joining in Present District)
+                doj_district = record[18] if len(record) > 18 and record[18] else ""  # district_join_date is at index 18
+                doj_item = cell(row_idx, 4)
+                doj_item.setText(str(doj_district))
+                
+                # Duration
+                duration = record[6] if record[6] else 0
+                duration_item = cell(row_idx, 5)
+                duration_item.setText(record[19])
+                # Highlight long durations
+                for role, value in styles[5, (duration > 1095) + (duration > 1825)]:
+                    duration_item.setData(role, value)
+                
+                # Preferred District (First Preference - pref1)
+                pref_district = record[7] if record[7] else ""  # pref1 is at index 7
+                pref_district_item = cell(row_idx, 6)
+                pref_district_item.setText(str(pref_district))
+                for role, value in styles[6, bool(is_special)]:
+                    pref_district_item.setData(role, value)
+                
+                # Weightage
+                weightage_details = record[17] if record[17] else ""
+                weightage_display = record[20]
+                weightage_item = cell(row_idx, 7)
+                weightage_item.setText(weightage_display)
+                # Show weightage details in tooltip
+                if weightage_display == "Yes" and weightage_details:
+                    weightage_item.setToolTip(f"Weightage Details:\n{weightage_details}")
+                elif weightage_display == "Yes":
+                    weightage_item.setToolTip("Weightage: Yes (No details provided)")
+                else:
+                    weightage_item.setToolTip("No weightage")
+                for role, value in styles[7, weightage_display == "Yes"]:
+                    weightage_item.setData(role, value)
+                
+                # Receipt Numbers
+                receipt_item = cell(row_idx, 8)
+                receipt_item.setText(str(record[4]) if record[4] else "")
+                
+                # Application Date
+                date_item = cell(row_idx, 9)
+                date_item.setText(str(record[5]) if record[5] else "")
+            
+            row_count += len(batch)
         
-        records = self.cursor.fetchall()
-        self.pref_table.setRowCount(len(records))
+        # Drop rows left over from a longer previous load
+        table.setRowCount(row_count)
         
-        for row_idx, record in enumerate(records):
-            pen = record[0]
-            special_priority = record[15] if len(record) > 15 and record[15] else None
-            is_special = special_priority and str(special_priority).lower() == 'yes'
-            
-            # Build preferences tooltip
-            prefs = [record[i] for i in range(7, 15) if record[i]]
-            if prefs:
-                tooltip = "District Preferences:\n" + "\n".join([f"{i+1}. {p}" for i, p in enumerate(prefs)])
-            else:
-                tooltip = "No preferences set"
-            if is_special:
-                tooltip = "🔴 SPECIAL PRIORITY\n\n" + tooltip
-            
-            # Name
-            name_item = QTableWidgetItem(str(record[1]) if record[1] else "")
-            name_item.setFont(QFont("mandaram.ttf", 10))
-            name_item.setToolTip(tooltip)
-            name_item.setData(Qt.UserRole, pen)  # Store PEN for editing
-            self.pref_table.setItem(row_idx, 0, name_item)
-            
-            # PEN
-            pen_item = QTableWidgetItem(str(pen) if pen else "")
-            pen_item.setToolTip(tooltip)
-            self.pref_table.setItem(row_idx, 1, pen_item)
-            
-            # Institution
-            inst_item = QTableWidgetItem(str(record[2]) if record[2] else "")
-            inst_item.setFont(QFont("mandaram.ttf", 10))
-            inst_item.setToolTip(tooltip)
-            self.pref_table.setItem(row_idx, 2, inst_item)
-            
-            # Current District
-            district_item = QTableWidgetItem(str(record[3]) if record[3] else "")
-            district_item.setToolTip(tooltip)
-            self.pref_table.setItem(row_idx, 3, district_item)
-            
-            # DOJ in District (Date of Joining in Present District)
-            doj_district = record[18] if len(record) > 18 and record[18] else ""  # district_join_date is at index 18
-            doj_item = QTableWidgetItem(str(doj_district))
-            doj_item.setTextAlignment(Qt.AlignCenter)
-            doj_item.setToolTip(tooltip)
-            doj_item.setBackground(QColor("#e2e3e5"))  # Light gray
-            self.pref_table.setItem(row_idx, 4, doj_item)
-            
-            # Duration
-            duration = record[6] if record[6] else 0
-            duration_item = QTableWidgetItem(self.format_duration(duration))
-            duration_item.setTextAlignment(Qt.AlignCenter)
-            duration_item.setToolTip(tooltip)
-            # Highlight long durations
-            if duration > 1825:  # More than 5 years
-                duration_item.setBackground(QColor("#ffcccc"))
-            elif duration > 1095:  # More than 3 years
-                duration_item.setBackground(QColor("#fff3cd"))
-            self.pref_table.setItem(row_idx, 5, duration_item)
-            
-            # Preferred District (First Preference - pref1)
-            pref_district = record[7] if record[7] else ""  # pref1 is at index 7
-            pref_district_item = QTableWidgetItem(str(pref_district))
-            pref_district_item.setToolTip(tooltip)
-            if is_special:
-                # Red bold for special priority
-                pref_district_item.setForeground(QColor("#c0392b"))  # Red color
-                pref_district_item.setFont(QFont("Calibri", 10, QFont.Bold))
-                pref_district_item.setBackground(QColor("#fadbd8"))  # Light red background
-            else:
-                pref_district_item.setBackground(QColor("#d4edda"))  # Light green
-            self.pref_table.setItem(row_idx, 6, pref_district_item)
-            
-            # Weightage
-            weightage_val = record[16] if len(record) > 16 else None
-            weightage_details = record[17] if len(record) > 17 and record[17] else ""
-            weightage_display = "Yes" if weightage_val and str(weightage_val).lower() in ["yes", "y", "1", "true"] else "No"
-            weightage_item = QTableWidgetItem(weightage_display)
-            weightage_item.setTextAlignment(Qt.AlignCenter)
-            # Show weightage details in tooltip
-            if weightage_display == "Yes" and weightage_details:
-                weightage_item.setToolTip(f"Weightage Details:\n{weightage_details}")
-                weightage_item.setBackground(QColor("#d4edda"))  # Light green
-                weightage_item.setFont(QFont("Calibri", 10, QFont.Bold))
-            elif weightage_display == "Yes":
-                weightage_item.setToolTip("Weightage: Yes (No details provided)")
-                weightage_item.setBackground(QColor("#d4edda"))  # Light green
-                weightage_item.setFont(QFont("Calibri", 10, QFont.Bold))
-            else:
-                weightage_item.setToolTip("No weightage")
-            self.pref_table.setItem(row_idx, 7, weightage_item)
-            
-            # Receipt Numbers
-            receipt_item = QTableWidgetItem(str(record[4]) if record[4] else "")
-            receipt_item.setBackground(QColor("#fff3cd"))  # Light yellow
-            receipt_item.setToolTip(tooltip)
-            self.pref_table.setItem(row_idx, 8, receipt_item)
-            
-            # Application Date
-            date_item = QTableWidgetItem(str(record[5]) if record[5] else "")
-            date_item.setTextAlignment(Qt.AlignCenter)
-            date_item.setBackground(QColor("#cce5ff"))  # Light blue
-            date_item.setToolTip(tooltip)
-            self.pref_table.setItem(row_idx, 9, date_item)
+        table.setUpdatesEnabled(True)
+        table.setSortingEnabled(True)
         
-        self.pref_table.setUpdatesEnabled(True)
-        self.pref_table.setSortingEnabled(True)
+        # Reused rows keep their hidden state, so re-apply the search box
+        self.filter_preference_table()
         
-        self.pref_summary_label.setText(f"Applied Employees: {len(records)}")
+        self.pref_summary_label.setText(f"Applied Employees: {row_count}")
     
     def export_applied_employees_to_excel(self):
         """Export Applied Employees List to Excel"""
@@ -3623,7 +4461,7 @@ class JPHNManagementSystem(QMainWindow):
             return
         
         try:
-            import openpyxl
+            openpyxl = _get_openpyxl()
             from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
             
             wb = openpyxl.Workbook()
@@ -3743,7 +4581,7 @@ class JPHNManagementSystem(QMainWindow):
                 for pen, name in selected_employees:
                     self.cursor.execute('DELETE FROM transfer_applied WHERE pen = ?', (pen,))
                 
-                self.conn.commit()
+                self._commit()
                 self.load_preference_list()
                 
                 if len(selected_employees) == 1:
@@ -3896,6 +4734,9 @@ class JPHNManagementSystem(QMainWindow):
         self.cursor.execute('SELECT DISTINCT district FROM jphn WHERE district IS NOT NULL ORDER BY district')
         districts = [row[0] for row in self.cursor.fetchall()]
         
+        # District -> combo row, after the "Select District" placeholder
+        district_rows = {d: i for i, d in enumerate(districts, start=1)}
+        
         # Create 8 preference combo boxes
         pref_combos = []
         pref_grid = QGridLayout()
@@ -3909,8 +4750,8 @@ class JPHNManagementSystem(QMainWindow):
             
             # Set current value if exists
             if prefs[i]:
-                idx = combo.findText(str(prefs[i]))
-                if idx >= 0:
+                idx = district_rows.get(str(prefs[i]))
+                if idx is not None:
                     combo.setCurrentIndex(idx)
             
             pref_combos.append(combo)
@@ -3971,7 +4812,7 @@ class JPHNManagementSystem(QMainWindow):
                     pen
                 ))
                 
-                self.conn.commit()
+                self._commit()
                 dialog.accept()
                 self.load_preference_list()
                 QMessageBox.information(self, "Success", "Application updated successfully!")
@@ -4074,15 +4915,16 @@ class JPHNManagementSystem(QMainWindow):
         enable_against_transfer = self.enable_against_check.isChecked()
         
         try:
-            # Get current vacancy status for all districts
+            # Get current vacancy status for all districts, reading the reported
+            # vacancies and the draft counts with one query each
+            reported_by_district = dict(self.cursor.execute(
+                'SELECT district, vacancy_reported FROM vacancy').fetchall())
+            filled_by_district = dict(self.cursor.execute(
+                'SELECT transfer_to_district, COUNT(*) FROM transfer_draft GROUP BY transfer_to_district').fetchall())
             vacancy_status = {}
             for district in self.districts:
-                self.cursor.execute('SELECT vacancy_reported FROM vacancy WHERE district = ?', (district,))
-                result = self.cursor.fetchone()
-                vacancy_reported = result[0] if result else 0
-                
-                self.cursor.execute('SELECT COUNT(*) FROM transfer_draft WHERE transfer_to_district = ?', (district,))
-                filled_count = self.cursor.fetchone()[0]
+                vacancy_reported = reported_by_district.get(district) or 0
+                filled_count = filled_by_district.get(district, 0)
                 
                 vacancy_status[district] = {
                     'reported': vacancy_reported,
@@ -4099,6 +4941,10 @@ class JPHNManagementSystem(QMainWindow):
             not_allocated = []
             allocation_details = []
             
+            # Employees already in the draft list, kept current as employees are allocated
+            drafted_pens = {row[0] for row in self.cursor.execute('SELECT pen FROM transfer_draft').fetchall()}
+            added_date = datetime.now().strftime("%d-%m-%Y")
+            
             # STEP 0: Process employees WITH SPECIAL PRIORITY first (HIGHEST PRIORITY)
             self.cursor.execute('''
                 SELECT t.pen, j.name, j.district, j.duration_days, t.special_priority,
@@ -4118,8 +4964,7 @@ class JPHNManagementSystem(QMainWindow):
                 preferences = [pref1, pref2, pref3, pref4, pref5, pref6, pref7, pref8]
                 
                 # Check if already in draft list
-                self.cursor.execute('SELECT 1 FROM transfer_draft WHERE pen = ?', (pen,))
-                if self.cursor.fetchone():
+                if pen in drafted_pens:
                     continue  # Skip if already in draft
                 
                 # Try each preference in order for special priority employees
@@ -4135,7 +4980,8 @@ class JPHNManagementSystem(QMainWindow):
                             self.cursor.execute('''
                                 INSERT INTO transfer_draft (pen, transfer_to_district, added_date, against_info)
                                 VALUES (?, ?, ?, NULL)
-                            ''', (pen, pref_district, datetime.now().strftime("%d-%m-%Y")))
+                            ''', (pen, pref_district, added_date))
+                            drafted_pens.add(pen)
                             
                             # Update vacancy status
                             if vacancy_status[pref_district]['reported'] > 0:
@@ -4152,6 +4998,7 @@ class JPHNManagementSystem(QMainWindow):
                 if not allocated and pref1 and enable_against_transfer:
                     against_result = self.try_against_transfer(pen, name, pref1, vacancy_status)
                     if against_result:
+                        drafted_pens.add(pen)
                         allocated = True
                         allocated_count += 1
                         special_allocated += 1
@@ -4183,8 +5030,7 @@ class JPHNManagementSystem(QMainWindow):
                 priority_text = f"P{weightage_priority}" if weightage_priority else "P5"
                 
                 # Check if already in draft list
-                self.cursor.execute('SELECT 1 FROM transfer_draft WHERE pen = ?', (pen,))
-                if self.cursor.fetchone():
+                if pen in drafted_pens:
                     continue  # Skip if already in draft
                 
                 # Try each preference in order for weightage employees (normal allocation only)
@@ -4200,7 +5046,8 @@ class JPHNManagementSystem(QMainWindow):
                             self.cursor.execute('''
                                 INSERT INTO transfer_draft (pen, transfer_to_district, added_date, against_info)
                                 VALUES (?, ?, ?, NULL)
-                            ''', (pen, pref_district, datetime.now().strftime("%d-%m-%Y")))
+                            ''', (pen, pref_district, added_date))
+                            drafted_pens.add(pen)
                             
                             # Update vacancy status
                             if vacancy_status[pref_district]['reported'] > 0:
@@ -4217,6 +5064,7 @@ class JPHNManagementSystem(QMainWindow):
                 if not allocated and pref1 and enable_against_transfer:
                     against_result = self.try_against_transfer(pen, name, pref1, vacancy_status)
                     if against_result:
+                        drafted_pens.add(pen)
                         allocated = True
                         allocated_count += 1
                         weightage_allocated += 1
@@ -4246,8 +5094,7 @@ class JPHNManagementSystem(QMainWindow):
                 preferences = [pref1, pref2, pref3, pref4, pref5, pref6, pref7, pref8]
                 
                 # Check if already in draft list
-                self.cursor.execute('SELECT 1 FROM transfer_draft WHERE pen = ?', (pen,))
-                if self.cursor.fetchone():
+                if pen in drafted_pens:
                     continue  # Skip if already in draft
                 
                 # Try each preference in order (normal allocation only)
@@ -4263,7 +5110,8 @@ class JPHNManagementSystem(QMainWindow):
                             self.cursor.execute('''
                                 INSERT INTO transfer_draft (pen, transfer_to_district, added_date, against_info)
                                 VALUES (?, ?, ?, NULL)
-                            ''', (pen, pref_district, datetime.now().strftime("%d-%m-%Y")))
+                            ''', (pen, pref_district, added_date))
+                            drafted_pens.add(pen)
                             
                             # Update vacancy status
                             if vacancy_status[pref_district]['reported'] > 0:
@@ -4280,6 +5128,7 @@ class JPHNManagementSystem(QMainWindow):
                 if not allocated and pref1 and enable_against_transfer:
                     against_result = self.try_against_transfer(pen, name, pref1, vacancy_status)
                     if against_result:
+                        drafted_pens.add(pen)
                         allocated = True
                         allocated_count += 1
                         normal_allocated += 1
@@ -4289,7 +5138,7 @@ class JPHNManagementSystem(QMainWindow):
                 if not allocated:
                     not_allocated.append(name)
             
-            self.conn.commit()
+            self._commit()
             
             # Prepare result message
             msg = f"Auto-Fill Complete!\n\n"
@@ -4572,7 +5421,7 @@ class JPHNManagementSystem(QMainWindow):
                       data['district_join_date'], duration, data['institution_join_date'],
                       data['weightage'], data['weightage_details']))
                 
-                self.conn.commit()
+                self._commit()
                 
                 # Refresh the cadre list
                 self.load_data()
@@ -4660,28 +5509,24 @@ class JPHNManagementSystem(QMainWindow):
             special_priority_reason = data.get('special_priority_reason', '')
             
             try:
-                added_count = 0
-                for pen, name in new_employees:
-                    # Insert new application record with preferences and special priority
-                    self.cursor.execute('''
-                        INSERT INTO transfer_applied (pen, applied_to_district, applied_date, receipt_numbers,
-                                                      pref1, pref2, pref3, pref4, pref5, pref6, pref7, pref8,
-                                                      special_priority, special_priority_reason)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (pen, "", data['application_date'], data['receipt_numbers'],
-                          preferences[0], preferences[1], preferences[2], preferences[3],
-                          preferences[4], preferences[5], preferences[6], preferences[7],
-                          special_priority, special_priority_reason))
-                    
-                    # Update weightage in jphn table if provided
-                    if data['has_weightage']:
-                        self.cursor.execute('''
-                            UPDATE jphn SET weightage = 'Yes', weightage_details = ?, weightage_priority = ? WHERE pen = ?
-                        ''', (data['weightage_details'], weightage_priority, pen))
-                    
-                    added_count += 1
+                # Insert new application records with preferences and special priority
+                self.cursor.executemany('''
+                    INSERT INTO transfer_applied (pen, applied_to_district, applied_date, receipt_numbers,
+                                                  pref1, pref2, pref3, pref4, pref5, pref6, pref7, pref8,
+                                                  special_priority, special_priority_reason)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', [(pen, "", data['application_date'], data['receipt_numbers'],
+                       *preferences[:8], special_priority, special_priority_reason)
+                      for pen, name in new_employees])
+                
+                # Update weightage in jphn table if provided
+                if data['has_weightage']:
+                    self.cursor.executemany('''
+                        UPDATE jphn SET weightage = 'Yes', weightage_details = ?, weightage_priority = ? WHERE pen = ?
+                    ''', [(data['weightage_details'], weightage_priority, pen) for pen, name in new_employees])
                 
-                self.conn.commit()
+                added_count = len(new_employees)
+                self._commit()
                 self.load_employees_for_application()
                 self.load_data()  # Refresh cadre list to update weightage
                 
@@ -4737,7 +5582,7 @@ class JPHNManagementSystem(QMainWindow):
         self.draft_search_input = QLineEdit()
         self.draft_search_input.setPlaceholderText("Search by Name, PEN, Institution...")
         self.draft_search_input.setFont(QFont("Calibri", 10))
-        self.draft_search_input.textChanged.connect(self.filter_draft_table)
+        self.draft_search_input.textChanged.connect(self._debounce(self.filter_draft_table))
         filter_layout.addWidget(self.draft_search_input)
         
         filter_layout.addStretch()
@@ -4837,7 +5682,7 @@ class JPHNManagementSystem(QMainWindow):
         self.transfer_search_input = QLineEdit()
         self.transfer_search_input.setPlaceholderText("Search by Name, PEN, Institution...")
         self.transfer_search_input.setFont(QFont("Calibri", 10))
-        self.transfer_search_input.textChanged.connect(self.filter_transfer_table)
+        self.transfer_search_input.textChanged.connect(self._debounce(self.filter_transfer_table))
         filter_layout.addWidget(self.transfer_search_input)
         
         filter_layout.addStretch()
@@ -5093,6 +5938,7 @@ class JPHNManagementSystem(QMainWindow):
     def save_vacancy_data(self):
         """Save vacancy data from table to database"""
         try:
+            updates = []
             for row in range(self.vacancy_table.rowCount()):
                 district = self.vacancy_table.item(row, 0).text()
                 
@@ -5108,12 +5954,12 @@ class JPHNManagementSystem(QMainWindow):
                     QMessageBox.warning(self, "Invalid Input", f"Please enter valid numbers for {district}")
                     return
                 
-                # Update database
-                self.cursor.execute('''
-                    UPDATE vacancy SET total_strength = ?, vacancy_reported = ? WHERE district = ?
-                ''', (total_strength, vacancy_reported, district))
+                updates.append((total_strength, vacancy_reported, district))
             
-            self.conn.commit()
+            # Update database
+            self._bulk_execute('''
+                UPDATE vacancy SET total_strength = ?, vacancy_reported = ? WHERE district = ?
+            ''', updates)
             self.load_vacancy_data()  # Refresh to show updated calculations
             QMessageBox.information(self, "Success", "Vacancy data saved successfully!")
         except Exception as e:
@@ -5169,6 +6015,44 @@ class JPHNManagementSystem(QMainWindow):
         elif index == 3:  # Transfer List tab
             self.load_transfer_list()
     
+    def _debounce(self, slot, msec=150):
+        """Return a slot that runs slot once, msec after the last of a burst of calls"""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(msec)
+        timer.timeout.connect(slot)
+        return lambda *args: timer.start()
+    
+    def _begin(self):
+        """Open an explicit transaction for a multi-statement write"""
+        # IMMEDIATE takes the write lock up front, so a transaction that reads
+        # before it writes cannot fail with SQLITE_BUSY halfway through
+        self.cursor.execute('BEGIN IMMEDIATE')
+    
+    def _commit(self):
+        """Commit the current transaction and leave the WAL for the next checkpoint"""
+        self.conn.commit()
+        self._dirty = True
+    
+    def _bulk_execute(self, sql, rows):
+        """Run any parametrised statement over rows with executemany (bulk_insert) and mark the WAL dirty"""
+        bulk_insert(self.conn, sql, rows)
+        self._dirty = True
+    
+    def _maybe_checkpoint(self):
+        """Run a passive WAL checkpoint if anything was committed since the last one"""
+        if not self._dirty:
+            return
+        self.conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        self._dirty = False
+    
+    def _close_database(self):
+        """Checkpoint any pending commits and close the database connection"""
+        self._checkpoint_timer.stop()
+        self._maybe_checkpoint()
+        self.conn.close()
+        self.conn = None
+    
     def go_back_to_selection(self):
         """Go back to transfer type selection screen"""
         reply = QMessageBox.question(self, "Go Back", 
@@ -5178,41 +6062,24 @@ class JPHNManagementSystem(QMainWindow):
         if reply == QMessageBox.Yes:
             # Close database connection
             if hasattr(self, 'conn') and self.conn:
-                self.conn.close()
+                self._close_database()
             # Set a flag to indicate restart is needed
             self.restart_requested = True
             self.close()
     
     def load_transfer_list(self):
         """Load confirmed transfer list from transfer_final table"""
+        self.transfer_table.setUpdatesEnabled(False)
         self.transfer_table.setSortingEnabled(False)
         self.transfer_table.setRowCount(0)
         
         current_district = self.transfer_current_district_filter.currentText()
         to_district = self.transfer_district_filter.currentText()
         
-        # Build query - join jphn with transfer_final, filter by both Current and To District
-        where_clauses = []
-        params = []
-        
-        if current_district != "All Districts":
-            where_clauses.append("j.district = ?")
-            params.append(current_district)
-        
-        if to_district != "All Districts":
-            where_clauses.append("t.transfer_to_district = ?")
-            params.append(to_district)
-        
-        where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
-        
-        query = f'''SELECT j.pen, j.name, j.institution, j.district, 
-                          t.transfer_to_district, j.district_join_date, 
-                          j.duration_days, j.weightage, j.weightage_details 
-                   FROM jphn j
-                   INNER JOIN transfer_final t ON j.pen = t.pen
-                   WHERE {where_sql}
-                   ORDER BY t.transfer_to_district, j.duration_days DESC'''
-        self.cursor.execute(query, params)
+        # Pick the pre-built query for the active current and to district filters
+        filters = (current_district != "All Districts", to_district != "All Districts")
+        params = [value for value, on in zip((current_district, to_district), filters) if on]
+        self.cursor.execute(_TRANSFER_LIST_SQL[filters], params)
         
         records = self.cursor.fetchall()
         
@@ -5274,6 +6141,7 @@ class JPHNManagementSystem(QMainWindow):
             details_item.setFont(QFont("mandaram.ttf", 9))
             self.transfer_table.setItem(row_idx, 9, details_item)
         
+        self.transfer_table.setUpdatesEnabled(True)
         self.transfer_table.setSortingEnabled(True)
         
         # Update summary with both filter values
@@ -5495,38 +6363,17 @@ class JPHNManagementSystem(QMainWindow):
 
     def load_draft_list(self):
         """Load draft transfer list - only employees added to transfer list"""
+        self.draft_table.setUpdatesEnabled(False)
         self.draft_table.setSortingEnabled(False)
         self.draft_table.setRowCount(0)
         
         current_district = self.draft_current_district_filter.currentText()
         to_district = self.draft_district_filter.currentText()
         
-        # Build query - join jphn with transfer_draft, check if employee EXISTS in transfer_applied
-        # Apply both current district and to district filters
-        where_clauses = []
-        params = []
-        
-        if current_district != "All Districts":
-            where_clauses.append("j.district = ?")
-            params.append(current_district)
-        
-        if to_district != "All Districts":
-            where_clauses.append("t.transfer_to_district = ?")
-            params.append(to_district)
-        
-        where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
-        
-        query = f'''SELECT j.pen, j.name, j.institution, j.district, 
-                          t.transfer_to_district, j.district_join_date, 
-                          j.duration_days, j.weightage, j.weightage_details,
-                          (SELECT 1 FROM transfer_applied WHERE pen = j.pen) as has_applied,
-                          t.against_info,
-                          (SELECT special_priority FROM transfer_applied WHERE pen = j.pen) as special_priority
-                   FROM jphn j
-                   INNER JOIN transfer_draft t ON j.pen = t.pen
-                   WHERE {where_sql}
-                   ORDER BY t.transfer_to_district, j.duration_days DESC'''
-        self.cursor.execute(query, params)
+        # Pick the pre-built query for the active current and to district filters
+        filters = (current_district != "All Districts", to_district != "All Districts")
+        params = [value for value, on in zip((current_district, to_district), filters) if on]
+        self.cursor.execute(_DRAFT_LIST_SQL[filters], params)
         
         records = self.cursor.fetchall()
         
@@ -5619,6 +6466,7 @@ class JPHNManagementSystem(QMainWindow):
             details_item.setFont(QFont("mandaram.ttf", 9))
             self.draft_table.setItem(row_idx, 10, details_item)
         
+        self.draft_table.setUpdatesEnabled(True)
         self.draft_table.setSortingEnabled(True)
         
         # Update summary with both filters
@@ -5672,7 +6520,7 @@ class JPHNManagementSystem(QMainWindow):
                     self.cursor.execute('DELETE FROM transfer_draft WHERE pen = ?', (pen,))
                     removed_count += 1
                 
-                self.conn.commit()
+                self._commit()
                 
                 # Force refresh of both draft list and vacancy data
                 self.load_draft_list()
@@ -5828,7 +6676,7 @@ class JPHNManagementSystem(QMainWindow):
                                 VALUES (?, ?, ?, NULL)
                             ''', (pen, current_alloc, datetime.now().strftime("%d-%m-%Y")))
             
-            self.conn.commit()
+            self._commit()
             self.load_draft_list()
             
             total_changes = swaps_made + against_made
@@ -5919,7 +6767,7 @@ class JPHNManagementSystem(QMainWindow):
                     SELECT pen, transfer_to_district, ? FROM transfer_draft
                 ''', (datetime.now().strftime("%d-%m-%Y"),))
                 
-                self.conn.commit()
+                self._commit()
                 
                 # Switch to Transfer List tab
                 self.tab_widget.setCurrentIndex(2)
@@ -6035,7 +6883,7 @@ class JPHNManagementSystem(QMainWindow):
                         INSERT INTO transfer_draft (pen, transfer_to_district, added_date)
                         VALUES (?, ?, ?)
                     ''', (pen, transfer_district, datetime.now().strftime("%d-%m-%Y")))
-                    self.conn.commit()
+                    self._commit()
                     QMessageBox.information(self, "Success", f"{name} added to transfer list!")
                     if hasattr(self, 'draft_table'):
                         self.load_draft_list()
@@ -6075,15 +6923,14 @@ class JPHNManagementSystem(QMainWindow):
                         return
                     
                     try:
-                        added_count = 0
-                        for pen, name in employees:
-                            self.cursor.execute('''
-                                INSERT INTO transfer_draft (pen, transfer_to_district, added_date)
-                                VALUES (?, ?, ?)
-                            ''', (pen, transfer_district, datetime.now().strftime("%d-%m-%Y")))
-                            added_count += 1
+                        added_date = datetime.now().strftime("%d-%m-%Y")
+                        self.cursor.executemany('''
+                            INSERT INTO transfer_draft (pen, transfer_to_district, added_date)
+                            VALUES (?, ?, ?)
+                        ''', [(pen, transfer_district, added_date) for pen, name in employees])
+                        added_count = len(employees)
                         
-                        self.conn.commit()
+                        self._commit()
                         QMessageBox.information(self, "Success", f"{added_count} employee(s) added to transfer list!")
                         if hasattr(self, 'draft_table'):
                             self.load_draft_list()
@@ -6118,7 +6965,7 @@ class JPHNManagementSystem(QMainWindow):
                                 QMessageBox.critical(self, "Error", f"Failed to add {name}: {str(e)}")
                 
                 if added_count > 0:
-                    self.conn.commit()
+                    self._commit()
                     msg = f"{added_count} employee(s) added to transfer list!"
                     if skipped_districts:
                         msg += f"\n\nSkipped due to full vacancy:\n" + "\n".join(skipped_districts)
@@ -6163,84 +7010,7 @@ class JPHNManagementSystem(QMainWindow):
     
     def apply_styles(self):
         """Apply modern stylesheet"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QLabel {
-                color: #2c3e50;
-            }
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #21618c;
-            }
-            QLineEdit, QComboBox, QDateEdit, QSpinBox {
-                padding: 6px;
-                border: 2px solid #bdc3c7;
-                border-radius: 4px;
-                background-color: white;
-            }
-            QLineEdit:focus, QComboBox:focus, QDateEdit:focus, QSpinBox:focus {
-                border: 2px solid #3498db;
-            }
-            QTableWidget {
-                background-color: white;
-                border: 1px solid #bdc3c7;
-                border-radius: 4px;
-                gridline-color: #ecf0f1;
-            }
-            QTableWidget::item {
-                padding: 5px;
-            }
-            QTableWidget::item:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QHeaderView::section {
-                background-color: #34495e;
-                color: white;
-                padding: 8px;
-                border: none;
-                font-weight: bold;
-            }
-            QTextEdit {
-                border: 2px solid #bdc3c7;
-                border-radius: 4px;
-                background-color: white;
-            }
-            QTabWidget::pane {
-                border: 1px solid #bdc3c7;
-                border-radius: 4px;
-                background-color: white;
-            }
-            QTabBar::tab {
-                background-color: #ecf0f1;
-                color: #2c3e50;
-                padding: 10px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                font-weight: bold;
-            }
-            QTabBar::tab:selected {
-                background-color: #3498db;
-                color: white;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #bdc3c7;
-            }
-        """)
+        self.setStyleSheet(self._STYLESHEET)
     
     def calculate_duration(self, join_date_str):
         """Calculate duration in days from join date to today"""
@@ -6272,6 +7042,7 @@ class JPHNManagementSystem(QMainWindow):
     
     def load_data(self):
         """Load data from database into table"""
+        self.table.setUpdatesEnabled(False)
         self.table.setSortingEnabled(False)
         self.table.setRowCount(0)
         
@@ -6279,6 +7050,14 @@ class JPHNManagementSystem(QMainWindow):
         self.cursor.execute('SELECT pen FROM transfer_applied')
         applied_pens = set(row[0] for row in self.cursor.fetchall())
         
+        # Bring every stored duration up to today in one statement, rewriting
+        # only the rows whose value changed
+        self.cursor.execute(f'''
+            UPDATE jphn SET duration_days = {_DURATION_DAYS_SQL}
+            WHERE duration_days IS NOT {_DURATION_DAYS_SQL}
+        ''')
+        self._commit()
+        
         # Select specific columns in order we need for display
         # Table columns: PEN, Name, Designation, Institution, District, Entry Date, 
         #                Retirement Date, District Join Date, Duration, Contact
@@ -6294,11 +7073,6 @@ class JPHNManagementSystem(QMainWindow):
         light_red = QColor(255, 200, 200)  # Light red/pink background
         
         for row_idx, record in enumerate(records):
-            # Update duration (district_join_date is at index 7)
-            duration = self.calculate_duration(record[7])
-            self.cursor.execute('UPDATE jphn SET duration_days = ? WHERE pen = ?', 
-                              (duration, record[0]))
-            
             self.table.insertRow(row_idx)
             # Set row number in vertical header (starting from 1)
             self.table.setVerticalHeaderItem(row_idx, QTableWidgetItem(str(row_idx + 1)))
@@ -6311,16 +7085,16 @@ class JPHNManagementSystem(QMainWindow):
             #         6-retirement_date, 7-district_join_date, 8-duration_days, 9-contact
             for col_idx, value in enumerate(record):
                 if col_idx == 8:  # Duration column - format as Y M D
-                    value = self.format_duration(duration)
+                    value = self.format_duration(value)
                 item = QTableWidgetItem(str(value) if value else "")
                 if col_idx in [1, 3]:  # Name, Institution
-                    item.setFont(QFont("mandaram.ttf", 9))
+                    item.setFont(_font(9, family="mandaram.ttf"))
                 # Highlight applied employees with light red background
                 if is_applied:
                     item.setBackground(light_red)
                 self.table.setItem(row_idx, col_idx, item)
         
-        self.conn.commit()
+        self.table.setUpdatesEnabled(True)
         self.table.setSortingEnabled(True)
         self.statusBar().showMessage(f"Loaded {len(records)} records | Applied for transfer: {len(applied_pens)} (shown in light red)")
         
@@ -6438,14 +7212,11 @@ class JPHNManagementSystem(QMainWindow):
             show_row = True
             
             if search_text:
-                row_text = ""
-                # Search in Name, PEN, Institution, Current District columns (0-3)
-                for col in range(4):
-                    item = self.pref_table.item(row, col)
-                    if item:
-                        row_text += item.text().lower() + " "
-                
-                if search_text not in row_text:
+                # Name, PEN, Institution and Current District (columns 0-3),
+                # joined and lower-cased once by load_preference_list
+                item = self.pref_table.item(row, 0)
+                row_text = item.data(_SEARCH_ROLE) if item else None
+                if not row_text or search_text not in row_text:
                     show_row = False
             
             self.pref_table.setRowHidden(row, not show_row)
@@ -6508,7 +7279,7 @@ class JPHNManagementSystem(QMainWindow):
                       data['district_join_date'], duration, data['institution_join_date'],
                       data['weightage'], data['weightage_details'], data.get('contact', '')))
                 
-                self.conn.commit()
+                self._commit()
                 self.load_data()
                 QMessageBox.information(self, "Success", "Record added successfully!")
             except sqlite3.IntegrityError:
@@ -6585,7 +7356,7 @@ class JPHNManagementSystem(QMainWindow):
                           data['district_join_date'], duration, data['institution_join_date'],
                           data['weightage'], data['weightage_details'], data.get('contact', ''), pen))
                 
-                self.conn.commit()
+                self._commit()
                 self.load_data()
                 QMessageBox.information(self, "Success", "Record updated successfully!")
             except sqlite3.IntegrityError:
@@ -6619,14 +7390,11 @@ class JPHNManagementSystem(QMainWindow):
         
         if reply == QMessageBox.Yes:
             try:
-                deleted_count = 0
-                for index in selected_rows:
-                    row = index.row()
-                    pen = self.table.item(row, 0).text()  # PEN is at column 0
-                    self.cursor.execute('DELETE FROM jphn WHERE pen = ?', (pen,))
-                    deleted_count += 1
+                pens = [(self.table.item(index.row(), 0).text(),)  # PEN is at column 0
+                        for index in selected_rows]
+                self._bulk_execute('DELETE FROM jphn WHERE pen = ?', pens)
+                deleted_count = len(pens)
                 
-                self.conn.commit()
                 self.load_data()
                 QMessageBox.information(self, "Success", f"{deleted_count} record(s) deleted successfully!")
             except Exception as e:
@@ -6647,15 +7415,12 @@ class JPHNManagementSystem(QMainWindow):
         
         if reply == QMessageBox.Yes:
             try:
-                deleted_count = 0
                 # Get PENs from selected rows (column 2 is PEN)
-                for index in selected_rows:
-                    row = index.row()
-                    pen = self.transfer_table.item(row, 2).text()
-                    self.cursor.execute('DELETE FROM jphn WHERE pen = ?', (pen,))
-                    deleted_count += 1
+                pens = [(self.transfer_table.item(index.row(), 2).text(),)
+                        for index in selected_rows]
+                self._bulk_execute('DELETE FROM jphn WHERE pen = ?', pens)
+                deleted_count = len(pens)
                 
-                self.conn.commit()
                 self.load_data()  # This also refreshes transfer list
                 QMessageBox.information(self, "Success", f"{deleted_count} record(s) deleted successfully!")
             except Exception as e:
@@ -6724,7 +7489,7 @@ class JPHNManagementSystem(QMainWindow):
             elif file_path.lower().endswith(('.xlsx', '.xls')):
                 # Read Excel file using openpyxl - ALL SHEETS
                 try:
-                    import openpyxl
+                    openpyxl = _get_openpyxl()
                 except ImportError:
                     QMessageBox.critical(
                         self, 
@@ -6784,6 +7549,7 @@ class JPHNManagementSystem(QMainWindow):
             success_count = 0
             error_count = 0
             errors = []
+            import_rows = []
             
             progress = QProgressDialog("Importing records...", "Cancel", 0, len(data), self)
             progress.setWindowModality(Qt.WindowModal)
@@ -6837,31 +7603,9 @@ class JPHNManagementSystem(QMainWindow):
                     # Calculate duration from district_join_date (not imported)
                     duration = self.calculate_duration(district_join_date)
                     
-                    # Check if PEN already exists
-                    self.cursor.execute('SELECT pen FROM jphn WHERE pen = ?', (pen,))
-                    existing = self.cursor.fetchone()
-                    
-                    if existing:
-                        # Update existing record (preserve existing weightage data)
-                        self.cursor.execute('''
-                            UPDATE jphn SET name=?, designation=?, institution=?, district=?,
-                                           entry_date=?, retirement_date=?, district_join_date=?,
-                                           duration_days=?, contact=?
-                            WHERE pen=?
-                        ''', (name, designation, institution, district,
-                              entry_date, retirement_date, district_join_date,
-                              duration, contact, pen))
-                    else:
-                        # Insert new record
-                        self.cursor.execute('''
-                            INSERT INTO jphn (pen, name, designation, institution, district,
-                                             entry_date, retirement_date, district_join_date,
-                                             duration_days, contact)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (pen, name, designation, institution, district,
-                              entry_date, retirement_date, district_join_date,
-                              duration, contact))
-                    
+                    import_rows.append((pen, name, designation, institution, district,
+                                        entry_date, retirement_date, district_join_date,
+                                        duration, contact))
                     success_count += 1
                     
                 except Exception as e:
@@ -6869,7 +7613,21 @@ class JPHNManagementSystem(QMainWindow):
                     error_count += 1
             
             progress.setValue(len(data))
-            self.conn.commit()
+            
+            # Insert new records and update existing ones in a single transaction
+            # (existing weightage data is preserved on update)
+            self._bulk_execute('''
+                INSERT INTO jphn (pen, name, designation, institution, district,
+                                 entry_date, retirement_date, district_join_date,
+                                 duration_days, contact)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(pen) DO UPDATE SET
+                    name=excluded.name, designation=excluded.designation,
+                    institution=excluded.institution, district=excluded.district,
+                    entry_date=excluded.entry_date, retirement_date=excluded.retirement_date,
+                    district_join_date=excluded.district_join_date,
+                    duration_days=excluded.duration_days, contact=excluded.contact
+            ''', import_rows)
             self.load_data()
             
             # Show result
@@ -7079,7 +7837,8 @@ class JPHNManagementSystem(QMainWindow):
     
     def closeEvent(self, event):
         """Clean up database connection on close"""
-        self.conn.close()
+        if self.conn:
+            self._close_database()
         event.accept()
 
 
@@ -7087,9 +7846,19 @@ def main():
     app = QApplication(sys.argv)
     
     # Set application icon
-    icon_path = resource_path("favicon.ico")
-    if os.path.exists(icon_path):
-        app.setWindowIcon(QIcon(icon_path))
+    app_icon = _get_app_icon()
+    if app_icon is not None:
+        app.setWindowIcon(app_icon)
+    
+    # Forget the cached screen geometry whenever the screen setup changes
+    for screen in app.screens():
+        screen.geometryChanged.connect(_invalidate_primary_geom)
+    app.screenAdded.connect(_watch_screen)
+    app.screenRemoved.connect(_invalidate_primary_geom)
+    app.primaryScreenChanged.connect(_invalidate_primary_geom)
+    
+    # Shared look for the startup dialogs, parsed once for the whole app
+    app.setStyleSheet(_COMMON_QSS)
     
     # Set default font
     try: